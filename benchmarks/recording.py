@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Echo Ses Kaydedici kayıt ve kaydetme yolu ölçümü.
+
+Ses donanımı gerekmez: kayıtlar sahte ses arka ucuyla (echo_fake_audio) hızlandırılmış zamanda üretilir.
+Her (format, süre) çifti yeni bir süreçte kaydedilir ve şunlar yazdırılır:
+geri çağrı aralıklarındaki sapma (jitter), aygıtta atlanan parçalar ve halka tampon taşmaları,
+en yüksek bellek kullanımı (RSS), durdurma/kaydetme süresi ve kaydedilen dosya oynatılırken
+ilk sesin çıkma süresi (PlaybackThread ile; PyQt5 yoksa ölçülmez).
+
+    python3 benchmarks/recording.py                                   # 1 dk / 1 sa / 4 sa, tüm formatlar
+    python3 benchmarks/recording.py --durations 60 --formats .WAV,.MP3 --speed 20
+    python3 benchmarks/recording.py --profile high_throughput --json
+    python3 benchmarks/recording.py --devices 4 --interleave --formats .FLAC   # dört aygıt aynı anda
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SHARE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                         "echo-voice-recorder-1.0.1", "usr", "share", "echo-voice-recorder")
+FORMATS = (".WAV", ".MP3", ".FLAC", ".OGG", ".AAC")
+DURATIONS = (60, 3600, 4 * 3600)
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def measure_first_sound(path, audio_engine, backend):
+    """Kaydı PlaybackThread ile oynatır ve ilk verinin sahte hoparlöre ulaşma süresini döndürür (ms)."""
+    try:
+        from PyQt5.QtCore import QCoreApplication
+    except ImportError:
+        return None
+    from echo_fake_audio import FakeOutputStream
+    app = QCoreApplication.instance() or QCoreApplication([])
+    spec = importlib.util.spec_from_file_location("echo_voice_recorder", os.path.join(SHARE_DIR, "echo-voice-recorder.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    playback_thread = module.PlaybackThread({'path': path}, audio_engine)
+    started = time.perf_counter()
+    playback_thread.start()
+    first_write = None
+    while first_write is None and time.perf_counter() - started < 30:
+        outputs = [stream for stream in backend.streams if isinstance(stream, FakeOutputStream)]
+        first_write = outputs[0].first_write_time if outputs else None
+        app.processEvents()
+        time.sleep(0.0005)
+    playback_thread.is_playing = False
+    playback_thread.wait()
+    return round((first_write - started) * 1000, 2) if first_write else None
+
+def run_single(args):
+    """Tek bir kaydı bu süreçte yapar ve ölçümleri JSON satırı olarak yazdırır."""
+    sys.path.insert(0, SHARE_DIR)
+    from echo_engine import CAPTURE_PROFILES, resolve_capture_profile, AudioEngine, RecordingSession, MultiDeviceSession, PeakCache
+    from echo_fake_audio import FakeAudioBackend, FakeInputStream
+
+    record_format, duration = args.single[0], float(args.single[1])
+    format, channels, rate, chunk = resolve_capture_profile(CAPTURE_PROFILES[args.profile])
+    backend = FakeAudioBackend(speed=args.speed, signal=args.signal)
+    audio_engine = AudioEngine(backend_factory=lambda: backend)
+    work_dir = tempfile.mkdtemp(prefix="echo-bench-")
+    try:
+        path = os.path.join(work_dir, "rec1" + record_format)
+        if args.devices > 1:
+            # Sahte mikrofon her aygıt için ayrı bir akışla açılır.
+            session = MultiDeviceSession(audio_engine, path, format, channels, rate, chunk, [0] * args.devices,
+                                         vad_mode=args.vad, interleave=args.interleave,
+                                         journal_dir=os.path.join(work_dir, "sessions"))
+        else:
+            session = RecordingSession(audio_engine, path, format, channels, rate, chunk, vad_mode=args.vad,
+                                       journal_dir=os.path.join(work_dir, "sessions"))
+        session.open()
+        session.start()
+        time.sleep(duration / args.speed)
+
+        stop_started = time.perf_counter()
+        session.stop()
+        session.finalize(PeakCache(os.path.join(work_dir, "peaks")), os.path.join(work_dir, "skipped"))
+        stop_save_ms = (time.perf_counter() - stop_started) * 1000
+
+        stream = next(stream for stream in backend.streams if isinstance(stream, FakeInputStream))
+        period = chunk / float(rate) / args.speed
+        times = stream.callback_times
+        jitter = [abs(later - earlier - period) * 1000 for earlier, later in zip(times, times[1:])]
+        overruns, lost_seconds = session.lost_audio()
+        result = {
+            "format": record_format,
+            "devices": args.devices,
+            "duration_s": duration,
+            "callbacks": len(times),
+            "period_ms": round(period * 1000, 3),
+            "jitter_p50_ms": round(percentile(jitter, 0.5), 3),
+            "jitter_p99_ms": round(percentile(jitter, 0.99), 3),
+            "jitter_max_ms": round(max(jitter, default=0.0), 3),
+            "dropped_chunks": stream.dropped_chunks,
+            "overruns": overruns,
+            "lost_s": round(lost_seconds, 3),
+            "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0, 1),
+            "encoder_rss_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024.0, 1),
+            "stop_save_ms": round(stop_save_ms, 1),
+            "file_mb": round(sum(os.path.getsize(output) for output in session.output_paths) / 1048576.0, 1),
+            "first_sound_ms": measure_first_sound(session.output_paths[0], audio_engine, backend),
+        }
+        audio_engine.terminate()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    print(json.dumps(result))
+
+def run_child(args, record_format, duration):
+    command = [sys.executable, os.path.abspath(__file__), "--single", record_format, str(duration),
+               "--speed", str(args.speed), "--profile", args.profile, "--signal", args.signal, "--vad", args.vad,
+               "--devices", str(args.devices)] + (["--interleave"] if args.interleave else [])
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    result = subprocess.run(command, capture_output=True, text=True, env=env, timeout=duration / args.speed + 600)
+    for line in result.stdout.splitlines():
+        if line.startswith("{") and "stop_save_ms" in line:
+            return json.loads(line)
+    raise RuntimeError(f"Ölçüm çıktısı bulunamadı:\n{result.stdout}\n{result.stderr}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--formats", default=",".join(FORMATS), help="Virgülle ayrılmış kayıt formatları")
+    parser.add_argument("--durations", default=",".join(str(duration) for duration in DURATIONS),
+                        help="Virgülle ayrılmış kayıt süreleri (saniye)")
+    parser.add_argument("--speed", type=float, default=100.0, help="Zaman hızlandırma katsayısı (1 = gerçek zaman)")
+    parser.add_argument("--profile", default="standard", help="Kayıt profili (low_latency, standard, high_throughput)")
+    parser.add_argument("--signal", default="speech", help="Sahte mikrofonun sinyali (sine, speech, noise, silence)")
+    parser.add_argument("--vad", default="off", help="Sessizlik algılama kipi (off, skip, auto_pause)")
+    parser.add_argument("--devices", type=int, default=1, help="Aynı anda kaydedilecek aygıt sayısı")
+    parser.add_argument("--interleave", action="store_true", help="Çoklu aygıt kaydında parçaları tek dosyada da birleştir")
+    parser.add_argument("--json", action="store_true", help="Tüm ölçümleri JSON olarak yazdır")
+    parser.add_argument("--single", nargs=2, metavar=("FORMAT", "SÜRE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        run_single(args)
+        return
+
+    results = []
+    for duration in (float(value) for value in args.durations.split(",")):
+        for record_format in args.formats.split(","):
+            results.append(run_child(args, record_format, duration))
+            if not args.json:
+                print(f"{record_format} {duration:.0f} s tamamlandı", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    columns = ("format", "duration_s", "jitter_p99_ms", "dropped_chunks", "overruns", "peak_rss_mb",
+               "encoder_rss_mb", "stop_save_ms", "first_sound_ms")
+    print("".join(f"{column:>16}" for column in columns))
+    for result in results:
+        print("".join(f"{str(result[column]):>16}" for column in columns))
+
+if __name__ == '__main__':
+    main()
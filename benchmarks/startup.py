@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Echo Ses Kaydedici açılış süresi ölçümü.
+
+Uygulamayı her seferinde yeni bir süreçte --startup-benchmark ile başlatır ve
+içe aktarma, pencerenin oluşturulması, ilk çizim (pencerenin ekrana gelişi) ile
+ertelenen kaynakların yüklenmesi sürelerini toplar. Sonuç olarak her aşamanın
+en küçük ve ortanca değerleri yazdırılır; gerilemeler böylece fark edilir.
+
+    python3 benchmarks/startup.py --runs 10
+    QT_QPA_PLATFORM=offscreen python3 benchmarks/startup.py   # ekransız makinelerde
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                          "echo-voice-recorder-1.0.1", "usr", "share", "echo-voice-recorder", "echo-voice-recorder.py")
+
+def run_once(script):
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, script, "--startup-benchmark"], capture_output=True, text=True, timeout=60)
+    wall_ms = (time.perf_counter() - started) * 1000
+    for line in result.stdout.splitlines():
+        if line.startswith("{") and "first_paint_ms" in line:
+            marks = json.loads(line)
+            marks["process_wall_ms"] = round(wall_ms, 1)
+            return marks
+    raise RuntimeError(f"Ölçüm çıktısı bulunamadı:\n{result.stdout}\n{result.stderr}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--script", default=APP_SCRIPT)
+    parser.add_argument("--json", action="store_true", help="Tüm ölçümleri JSON olarak yazdır")
+    args = parser.parse_args()
+
+    # İlk çalıştırma disk önbelleğini ısıtır ve sonuçlara katılmaz.
+    run_once(args.script)
+    runs = [run_once(args.script) for _ in range(args.runs)]
+
+    if args.json:
+        print(json.dumps(runs, indent=2))
+        return
+    print(f"{'aşama':<22}{'en küçük':>12}{'ortanca':>12}")
+    for key in runs[0]:
+        values = [run[key] for run in runs]
+        print(f"{key:<22}{min(values):>10.1f}ms{statistics.median(values):>10.1f}ms")
+
+if __name__ == '__main__':
+    main()
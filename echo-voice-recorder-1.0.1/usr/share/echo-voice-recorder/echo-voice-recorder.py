@@ -1,20 +1,31 @@
 #!/usr/bin/env python3
 
+import time
+STARTUP_TIME = time.perf_counter()  # Açılış ölçümü (--startup-benchmark) için başlangıç noktası
+
 import sys
 import os
-import pyaudio
-import wave
-import time
+import functools
 import shutil
 import json
-from PyQt5.QtWidgets import QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QTableWidget, QTableWidgetItem, QHeaderView, QLabel, QHBoxLayout, QAction, QMenu, QMessageBox, QAbstractItemView, QFileDialog, QInputDialog
-from PyQt5.QtGui import QMovie, QPixmap, QFont, QIcon, QFontDatabase
-from PyQt5.QtCore import QSize, Qt, QDir, QEvent, QFileInfo, QThread, pyqtSignal
-from pydub import AudioSegment
-
+import logging
+import numpy as np
+from PyQt5.QtWidgets import QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QTableView, QHeaderView, QLineEdit, QLabel, QHBoxLayout, QAction, QMessageBox, QAbstractItemView, QFileDialog, QInputDialog, QSlider, QProgressDialog, QPlainTextEdit, QDialog, QListWidget, QListWidgetItem, QCheckBox, QDialogButtonBox
+from PyQt5.QtGui import QMovie, QPixmap, QFont, QIcon, QFontDatabase, QPainter, QColor, QPen
+from PyQt5.QtCore import Qt, QEvent, QThread, QTimer, QLineF, QObject, QFileSystemWatcher, pyqtSignal, QAbstractTableModel, QModelIndex
+from echo_engine import (CAPTURE_PROFILES, BIT_DEPTH_FORMATS, resolve_capture_profile, PeakBuilder, PeakPyramid, PeakCache,
+                         open_audio_reader, format_duration, RecordingLibrary, AudioEngine, list_devices, find_input_device,
+                         find_monitor_device, RecordingSession, MultiDeviceSession, SystemCaptureError, BatchTranscoder,
+                         conversion_destination, find_ffmpeg, recover_sessions)
+from echo_metrics import LatencyHistogram, StatusFlagCounter, write_metrics_file, configure_logging
+
+log = logging.getLogger("echo.gui")
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """
     Geliştirme ortamı ve Linux sistemi kurulumu için kaynak dosyalarının yolunu belirler.
+    Sonuç önbelleğe alınır; aynı yol için dosya sistemi yalnızca bir kez yoklanır.
     """
     # 1. Linux sistemi için standart /usr/share dizinini kontrol et.
     #    Bu, program .deb paketi olarak kurulduğunda kullanılacak yoldur.
@@ -30,37 +41,767 @@ def resource_path(relative_path):
 
     return None
 
+class FinalizeThread(QThread):
+    """
+    Durdurulan bir kaydın yazıcısını kapatır ve gerekirse dönüştürür.
+    Arayüz iş parçacığını bloklamaz; bu sırada yeni bir kayda başlanabilir.
+    """
+    progress = pyqtSignal(int)
+    saved = pyqtSignal(str)
+    discarded = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, session, peak_cache=None, skip_index_dir=None, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self.full_path = session.full_path
+        self.peak_cache = peak_cache
+        self.skip_index_dir = skip_index_dir
+
+    def run(self):
+        try:
+            if self.session.finalize(self.peak_cache, self.skip_index_dir, progress=self.progress.emit):
+                for path in self.session.output_paths:
+                    self.saved.emit(path)
+            else:
+                self.discarded.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+
+class BatchConvertThread(QThread):
+    """
+    Seçilen kayıtları arka planda başka bir biçime dönüştürür.
+    Biten her dosya için ilerleme bildirilir; dönüşen dosyaların bilgileri de burada toplanır
+    ki tabloya eklenirken arayüz iş parçacığı dosya okumakla uğraşmasın.
+    """
+    progress = pyqtSignal(int)
+    converted = pyqtSignal(str, dict)
+    failed = pyqtSignal(str, str)
+
+    def __init__(self, transcoder, library, parent=None):
+        super().__init__(parent)
+        self.transcoder = transcoder
+        self.library = library
+        self.done = 0
+
+    def run(self):
+        self.transcoder.run(self._on_result)
+
+    def _on_result(self, source_path, destination_path, error):
+        self.done += 1
+        if error:
+            self.failed.emit(os.path.basename(source_path), error)
+        elif destination_path:
+            try:
+                self.converted.emit(destination_path, self.library.build_entry(destination_path))
+            except OSError as e:
+                self.failed.emit(os.path.basename(source_path), str(e))
+        self.progress.emit(self.done)
+
+class RecoveryThread(QThread):
+    """
+    Önceki çalışmada çökme ya da elektrik kesintisi nedeniyle yarım kalan kayıtları kurtarır.
+    Dosya bilgilerinin toplanması açılışı bekletmesin diye arka planda çalışır.
+    """
+    recovered = pyqtSignal(list)
+
+    def __init__(self, journal_dir, library, parent=None):
+        super().__init__(parent)
+        self.journal_dir = journal_dir
+        self.library = library
+
+    def run(self):
+        records = []
+        for path in recover_sessions(self.journal_dir):
+            try:
+                records.append((path, self.library.build_entry(path)))
+            except OSError as e:
+                log.warning("Kurtarılan kaydın bilgileri okunamadı: %s", e, extra={"path": path})
+        if records:
+            self.recovered.emit(records)
+
+class LibraryScanThread(QThread):
+    """
+    Dizinde olmayan ya da değişmiş dosyaların bilgilerini arka planda toplar.
+    Sonuçlar tabloya toplu eklenebilmesi için gruplar halinde gönderilir.
+    """
+    entries_ready = pyqtSignal(list)
+
+    BATCH_SIZE = 100
+    BATCH_INTERVAL = 0.25
+
+    def __init__(self, library, names, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.names = names
+        self.is_running = True
+
+    def run(self):
+        batch = []
+        last_emit = time.monotonic()
+        for name in self.names:
+            if not self.is_running:
+                break
+            path = os.path.join(self.library.record_path, name)
+            try:
+                batch.append((name, self.library.build_entry(path)))
+            except OSError:
+                continue
+            if len(batch) >= self.BATCH_SIZE or time.monotonic() - last_emit >= self.BATCH_INTERVAL:
+                self.entries_ready.emit(batch)
+                batch = []
+                last_emit = time.monotonic()
+        if batch:
+            self.entries_ready.emit(batch)
+
+class RecordingsTableModel(QAbstractTableModel):
+    """
+    Kayıt listesinin model/görünüm karşılığı. Hücre başına nesne oluşturulmaz;
+    satırlar görünüm kaydırıldıkça (canFetchMore/fetchMore) gruplar halinde açılır.
+    Sıralama ve süzme de burada, bellekteki kütüphane bilgileri üzerinde yapılır; yalnızca sonucun
+    görünen kısmı satır olarak açılır. Böylece bellek ve çizim maliyeti kütüphanenin boyutundan bağımsız kalır.
+    """
+    FETCH_BATCH_SIZE = 256
+    COLUMN_COUNT = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []         # Eklenme sırasıyla tüm kayıtlar
+        self._entries = {}
+        self._known = set()
+        self._view = []          # Süzülmüş ve sıralanmış kayıtlar; ilk _loaded tanesi satır olarak açılmıştır
+        self._loaded = 0
+        self._filter = ""
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._headers = [""] * self.COLUMN_COUNT
+
+    def set_headers(self, headers):
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def _sort_key(self, name, column):
+        """Sıralama, görüntülenen metin yerine ham değerlere göre yapılır."""
+        entry = self._entries.get(name)
+        if column == 0:
+            return name.lower()
+        if entry is None:
+            return -1 if column in (1, 2) else os.path.splitext(name)[1].upper()
+        if column == 1:
+            return entry.get("duration") if entry.get("duration") is not None else -1
+        if column == 2:
+            return entry["size"]
+        return entry["format"]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.UserRole):
+            return None
+        name = self._view[index.row()]
+        entry = self._entries.get(name)
+        column = index.column()
+
+        if role == Qt.UserRole:
+            return self._sort_key(name, column)
+
+        if column == 0:
+            return name
+        if column == 3:
+            return entry["format"] if entry else os.path.splitext(name)[1].upper()
+        if entry is None:
+            # Bilgisi henüz toplanmamış kayıtlar için yer tutucu gösterilir.
+            return "..." if column == 1 else ""
+        if column == 1:
+            return format_duration(entry.get("duration"))
+        return f"{round(entry['size'] / 1024, 2)} KB"
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._view)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH_SIZE, len(self._view) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def _matches(self, name):
+        return self._filter in name.lower()
+
+    def _ordered(self, names):
+        if self._sort_column < 0:
+            return names
+        column = self._sort_column
+        return sorted(names, key=lambda name: self._sort_key(name, column), reverse=self._sort_order == Qt.DescendingOrder)
+
+    def _relayout(self):
+        """
+        Görünümü yeniden sıralar. Seçim ve geçerli satır kayıt adına göre yeni konumlarına taşınır;
+        yeni konum henüz açılmamışsa satırlar yalnızca o konuma kadar açılır.
+        """
+        ordered = self._ordered(self._view)
+        persistent_names = {self._view[index.row()] for index in self.persistentIndexList()}
+        if persistent_names:
+            needed = max(row for row, name in enumerate(ordered) if name in persistent_names) + 1
+            if needed > self._loaded:
+                self.beginInsertRows(QModelIndex(), self._loaded, needed - 1)
+                self._loaded = needed
+                self.endInsertRows()
+
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_names = [self._view[index.row()] for index in old_indexes]
+        self._view = ordered
+        positions = {name: row for row, name in enumerate(self._view[:self._loaded])}
+        self.changePersistentIndexList(old_indexes, [self.index(positions[name], index.column()) for name, index in zip(old_names, old_indexes)])
+        self.layoutChanged.emit()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Görünüm başlığa tıklandığında çağırır; sıralama bellekteki bilgilerle yapılır, tüm satırlar açılmaz."""
+        self._sort_column = column
+        self._sort_order = order
+        self._relayout()
+
+    def set_filter(self, text):
+        """Kayıt adında geçen metne göre süzer; eşleşenlerin yalnızca ilk grubu satır olarak açılır."""
+        self.beginResetModel()
+        self._filter = text.lower()
+        self._view = self._ordered([name for name in self._names if self._matches(name)])
+        self._loaded = min(self.FETCH_BATCH_SIZE, len(self._view))
+        self.endResetModel()
+
+    def set_records(self, records):
+        """(ad, bilgi) listesini toplu olarak ekler ya da günceller."""
+        fully_loaded = self._loaded == len(self._view)
+        added = []
+        updated = set()
+        for name, entry in records:
+            self._entries[name] = entry
+            if name in self._known:
+                updated.add(name)
+                continue
+            self._known.add(name)
+            self._names.append(name)
+            if self._matches(name):
+                added.append(name)
+        self._view.extend(added)
+
+        if self._sort_column >= 0 and (added or (updated and self._sort_column > 0)):
+            # Yeni ya da değişen kayıtlar sıralamadaki yerlerine taşınır.
+            self._relayout()
+        changed_rows = [row for row, name in enumerate(self._view[:self._loaded]) if name in updated]
+        if changed_rows:
+            self.dataChanged.emit(self.index(min(changed_rows), 0),
+                                  self.index(max(changed_rows), self.COLUMN_COUNT - 1))
+        # Tüm satırlar zaten görünüyorsa yeni eklenenlerin ilk grubu hemen açılır.
+        if fully_loaded:
+            self.fetchMore()
+
+    def record_name(self, row):
+        return self._view[row]
+
+class PeakComputeThread(QThread):
+    """Önbellekte dalga formu olmayan bir dosyanın tepe piramidini bir kez okuyarak oluşturur."""
+    ready = pyqtSignal(str, object)
+
+    def __init__(self, path, peak_cache, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.peak_cache = peak_cache
+        self.is_running = True
+
+    def run(self):
+        try:
+            with open_audio_reader(self.path) as reader:
+                builder = PeakBuilder(reader.getsampwidth(), reader.getnchannels(), reader.getframerate())
+                while self.is_running:
+                    data = reader.readframes(65536)
+                    if not data:
+                        break
+                    builder(data)
+                data = None
+            if not self.is_running:
+                return
+            pyramid = builder.build()
+            if pyramid:
+                self.peak_cache.save(self.path, pyramid)
+            self.ready.emit(self.path, pyramid)
+        except Exception as e:
+            log.warning("Dalga formu oluşturulamadı: %s", e, extra={"path": self.path})
+
+class DeviceScanThread(QThread):
+    """
+    Ses aygıtlarını ve yeteneklerini arka planda listeler. reset=True ile önce PortAudio yeniden başlatılır;
+    bu yavaş olabildiğinden arayüz iş parçacığında yapılmaz.
+    """
+    devices_ready = pyqtSignal(list)
+
+    def __init__(self, audio_engine, reset=False, parent=None):
+        super().__init__(parent)
+        self.audio_engine = audio_engine
+        self.reset = reset
+
+    def run(self):
+        devices = []
+        try:
+            if self.reset:
+                self.audio_engine.reset()
+            devices = list_devices(self.audio_engine.pa)
+        except Exception as e:
+            log.error("Ses aygıtları listelenirken hata oluştu: %s", e)
+        self.devices_ready.emit(devices)
+
+class DeviceRegistry(QObject):
+    """
+    Ses aygıtlarının önbelleğe alınmış listesi. Aygıtlar bir kez arka planda taranır;
+    /dev/snd altında bir aygıt takılıp çıkarıldığında ya da istendiğinde liste yenilenir.
+    Böylece kayda başlarken aygıt listelemesi yapılmaz. İlk tarama bitene ve PortAudio yeniden başlatılırken
+    ready False olur; bu sırada kayda başlanmaz.
+    """
+    devices_changed = pyqtSignal()
+    ready_changed = pyqtSignal(bool)
+
+    HOTPLUG_DELAY_MS = 1000  # Bir takma işlemi art arda birçok değişiklik üretir; hepsi tek taramada toplanır.
+    HOTPLUG_RETRY_MS = 2000
+
+    def __init__(self, audio_engine, is_busy=lambda: False, parent=None):
+        super().__init__(parent)
+        self.audio_engine = audio_engine
+        self.is_busy = is_busy
+        self.devices = []
+        self.scan_thread = None
+        self.ready = False
+        self._rescan_requested = False
+        self._reset_requested = False
+
+        self.hotplug_timer = QTimer(self)
+        self.hotplug_timer.setSingleShot(True)
+        self.hotplug_timer.setInterval(self.HOTPLUG_DELAY_MS)
+        self.hotplug_timer.timeout.connect(self._on_hotplug)
+        self.watcher = QFileSystemWatcher(self)
+        if os.path.isdir("/dev/snd"):
+            self.watcher.addPath("/dev/snd")
+        self.watcher.directoryChanged.connect(lambda path: self.hotplug_timer.start())
+
+    def refresh(self, reset=False):
+        """
+        Aygıtları arka planda yeniden tarar; reset=True ile önce PortAudio yeniden başlatılır.
+        Tarama sürüyorsa bittiğinde bir kez daha taranır.
+        """
+        if self.scan_thread and self.scan_thread.isRunning():
+            self._rescan_requested = True
+            self._reset_requested = self._reset_requested or reset
+            return
+        if reset:
+            self._set_ready(False)
+        self.scan_thread = DeviceScanThread(self.audio_engine, reset=reset)
+        self.scan_thread.devices_ready.connect(self._on_devices_ready)
+        self.scan_thread.finished.connect(self._on_scan_finished)
+        self.scan_thread.start()
+
+    def _set_ready(self, ready):
+        if ready != self.ready:
+            self.ready = ready
+            self.ready_changed.emit(ready)
+
+    def _on_hotplug(self):
+        # Akışlar açıkken PortAudio yeniden başlatılamaz; kayıt ya da oynatma bitince tekrar denenir.
+        if self.is_busy() or (self.scan_thread and self.scan_thread.isRunning()):
+            self.hotplug_timer.start(self.HOTPLUG_RETRY_MS)
+            return
+        # PortAudio aygıt listesini yalnızca başlatılırken okur; yeni takılan aygıtlar için yeniden başlatılır.
+        self.refresh(reset=True)
+
+    def _on_devices_ready(self, devices):
+        self.devices = devices
+        self.devices_changed.emit()
+
+    def _on_scan_finished(self):
+        if self._rescan_requested:
+            reset = self._reset_requested
+            self._rescan_requested = False
+            self._reset_requested = False
+            self.refresh(reset=reset)
+        if not (self.scan_thread.isRunning() and self.scan_thread.reset):
+            self._set_ready(True)
+
+    def wait(self):
+        if self.scan_thread and self.scan_thread.isRunning():
+            self.scan_thread.wait()
+
+    def input_devices(self):
+        return [device for device in self.devices if device["max_input_channels"] > 0]
+
+    def find_input(self, name):
+        return find_input_device(self.devices, name)
+
+    def monitor_device(self):
+        return find_monitor_device(self.devices)
+
 class PlaybackThread(QThread):
     finished = pyqtSignal()
     error = pyqtSignal(str)
+    position_changed = pyqtSignal(float, float)
+
+    POSITION_UPDATE_INTERVAL = 0.1
 
-    def __init__(self, audio_data, parent=None):
+    def __init__(self, audio_data, audio_engine, parent=None):
         super().__init__(parent)
         self.audio_data = audio_data
-        self.p = pyaudio.PyAudio()
+        self.audio_engine = audio_engine
         self.is_playing = True
+        self.rate = 0
+        self.total_frames = 0
+        self.position_frames = 0
+        self._seek_request = None
+        # Ölçümler: çıkışa yazma süreleri, boşalmalar ve oynatma isteğinden ilk sese kadar geçen süre.
+        self.write_times = LatencyHistogram()
+        self.status_flags = StatusFlagCounter()
+        self.first_sound_ms = None
+
+    def position(self):
+        """Geçerli oynatma konumunu saniye cinsinden döndürür."""
+        return self.position_frames / self.rate if self.rate else 0.0
+
+    def duration(self):
+        """Kaydın toplam süresini saniye cinsinden döndürür; bilinmiyorsa 0."""
+        return self.total_frames / self.rate if self.rate else 0.0
+
+    def seek(self, seconds):
+        """Oynatmayı verilen saniyeye taşır. Herhangi bir iş parçacığından çağrılabilir."""
+        self._seek_request = max(0.0, seconds)
+
+    def metrics_snapshot(self):
+        return {"path": self.audio_data['path'],
+                "first_sound_ms": self.first_sound_ms,
+                "writes": self.write_times.snapshot(),
+                "status_flags": self.status_flags.snapshot()}
 
     def run(self):
+        started = time.perf_counter()
         try:
-            with wave.open(self.audio_data['path'], 'rb') as wf:
-                stream = self.p.open(format=self.p.get_format_from_width(wf.getsampwidth()),
-                                     channels=wf.getnchannels(),
-                                     rate=wf.getframerate(),
-                                     output=True)
-
-                chunk_size = 1024
-                data = wf.readframes(chunk_size)
-                while data and self.is_playing:
-                    stream.write(data)
-                    data = wf.readframes(chunk_size)
-
-                stream.stop_stream()
-                stream.close()
+            with open_audio_reader(self.audio_data['path']) as wf:
+                stream_format = self.audio_engine.get_format_from_width(wf.getsampwidth())
+                channels = wf.getnchannels()
+                self.rate = wf.getframerate()
+                self.total_frames = wf.getnframes()
+                stream = self.audio_engine.acquire_output_stream(stream_format, channels, self.rate)
+
+                try:
+                    chunk_size = 1024
+                    last_update = 0.0
+                    while self.is_playing:
+                        seek_request = self._seek_request
+                        if seek_request is not None:
+                            self._seek_request = None
+                            wf.setpos(seek_request * self.rate)
+
+                        data = wf.readframes(chunk_size)
+                        if not data:
+                            break
+                        write_started = time.perf_counter()
+                        if self.first_sound_ms is None:
+                            self.first_sound_ms = round((write_started - started) * 1000, 2)
+                        if self.audio_engine.write_output(stream, data):
+                            self.status_flags.add("output_underflow")
+                        self.write_times.observe(time.perf_counter() - write_started)
+                        self.position_frames = wf.tell()
+
+                        now = time.monotonic()
+                        if now - last_update >= self.POSITION_UPDATE_INTERVAL:
+                            last_update = now
+                            self.position_changed.emit(self.position(), self.duration())
+                    data = None
+                finally:
+                    self.audio_engine.release_output_stream(stream, stream_format, channels, self.rate)
             self.finished.emit()
         except Exception as e:
             self.error.emit(f"Oynatma sırasında bir hata oluştu: {e}")
 
+class StatsPanel(QWidget):
+    """
+    Kayıt ve oynatma ölçümlerini gösteren isteğe bağlı araç penceresi.
+    metrics.json ile aynı anahtarları kullanır; yalnızca görünürken güncellenir.
+    """
+    def __init__(self, title, parent=None):
+        super().__init__(parent, Qt.Tool)
+        self.setWindowTitle(title)
+        self.resize(360, 420)
+        self.text = QPlainTextEdit(self)
+        self.text.setReadOnly(True)
+        self.text.setFont(QFont("monospace", 8))
+        self.text.setStyleSheet("background-color: #2D2D2D; color: white; border: none;")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.text)
+
+    def show_metrics(self, metrics):
+        lines = []
+        self._format(metrics, 0, lines)
+        self.text.setPlainText("\n".join(lines))
+
+    def _format(self, value, depth, lines):
+        for key, item in value.items():
+            if isinstance(item, dict):
+                lines.append(f"{'  ' * depth}{key}:")
+                self._format(item, depth + 1, lines)
+            elif item is not None:
+                lines.append(f"{'  ' * depth}{key}: {item}")
+
+class MultiDeviceDialog(QDialog):
+    """Aynı anda kaydedilecek giriş aygıtlarını ve parçaların tek dosyada birleştirilip birleştirilmeyeceğini seçtirir."""
+    def __init__(self, translations, names, selected, interleave, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(translations.get("action_multi_device", "Çoklu Aygıt Kaydı..."))
+        self.device_list = QListWidget(self)
+        for name in names:
+            item = QListWidgetItem(name, self.device_list)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if name in selected else Qt.Unchecked)
+        self.interleave_box = QCheckBox(translations.get("option_interleave_tracks", "Parçaları tek bir çok kanallı dosyada da birleştir"), self)
+        self.interleave_box.setChecked(interleave)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(translations.get("info_select_multi_devices", "Aynı anda kaydedilecek giriş aygıtlarını seçin (en az iki):"), self))
+        layout.addWidget(self.device_list)
+        layout.addWidget(self.interleave_box)
+        layout.addWidget(buttons)
+
+    def selected_names(self):
+        return [self.device_list.item(row).text() for row in range(self.device_list.count())
+                if self.device_list.item(row).checkState() == Qt.Checked]
+
+class LanguageCatalog:
+    """
+    Dil dosyalarını önbelleğe alır. Dillerin görünen adları ilk istendiğinde bir kez taranır ve
+    okunan her dil bellekte kalır; böylece dil değiştirmek dosya okumadan, uygulamayı yeniden başlatmadan yapılır.
+    """
+    def __init__(self, languages_dir):
+        self.languages_dir = languages_dir
+        self._translations = {}
+        self._names = None
+
+    def translations(self, code):
+        """Dilin çeviri sözlüğünü döndürür; dosya yoksa ya da bozuksa boş sözlük döner."""
+        if code not in self._translations:
+            lang_file_path = os.path.join(self.languages_dir, f"{code}.json") if self.languages_dir else None
+            try:
+                if not lang_file_path or not os.path.exists(lang_file_path):
+                    raise FileNotFoundError(f"'{lang_file_path}' dosyası bulunamadı.")
+                with open(lang_file_path, 'r', encoding='utf-8') as f:
+                    self._translations[code] = json.load(f)
+            except (IOError, json.JSONDecodeError, FileNotFoundError) as e:
+                log.warning("Çeviri dosyası yüklenirken hata oluştu: %s. Varsayılan dile geçiliyor.", e)
+                return {}
+        return self._translations[code]
+
+    def names(self):
+        """Görünen ad → dil kodu sözlüğünü döndürür."""
+        if self._names is None:
+            self._names = {}
+            filenames = sorted(os.listdir(self.languages_dir)) if self.languages_dir else []
+            for filename in filenames:
+                if filename.endswith('.json'):
+                    lang_code = filename[:-len('.json')]
+                    data = self.translations(lang_code)
+                    if data:
+                        self._names[data.get("language_name", lang_code.upper())] = lang_code
+        return dict(self._names)
+
+class AssetCache:
+    """
+    Simgeleri, GIF animasyonlarını ve buton stil sayfalarını bir kez yükler.
+    Fareyle üzerine gelme ya da durum değişikliklerinde dosya okunmaz; önbellekteki nesneye geçilir.
+    """
+    def __init__(self):
+        self._pixmaps = {}
+        self._movies = {}
+        self._styles = {}
+
+    def pixmap(self, relative_path):
+        pixmap = self._pixmaps.get(relative_path)
+        if pixmap is None:
+            path = resource_path(relative_path)
+            pixmap = QPixmap(path) if path else QPixmap()
+            self._pixmaps[relative_path] = pixmap
+        return pixmap
+
+    def movie(self, relative_path):
+        movie = self._movies.get(relative_path)
+        if movie is None:
+            path = resource_path(relative_path)
+            movie = QMovie(path) if path else QMovie()
+            movie.setCacheMode(QMovie.CacheAll)
+            self._movies[relative_path] = movie
+        return movie
+
+    def button_style(self, object_name, name):
+        """
+        Butonun tüm durumlarını tek stil sayfasında toplar. Açık/basılı durum 'active' özelliğiyle
+        seçildiğinden durum değiştiğinde stil sayfası yeniden oluşturulmaz ve ayrıştırılmaz.
+        """
+        key = (object_name, name)
+        style = self._styles.get(key)
+        if style is None:
+            style = f"""
+                QPushButton#{object_name} {{
+                    border-image: url({resource_path('icons/' + name + '_normal.png')}) 0 0 0 0 stretch stretch;
+                    border: none;
+                }}
+                QPushButton#{object_name}:hover {{
+                    border-image: url({resource_path('icons/' + name + '_cursor.png')}) 0 0 0 0 stretch stretch;
+                }}
+                QPushButton#{object_name}:pressed, QPushButton#{object_name}[active="true"] {{
+                    border-image: url({resource_path('icons/' + name + '_basık.png')}) 0 0 0 0 stretch stretch;
+                }}
+            """
+            self._styles[key] = style
+        return style
+
+class LevelMeter(QWidget):
+    """Ekran alanında RMS seviyesini çubuk, tepe seviyesini ise tutulan bir çizgi olarak gösterir."""
+    MIN_DB = -60.0
+    PEAK_HOLD_DECAY = 0.02
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rms_level = 0.0
+        self.peak_level = 0.0
+        self.clipped = False
+
+    @classmethod
+    def _to_fraction(cls, value):
+        if value <= 0:
+            return 0.0
+        db = 20.0 * np.log10(value)
+        return min(1.0, max(0.0, (db - cls.MIN_DB) / -cls.MIN_DB))
+
+    def set_levels(self, rms, peak):
+        self.rms_level = self._to_fraction(rms)
+        # Tepe çizgisi yavaşça düşer; kısa tepe değerleri de görülebilir.
+        self.peak_level = max(self._to_fraction(peak), self.peak_level - self.PEAK_HOLD_DECAY)
+        self.clipped = self.clipped or peak >= 0.999
+        self.update()
+
+    def reset(self):
+        self.rms_level = 0.0
+        self.peak_level = 0.0
+        self.clipped = False
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#4a493e"))
+        width = self.width()
+        height = self.height()
+
+        rms_width = int(width * self.rms_level)
+        if rms_width:
+            color = "#3a6e2f" if self.rms_level < 0.75 else ("#a08a1c" if self.rms_level < 0.9 else "#a8321f")
+            painter.fillRect(0, 0, rms_width, height, QColor(color))
+
+        peak_x = int((width - 2) * self.peak_level)
+        if self.peak_level > 0:
+            painter.fillRect(peak_x, 0, 2, height, QColor("#a8321f" if self.clipped else "#333333"))
+        painter.end()
+
+class WaveformView(QWidget):
+    """
+    Seçili kaydın dalga formunu önbellekteki tepe piramidinden çizer.
+    Yakınlaştırma oranına uygun seviye seçildiği için çizim maliyeti dosya uzunluğundan bağımsızdır.
+    Fare tekerleği yakınlaştırır, çift tıklama tüm kaydı gösterir.
+    """
+    ZOOM_STEP = 1.5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pyramid = None
+        self.view_start = 0.0
+        self.view_span = 0.0
+        self.position = None
+
+    def set_pyramid(self, pyramid):
+        self.pyramid = pyramid
+        self.view_start = 0.0
+        self.view_span = float(pyramid.block_count()) if pyramid else 0.0
+        self.position = None
+        self.update()
+
+    def set_position(self, seconds):
+        self.position = seconds
+        self.update()
+
+    def wheelEvent(self, event):
+        if not self.pyramid:
+            return
+        total = float(self.pyramid.block_count())
+        anchor = self.view_start + self.view_span * event.pos().x() / max(1, self.width())
+        factor = 1 / self.ZOOM_STEP if event.angleDelta().y() > 0 else self.ZOOM_STEP
+        span = min(total, max(float(self.width()), self.view_span * factor))
+        self.view_start = min(max(0.0, anchor - span * event.pos().x() / max(1, self.width())), total - span)
+        self.view_span = span
+        self.update()
+
+    def mouseDoubleClickEvent(self, event):
+        self.set_pyramid(self.pyramid)
+
+    def _column_peaks(self, width):
+        """Görünen aralık için her piksel sütununun en küçük/en büyük değerlerini döndürür."""
+        blocks_per_pixel = self.view_span / width
+        level = 0
+        while level + 1 < len(self.pyramid.levels) and PeakPyramid.LEVEL_FACTOR ** (level + 1) <= blocks_per_pixel:
+            level += 1
+        scale = PeakPyramid.LEVEL_FACTOR ** level
+        level_min, level_max = self.pyramid.levels[level]
+
+        start = int(self.view_start / scale)
+        end = min(len(level_min), max(start + 1, int(np.ceil((self.view_start + self.view_span) / scale))))
+        edges = np.linspace(start, end, width + 1).astype(np.int64)
+        edges = np.minimum(edges[:-1], end - 1)
+        return np.minimum.reduceat(level_min[:end], edges), np.maximum.reduceat(level_max[:end], edges)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#2D2D2D"))
+        width = self.width()
+        middle = self.height() / 2.0
+        if self.pyramid and self.pyramid.block_count() and width > 0:
+            column_min, column_max = self._column_peaks(width)
+            scale = middle / 127.0
+            painter.setPen(QPen(QColor("#8f8d76")))
+            painter.drawLines([QLineF(x, middle - float(high) * scale, x, middle - float(low) * scale)
+                               for x, (low, high) in enumerate(zip(column_min, column_max))])
+
+            if self.position is not None and self.pyramid.rate:
+                block = self.position * self.pyramid.rate / PeakPyramid.BLOCK_SIZE
+                x = (block - self.view_start) / self.view_span * width
+                if 0 <= x <= width:
+                    painter.setPen(QPen(QColor("#d8d6c0")))
+                    painter.drawLine(QLineF(x, 0, x, self.height()))
+        painter.end()
+
 class SoundRecorderApp(QMainWindow):
+    METER_UPDATE_RATE = 30
+    METRICS_FILE_INTERVAL = 5.0
+    RECORD_FORMATS = (".WAV", ".MP3", ".FLAC", ".OGG", ".AAC")
+
+    deferred_assets_loaded = pyqtSignal()
+
     def __init__(self):
         super().__init__()
 
@@ -68,40 +809,67 @@ class SoundRecorderApp(QMainWindow):
         self.record_path = os.path.expanduser("~")
         self.config_dir = os.path.join(os.path.expanduser("~"), ".EchoVoiceRecorder")
         self.config_file = os.path.join(self.config_dir, "userdata.json")
+        self.library_file = os.path.join(self.config_dir, "library.json")
+        self.peak_cache = PeakCache(os.path.join(self.config_dir, "peaks"))
+        self.skip_index_dir = os.path.join(self.config_dir, "skipped")
+        self.sessions_dir = os.path.join(self.config_dir, "sessions")
+        self.metrics_file = os.path.join(self.config_dir, "metrics.json")
         self.languages_dir = resource_path("languages")
+        self.language_catalog = LanguageCatalog(self.languages_dir)
 
         self.system_on = False
         self.mic_on = False
+        self.mic_gain = 1.0
+        self.system_gain = 1.0
+        self.vad_mode = "off"  # "off", "skip" (sessizliği atla) veya "auto_pause" (otomatik duraklat)
+        self.capture_profile = "standard"
+        self.custom_profile = dict(CAPTURE_PROFILES["standard"])
+        self.input_device_name = None  # None: sistemin varsayılan giriş aygıtı
+        self.multi_device_names = []  # İkiden fazla aygıt seçiliyse her biri kendi parçasına kaydedilir
+        self.interleave_devices = False
         self.record_format = ".WAV"
         self.current_language = "tr"
         self.translations = {}
+        # Dil değişince metni yenilenecek öğeler: (metni ayarlayan işlev, çeviri anahtarı, varsayılan metin)
+        self.translatable_texts = []
+        self.status_key = "status_ready"
+        self.status_args = {}
         
         self.load_settings()
         self.load_translations()
         
-        self.setWindowTitle(self.translations.get("window_title", "Echo Ses Kaydedici"))
-        self.setFixedSize(360, 360)
+        self._translate(self.setWindowTitle, "window_title", "Echo Ses Kaydedici")
+        self.setFixedSize(360, 477)
         self.setStyleSheet("background-color: #363636;")
-
-        icon_path = resource_path("icons/recicon.png")
-        if icon_path and os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        self.first_paint_time = None
+        self.assets = AssetCache()
 
         self.is_paused = False
+        self.auto_paused = False  # Duraklatma sessizlik algılayıcısından geldiyse True
         self.is_recording = False
         self.record_counter = 0
 
-        self.FORMAT = pyaudio.paInt16
-        self.CHANNELS = 1
-        self.RATE = 44100
-        self.CHUNK = 1024
-        self.frames = []
-        self.p = pyaudio.PyAudio()
-        self.stream = None
+        self._apply_capture_profile(self._profile_settings(self.capture_profile))
+        self.session = None
+        self.current_record_path = None
+        self.pending_record_paths = set()
+        self.finalize_threads = []
+        self.audio_engine = AudioEngine()
+        self.device_registry = DeviceRegistry(self.audio_engine, is_busy=lambda: self.is_recording or self._is_playing(), parent=self)
         
         self.start_time = None
         self.playback_thread = None
 
+        # Ölçümler: süren kayıt/oynatma ile son bitenlerin anlık görüntüleri.
+        self.stats_panel = None
+        self.last_recording_metrics = None
+        self.last_playback_metrics = None
+        self.last_metrics_write = 0.0
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.setInterval(1000)
+        self.metrics_timer.timeout.connect(self.update_metrics)
+        self.metrics_timer.start()
+
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
@@ -119,30 +887,25 @@ class SoundRecorderApp(QMainWindow):
         top_buttons_and_gif_layout.addLayout(left_buttons_layout)
         
         self.display_container = QWidget()
-        self.display_container.setFixedSize(285, 60)
+        self.display_container.setFixedSize(285, 68)
         self.display_container.setStyleSheet("background-color: #6a695a; border: 2px solid #585858;")
         
         self.status_label = QLabel(self.display_container)
         self.status_label.setAlignment(Qt.AlignCenter)
         self.status_label.setStyleSheet("background-color: transparent; color: #333333;")
 
-        font_path = resource_path("fonts/AlphaSmart3000.ttf")
-        if font_path and os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            if font_id != -1:
-                font_families = QFontDatabase.applicationFontFamilies(font_id)
-                if font_families:
-                    self.status_label.setFont(QFont(font_families[0], 12))
+        self.status_label.setFixedSize(285, 60)
 
-        self.status_label.setFixedSize(self.display_container.size())
+        self.level_meter = LevelMeter(self.display_container)
+        self.level_meter.setGeometry(8, 58, 269, 5)
         
         self.flare_label = QLabel(self.display_container)
-        flare_path = resource_path("icons/flare.png")
-        if flare_path and os.path.exists(flare_path):
-            flare_pixmap = QPixmap(flare_path)
-            self.flare_label.setPixmap(flare_pixmap.scaled(self.display_container.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
         self.flare_label.setFixedSize(self.display_container.size())
         self.flare_label.lower() 
+
+        self.meter_timer = QTimer(self)
+        self.meter_timer.setInterval(1000 // self.METER_UPDATE_RATE)
+        self.meter_timer.timeout.connect(self.update_level_meter)
         
         top_buttons_and_gif_layout.addWidget(self.display_container)
         top_section.addLayout(top_buttons_and_gif_layout)
@@ -152,12 +915,26 @@ class SoundRecorderApp(QMainWindow):
         top_section.addLayout(buttons_layout)
 
         self.create_buttons(buttons_layout)
+        # Aygıtlar taranana ya da PortAudio yeniden başlatılana kadar kayda başlanamaz.
+        self.rec_label.setEnabled(self.device_registry.ready)
+        self.device_registry.ready_changed.connect(self.rec_label.setEnabled)
+
+        self.position_slider = self.create_position_slider()
+        top_section.addWidget(self.position_slider)
         
-        self.table_widget = QTableWidget()
+        self.filter_edit = QLineEdit()
+        self.recordings_model = RecordingsTableModel(self)
+        self.table_view = QTableView()
         self.setup_table()
 
         main_layout.addLayout(top_section)
-        main_layout.addWidget(self.table_widget)
+        main_layout.addWidget(self.filter_edit)
+        main_layout.addWidget(self.table_view)
+
+        self.waveform_view = WaveformView()
+        self.waveform_view.setFixedHeight(48)
+        self.peak_compute_thread = None
+        main_layout.addWidget(self.waveform_view)
         
         self.create_menu_bar()
 
@@ -167,22 +944,83 @@ class SoundRecorderApp(QMainWindow):
         self.system_button.clicked.connect(self.toggle_system_sound)
         self.mic_button.clicked.connect(self.toggle_microphone)
 
+        self.library = RecordingLibrary(self.library_file, self.record_path)
+        self.library_scan_thread = None
+        self.batch_convert_thread = None
+        self.load_library()
+
+        self.recovery_thread = RecoveryThread(self.sessions_dir, self.library)
+        self.recovery_thread.recovered.connect(self.on_recordings_recovered)
+        self.recovery_thread.start()
+
 
     def __del__(self):
-        self.p.terminate()
+        self.audio_engine.terminate()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.first_paint_time is None:
+            self.first_paint_time = time.perf_counter()
+            # Pencere ekrana geldikten sonra, olay döngüsünün ilk boş anında yüklenir.
+            QTimer.singleShot(0, self._load_deferred_assets)
+
+    def _load_deferred_assets(self):
+        """İlk çizim için gerekmeyen kaynakları (simge, yazı tipi, parlama, aygıt listesi) yükler."""
+        icon_path = resource_path("icons/recicon.png")
+        if icon_path:
+            self.setWindowIcon(QIcon(icon_path))
+
+        font_path = resource_path("fonts/AlphaSmart3000.ttf")
+        if font_path:
+            font_id = QFontDatabase.addApplicationFont(font_path)
+            if font_id != -1:
+                font_families = QFontDatabase.applicationFontFamilies(font_id)
+                if font_families:
+                    self.status_label.setFont(QFont(font_families[0], 12))
+
+        flare_pixmap = self.assets.pixmap("icons/flare.png")
+        if not flare_pixmap.isNull():
+            self.flare_label.setPixmap(flare_pixmap.scaled(self.display_container.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+
+        self.device_registry.refresh()
+        self.deferred_assets_loaded.emit()
+
+    def closeEvent(self, event):
+        # Arka planda tamamlanmakta olan kayıtların yarım kalmaması için beklenir.
+        if self.is_recording:
+            self.stop_recording()
+        for finalize_thread in list(self.finalize_threads):
+            finalize_thread.wait()
+        self.recovery_thread.wait()
+        if self.batch_convert_thread and self.batch_convert_thread.isRunning():
+            self.batch_convert_thread.transcoder.cancel()
+            self.batch_convert_thread.wait()
+        if self.library_scan_thread and self.library_scan_thread.isRunning():
+            self.library_scan_thread.is_running = False
+            self.library_scan_thread.wait()
+        if self.peak_compute_thread and self.peak_compute_thread.isRunning():
+            self.peak_compute_thread.is_running = False
+            self.peak_compute_thread.wait()
+        self.device_registry.wait()
+        super().closeEvent(event)
 
     def load_translations(self):
-        """Ayarlanan dile göre çeviri dosyasını yükler."""
-        lang_file_path = resource_path(f"languages/{self.current_language}.json")
-        try:
-            if lang_file_path and os.path.exists(lang_file_path):
-                with open(lang_file_path, 'r', encoding='utf-8') as f:
-                    self.translations = json.load(f)
-            else:
-                raise FileNotFoundError(f"'{lang_file_path}' dosyası bulunamadı.")
-        except (IOError, json.JSONDecodeError, FileNotFoundError) as e:
-            print(f"Çeviri dosyası yüklenirken hata oluştu: {e}. Varsayılan dile geçiliyor.")
-            self.translations = {} # Hata olursa boş sözlük kullan
+        """Ayarlanan dilin çevirilerini önbellekli katalogdan alır; dosya yoksa boş sözlük kullanılır."""
+        self.translations = self.language_catalog.translations(self.current_language)
+
+    def _translate(self, setter, key, default):
+        """Metni geçerli dilde ayarlar ve dil değiştiğinde yenilenmek üzere kaydeder."""
+        self.translatable_texts.append((setter, key, default))
+        setter(self.translations.get(key, default))
+
+    def retranslate_ui(self):
+        """Pencereyi yeniden oluşturmadan menüleri, tablo başlıklarını ve durum ekranını geçerli dile çevirir."""
+        for setter, key, default in self.translatable_texts:
+            setter(self.translations.get(key, default))
+        self._set_table_headers()
+        if self.stats_panel is not None:
+            self.stats_panel.setWindowTitle(self.translations.get("action_stats_panel", "İstatistik Paneli"))
+        self._update_status_display(self.status_key, **self.status_args)
 
     def load_settings(self):
         """Uygulama ayarlarını dosyadan yükler."""
@@ -192,8 +1030,16 @@ class SoundRecorderApp(QMainWindow):
                     settings = json.load(f)
                     self.record_format = settings.get("record_format", self.record_format)
                     self.current_language = settings.get("language", self.current_language)
-            except (IOError, json.JSONDecodeError) as e:
-                print(f"Ayarlar dosyası yüklenirken hata oluştu: {e}")
+                    self.mic_gain = float(settings.get("mic_gain", self.mic_gain))
+                    self.system_gain = float(settings.get("system_gain", self.system_gain))
+                    self.vad_mode = settings.get("vad_mode", self.vad_mode)
+                    self.capture_profile = settings.get("capture_profile", self.capture_profile)
+                    self.custom_profile.update(settings.get("custom_profile", {}))
+                    self.input_device_name = settings.get("input_device", self.input_device_name)
+                    self.multi_device_names = list(settings.get("input_devices", self.multi_device_names))
+                    self.interleave_devices = bool(settings.get("interleave_devices", self.interleave_devices))
+            except (IOError, ValueError, TypeError) as e:
+                log.warning("Ayarlar dosyası yüklenirken hata oluştu: %s", e)
                 self.save_settings()
         else:
             self.save_settings()
@@ -205,21 +1051,36 @@ class SoundRecorderApp(QMainWindow):
         
         settings = {
             "record_format": self.record_format,
-            "language": self.current_language
+            "language": self.current_language,
+            "mic_gain": self.mic_gain,
+            "system_gain": self.system_gain,
+            "vad_mode": self.vad_mode,
+            "capture_profile": self.capture_profile,
+            "custom_profile": self.custom_profile,
+            "input_device": self.input_device_name,
+            "input_devices": self.multi_device_names,
+            "interleave_devices": self.interleave_devices
         }
         
         try:
             with open(self.config_file, 'w') as f:
                 json.dump(settings, f, indent=4)
         except IOError as e:
-            print(f"Ayarlar dosyası kaydedilirken hata oluştu: {e}")
+            log.error("Ayarlar dosyası kaydedilirken hata oluştu: %s", e)
 
-    def _update_status_display(self, current_status="status_ready"):
+    def _update_status_display(self, current_status="status_ready", **format_args):
+        # Dil değiştiğinde aynı durum yeni dilde yeniden gösterilebilsin diye saklanır.
+        self.status_key = current_status
+        self.status_args = format_args
         system_status = self.translations.get("system_on", "on") if self.system_on else self.translations.get("system_off", "off")
         mic_status = self.translations.get("mic_on", "on") if self.mic_on else self.translations.get("mic_off", "off")
         
+        status_text = self.translations.get(current_status, current_status)
+        if format_args:
+            status_text = status_text.format(**format_args)
+
         display_text = (
-            f"{self.translations.get(current_status, current_status)}\n"
+            f"{status_text}\n"
             f"System: {system_status} | Mic: {mic_status}\n"
             f"Format: {self.record_format}"
         )
@@ -227,10 +1088,14 @@ class SoundRecorderApp(QMainWindow):
         self.status_label.setAlignment(Qt.AlignCenter)
 
     def toggle_system_sound(self):
+        if self.is_recording:
+            QMessageBox.warning(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_system_recording_active", "Kayıt devam ederken sistem sesini açıp kapatamazsınız."))
+            return
+
         self.system_on = not self.system_on
         self._update_status_display()
-        self.update_toggle_button_style(self.system_button, "system", self.system_on)
-        print(f"Sistem sesleri {self.translations.get('mic_on', 'on') if self.system_on else self.translations.get('mic_off', 'off')}.")
+        self.update_toggle_button_style(self.system_button, self.system_on)
+        log.info("Sistem sesleri değiştirildi", extra={"system_on": self.system_on})
 
     def toggle_microphone(self):
         if self.is_recording:
@@ -239,29 +1104,18 @@ class SoundRecorderApp(QMainWindow):
 
         self.mic_on = not self.mic_on
         self._update_status_display()
-        self.update_toggle_button_style(self.mic_button, "mic", self.mic_on)
-        print(f"Mikrofon {self.translations.get('mic_on', 'on') if self.mic_on else self.translations.get('mic_off', 'off')}.")
+        self.update_toggle_button_style(self.mic_button, self.mic_on)
+        log.info("Mikrofon değiştirildi", extra={"mic_on": self.mic_on})
     
-    def update_toggle_button_style(self, button, name, is_on):
-        """Açma/kapama butonlarının stilini durumuna göre günceller."""
-        if is_on:
-            style_sheet = f"""
-                QPushButton#{button.objectName()} {{
-                    border-image: url({resource_path('icons/' + name + '_basık.png')}) 0 0 0 0 stretch stretch;
-                    border: none;
-                }}
-            """
-        else:
-            style_sheet = f"""
-                QPushButton#{button.objectName()} {{
-                    border-image: url({resource_path('icons/' + name + '_normal.png')}) 0 0 0 0 stretch stretch;
-                    border: none;
-                }}
-                QPushButton#{button.objectName()}:hover {{
-                    border-image: url({resource_path('icons/' + name + '_cursor.png')}) 0 0 0 0 stretch stretch;
-                }}
-            """
-        button.setStyleSheet(style_sheet)
+    def update_toggle_button_style(self, button, is_on):
+        """Açma/kapama butonlarının görünümünü durumuna göre günceller."""
+        self._set_button_active(button, is_on)
+
+    def _set_button_active(self, button, active):
+        # Stil sayfası aynı kalır; yalnızca 'active' özelliği değişir ve buton yeniden biçimlendirilir.
+        button.setProperty("active", active)
+        button.style().unpolish(button)
+        button.style().polish(button)
     
     def create_buttons(self, layout):
         self.rec_label = self.create_rec_label("rec", "rec_label")
@@ -286,17 +1140,20 @@ class SoundRecorderApp(QMainWindow):
     def eventFilter(self, obj, event):
         if obj == self.rec_label:
             if event.type() == QEvent.Enter:
-                self.rec_label.setPixmap(QPixmap(resource_path("icons/rec_cursor.png")))
+                self.rec_label.setPixmap(self.assets.pixmap("icons/rec_cursor.png"))
             elif event.type() == QEvent.Leave:
                 if not self.is_recording:
-                    self.rec_label.setPixmap(QPixmap(resource_path("icons/rec_normal.png")))
+                    self.rec_label.setPixmap(self.assets.pixmap("icons/rec_normal.png"))
         
         elif obj == self.pause_label:
             if not self.is_paused:
                 if event.type() == QEvent.Enter:
-                    self.pause_label.setPixmap(QPixmap(resource_path("icons/pause_cursor.png")))
+                    self.pause_label.setPixmap(self.assets.pixmap("icons/pause_cursor.png"))
                 elif event.type() == QEvent.Leave:
-                    self.pause_label.setPixmap(QPixmap(resource_path("icons/pause_normal.png")))
+                    self.pause_label.setPixmap(self.assets.pixmap("icons/pause_normal.png"))
+
+        elif obj == self.stats_panel and event.type() == QEvent.Close:
+            self.stats_action.setChecked(False)
         
         return super().eventFilter(obj, event)
 
@@ -304,35 +1161,91 @@ class SoundRecorderApp(QMainWindow):
         button = QPushButton()
         button.setObjectName(object_name)
         
-        pixmap = QPixmap(resource_path(f"icons/{name}_normal.png"))
+        pixmap = self.assets.pixmap(f"icons/{name}_normal.png")
         if not pixmap.isNull():
             button.setFixedSize(pixmap.size())
         
-        button.setStyleSheet(f"""
-            QPushButton#{object_name} {{
-                border-image: url({resource_path('icons/' + name + '_normal.png')}) 0 0 0 0 stretch stretch;
-                border: none;
-            }}
-            QPushButton#{object_name}:hover {{
-                border-image: url({resource_path('icons/' + name + '_cursor.png')}) 0 0 0 0 stretch stretch;
-            }}
-            QPushButton#{object_name}:pressed {{
-                border-image: url({resource_path('icons/' + name + '_basık.png')}) 0 0 0 0 stretch stretch;
-            }}
-        """)
+        button.setStyleSheet(self.assets.button_style(object_name, name))
         return button
     
     def create_rec_label(self, name, object_name):
         label = QLabel()
         label.setObjectName(object_name)
 
-        pixmap = QPixmap(resource_path(f"icons/{name}_normal.png"))
+        pixmap = self.assets.pixmap(f"icons/{name}_normal.png")
         if not pixmap.isNull():
             label.setFixedSize(pixmap.size())
             label.setPixmap(pixmap)
         
         return label
 
+    def create_position_slider(self):
+        """Oynatma konumunu gösteren ve kayıt içinde atlamayı sağlayan kaydırıcıyı oluşturur."""
+        slider = QSlider(Qt.Horizontal)
+        slider.setObjectName("position_slider")
+        slider.setRange(0, 0)
+        slider.setEnabled(False)
+        slider.setStyleSheet("""
+            QSlider#position_slider::groove:horizontal {
+                background-color: #2D2D2D;
+                height: 6px;
+                border-radius: 3px;
+            }
+            QSlider#position_slider::sub-page:horizontal {
+                background-color: #6a695a;
+                border-radius: 3px;
+            }
+            QSlider#position_slider::handle:horizontal {
+                background-color: #A0A0A0;
+                width: 12px;
+                margin: -4px 0;
+                border-radius: 6px;
+            }
+        """)
+        slider.sliderReleased.connect(self.on_position_slider_released)
+        return slider
+
+    def on_playback_position(self, position, duration):
+        # Kullanıcı kaydırıcıyı sürüklerken konum güncellemeleri yok sayılır.
+        if self.position_slider.isSliderDown():
+            return
+        if duration > 0:
+            self.position_slider.setEnabled(True)
+            self.position_slider.setRange(0, int(duration * 1000))
+        self.position_slider.setValue(int(position * 1000))
+        if self.playback_thread and os.path.basename(self.playback_thread.audio_data['path']) == self._current_record_name():
+            self.waveform_view.set_position(position)
+
+    def on_position_slider_released(self):
+        if self.playback_thread and self.playback_thread.isRunning():
+            self.playback_thread.seek(self.position_slider.value() / 1000.0)
+
+    def update_level_meter(self):
+        """Seviye ölçeri sabit bir hızda (METER_UPDATE_RATE) günceller."""
+        if self.session is None:
+            return
+        self.level_meter.set_levels(*self.session.level_analyzer.read_levels())
+        if self.vad_mode == "auto_pause" and self.session.gate is not None:
+            self._update_auto_pause(self.session.gate.is_silent)
+
+    def _update_auto_pause(self, is_silent):
+        """Sessizlik algılayıcısının durumunu duraklatma durumuna yansıtır; elle duraklatmaya dokunmaz."""
+        if is_silent and not self.is_paused:
+            self.is_paused = True
+            self.auto_paused = True
+            self.session.pause(auto=True)
+            self._show_pause_state()
+        elif not is_silent and self.auto_paused:
+            self.is_paused = False
+            self.auto_paused = False
+            self.session.resume()
+            self._show_pause_state()
+
+    def _reset_position_slider(self):
+        self.position_slider.setRange(0, 0)
+        self.position_slider.setEnabled(False)
+        self.waveform_view.set_position(None)
+
     def create_menu_bar(self):
         menu_bar = self.menuBar()
         menu_bar.setStyleSheet("""
@@ -353,50 +1266,72 @@ class SoundRecorderApp(QMainWindow):
             }
         """)
         
-        file_menu = menu_bar.addMenu(self.translations.get("menu_file", "Dosya"))
-        settings_menu = menu_bar.addMenu(self.translations.get("menu_settings", "Ayarlar"))
+        file_menu = menu_bar.addMenu("")
+        settings_menu = menu_bar.addMenu("")
+        self._translate(file_menu.setTitle, "menu_file", "Dosya")
+        self._translate(settings_menu.setTitle, "menu_settings", "Ayarlar")
         
-        open_action = QAction(self.translations.get("action_open", "Aç..."), self)
-        save_as_action = QAction(self.translations.get("action_save_as", "Farklı Kaydet..."), self)
-        exit_action = QAction(self.translations.get("action_exit", "Çıkış"), self)
+        open_action = self._create_action("action_open", "Aç...")
+        save_as_action = self._create_action("action_save_as", "Farklı Kaydet...")
+        convert_action = self._create_action("action_convert_selected", "Seçilenleri Dönüştür...")
+        exit_action = self._create_action("action_exit", "Çıkış")
         
-        format_action = QAction(self.translations.get("action_record_format", "Kayıt Formatı..."), self)
-        language_action = QAction(self.translations.get("action_language", "Dil..."), self)
+        format_action = self._create_action("action_record_format", "Kayıt Formatı...")
+        language_action = self._create_action("action_language", "Dil...")
+        source_gains_action = self._create_action("action_source_gains", "Kaynak Seviyeleri...")
+        capture_profile_action = self._create_action("action_capture_profile", "Kayıt Profili...")
+        input_device_action = self._create_action("action_input_device", "Giriş Aygıtı...")
+        multi_device_action = self._create_action("action_multi_device", "Çoklu Aygıt Kaydı...")
+        vad_action = self._create_action("action_vad", "Sessizlik Algılama...")
+        stats_action = self._create_action("action_stats_panel", "İstatistik Paneli")
+        stats_action.setCheckable(True)
 
         open_action.triggered.connect(self.open_file)
         save_as_action.triggered.connect(self.save_file_as)
+        convert_action.triggered.connect(self.convert_selected)
         exit_action.triggered.connect(self.close)
         
         format_action.triggered.connect(self.show_format_options)
         language_action.triggered.connect(self.show_language_options)
+        source_gains_action.triggered.connect(self.show_source_gain_options)
+        capture_profile_action.triggered.connect(self.show_capture_profile_options)
+        input_device_action.triggered.connect(self.show_input_device_options)
+        multi_device_action.triggered.connect(self.show_multi_device_options)
+        vad_action.triggered.connect(self.show_vad_options)
+        stats_action.toggled.connect(self.toggle_stats_panel)
 
         file_menu.addAction(open_action)
         file_menu.addAction(save_as_action)
+        file_menu.addAction(convert_action)
         file_menu.addSeparator() 
         file_menu.addAction(exit_action)
         
         settings_menu.addAction(format_action)
+        settings_menu.addAction(capture_profile_action)
+        settings_menu.addAction(input_device_action)
+        settings_menu.addAction(multi_device_action)
         settings_menu.addAction(language_action)
-
-        about_menu = menu_bar.addMenu(self.translations.get("menu_about", "Hakkında"))
-        about_action = QAction(self.translations.get("menu_about", "Hakkında"), self)
+        settings_menu.addAction(source_gains_action)
+        settings_menu.addAction(vad_action)
+        settings_menu.addSeparator()
+        settings_menu.addAction(stats_action)
+        self.stats_action = stats_action
+
+        about_menu = menu_bar.addMenu("")
+        self._translate(about_menu.setTitle, "menu_about", "Hakkında")
+        about_action = self._create_action("menu_about", "Hakkında")
         about_action.triggered.connect(self.show_about_dialog)
         about_menu.addAction(about_action)
 
+    def _create_action(self, key, default):
+        """Metni dil değişince yenilenen bir menü eylemi oluşturur."""
+        action = QAction(self)
+        self._translate(action.setText, key, default)
+        return action
+
     def show_language_options(self):
-        # Kullanılabilir dilleri tara ve gösterilecek isimlerini al
-        available_languages = {}
-        if self.languages_dir:
-            for filename in os.listdir(self.languages_dir):
-                if filename.endswith('.json'):
-                    lang_code = filename.replace('.json', '')
-                    try:
-                        with open(os.path.join(self.languages_dir, filename), 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            display_name = data.get("language_name", lang_code.upper())
-                            available_languages[display_name] = lang_code
-                    except (IOError, json.JSONDecodeError):
-                        continue
+        # Dillerin görünen adları katalogda önbelleklidir; dosyalar yalnızca ilk açılışta okunur.
+        available_languages = self.language_catalog.names()
 
         lang_list = list(available_languages.keys())
         current_display_name = next((key for key, value in available_languages.items() if value == self.current_language), self.current_language.upper())
@@ -411,18 +1346,21 @@ class SoundRecorderApp(QMainWindow):
         if ok and lang:
             new_lang_code = available_languages[lang]
             if new_lang_code != self.current_language:
-                self.current_language = new_lang_code
+                self.apply_language(new_lang_code)
                 self.save_settings()
-                QMessageBox.information(self, self.translations.get("info_title", "Bilgi"), self.translations.get("info_restart_required", "Dil ayarı değiştirildi. Değişikliklerin etkili olması için uygulama yeniden başlatılacak."))
-                self.restart_app()
 
-    def restart_app(self):
-        """Uygulamayı yeniden başlatır."""
-        QApplication.quit()
-        os.execl(sys.executable, sys.executable, *sys.argv)
+    def apply_language(self, lang_code):
+        """
+        Dili uygulamayı yeniden başlatmadan değiştirir; açık pencere ve süren kayıt ya da oynatma etkilenmez.
+        İletişim kutuları her açılışta metinlerini yeniden aldığından yeni dili kendiliğinden kullanır.
+        """
+        self.current_language = lang_code
+        self.load_translations()
+        self.retranslate_ui()
+        log.info("Dil değiştirildi", extra={"language": lang_code})
 
     def show_format_options(self):
-        options = [".WAV", ".MP3", ".FLAC", ".OGG", ".AAC"]
+        options = list(self.RECORD_FORMATS)
         current_format = self.record_format
         
         format_tuple = QInputDialog.getItem(self, self.translations.get("action_record_format", "Kayıt Formatı..."), self.translations.get("info_select_format", "Lütfen bir kayıt formatı seçin:"), options, options.index(current_format), False)
@@ -435,18 +1373,164 @@ class SoundRecorderApp(QMainWindow):
                 QMessageBox.information(self, self.translations.get("info_title", "Bilgi"), self.translations.get("info_format_set", "Kayıt formatı başarıyla {format} olarak ayarlandı.").format(format=self.record_format))
                 self._update_status_display()
 
+    def show_source_gain_options(self):
+        """Mikrofon ve sistem sesi karıştırılırken kullanılacak kazançları sorar."""
+        title = self.translations.get("action_source_gains", "Kaynak Seviyeleri...")
+        mic_gain, ok = QInputDialog.getDouble(self, title, self.translations.get("info_mic_gain", "Mikrofon kazancı:"), self.mic_gain, 0.0, 4.0, 2)
+        if not ok:
+            return
+        system_gain, ok = QInputDialog.getDouble(self, title, self.translations.get("info_system_gain", "Sistem sesi kazancı:"), self.system_gain, 0.0, 4.0, 2)
+        if not ok:
+            return
+        self.mic_gain = mic_gain
+        self.system_gain = system_gain
+        self.save_settings()
+
+    def show_vad_options(self):
+        """Kayıt sırasında sessiz bölümlerin nasıl ele alınacağını seçtirir."""
+        modes = ["off", "skip", "auto_pause"]
+        options = [self.translations.get("vad_off", "Kapalı"),
+                   self.translations.get("vad_skip", "Sessizliği atla"),
+                   self.translations.get("vad_auto_pause", "Otomatik duraklat")]
+        current = modes.index(self.vad_mode) if self.vad_mode in modes else 0
+        option, ok = QInputDialog.getItem(self, self.translations.get("action_vad", "Sessizlik Algılama..."), self.translations.get("info_select_vad", "Sessiz bölümlerde ne yapılacağını seçin:"), options, current, False)
+        if ok:
+            self.vad_mode = modes[options.index(option)]
+            self.save_settings()
+
+    def _profile_settings(self, name):
+        """Profil adına karşılık gelen ayarları döndürür; bilinmeyen profiller standart kabul edilir."""
+        if name == "custom":
+            return self.custom_profile
+        return CAPTURE_PROFILES.get(name, CAPTURE_PROFILES["standard"])
+
+    def _apply_capture_profile(self, profile):
+        """Profili FORMAT, CHANNELS, RATE ve CHUNK ayarlarına uygular."""
+        self.FORMAT, self.CHANNELS, self.RATE, self.CHUNK = resolve_capture_profile(profile)
+
+    def show_capture_profile_options(self):
+        """Kayıt profilini seçtirir; özel profilde hız, kanal, bit derinliği ve tampon boyutunu sorar."""
+        if self.is_recording:
+            QMessageBox.warning(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_profile_recording_active", "Kayıt devam ederken kayıt profili değiştirilemez."))
+            return
+
+        title = self.translations.get("action_capture_profile", "Kayıt Profili...")
+        names = ["low_latency", "standard", "high_throughput", "custom"]
+        options = [self.translations.get("profile_low_latency", "Düşük gecikme"),
+                   self.translations.get("profile_standard", "Standart"),
+                   self.translations.get("profile_high_throughput", "Yüksek verim"),
+                   self.translations.get("profile_custom", "Özel")]
+        current = names.index(self.capture_profile) if self.capture_profile in names else 1
+        option, ok = QInputDialog.getItem(self, title, self.translations.get("info_select_profile", "Lütfen bir kayıt profili seçin:"), options, current, False)
+        if not ok:
+            return
+        name = names[options.index(option)]
+        profile = dict(self._profile_settings(name))
+
+        if name == "custom":
+            rates = ["8000", "16000", "22050", "32000", "44100", "48000", "88200", "96000"]
+            rate, ok = QInputDialog.getItem(self, title, self.translations.get("info_sample_rate", "Örnekleme hızı (Hz):"), rates,
+                                            rates.index(str(profile["rate"])) if str(profile["rate"]) in rates else 4, False)
+            if not ok:
+                return
+            channels, ok = QInputDialog.getInt(self, title, self.translations.get("info_channels", "Kanal sayısı:"), int(profile["channels"]), 1, 8)
+            if not ok:
+                return
+            depths = ["16", "24", "32"]
+            bit_depth, ok = QInputDialog.getItem(self, title, self.translations.get("info_bit_depth", "Bit derinliği:"), depths,
+                                                 depths.index(str(profile["bit_depth"])) if str(profile["bit_depth"]) in depths else 0, False)
+            if not ok:
+                return
+            chunk, ok = QInputDialog.getInt(self, title, self.translations.get("info_buffer_size", "Tampon boyutu (çerçeve):"), int(profile["chunk"]), 64, 16384)
+            if not ok:
+                return
+            profile = {"rate": int(rate), "channels": channels, "bit_depth": int(bit_depth), "chunk": chunk}
+
+        try:
+            self.audio_engine.check_input_format(profile["rate"], profile["channels"], BIT_DEPTH_FORMATS[profile["bit_depth"]], self._input_device_index())
+        except ValueError as e:
+            QMessageBox.warning(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_profile_unsupported", "Ses aygıtı bu ayarları desteklemiyor: {error}").format(error=e))
+            return
+
+        self.capture_profile = name
+        if name == "custom":
+            self.custom_profile = profile
+        self._apply_capture_profile(profile)
+        self.save_settings()
+
+    def _input_device_index(self):
+        """Seçili giriş aygıtının dizinini önbellekten döndürür; aygıt takılı değilse varsayılan aygıt kullanılır."""
+        if not self.input_device_name:
+            return None
+        index = self.device_registry.find_input(self.input_device_name)
+        if index is None:
+            log.warning("Giriş aygıtı bulunamadı, varsayılan giriş aygıtı kullanılıyor", extra={"device": self.input_device_name})
+        return index
+
+    def show_input_device_options(self):
+        """Önbellekteki aygıt listesinden kayıt için giriş aygıtı seçtirir; liste arka planda yenilenir."""
+        if self.is_recording:
+            QMessageBox.warning(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_device_recording_active", "Kayıt devam ederken giriş aygıtı değiştirilemez."))
+            return
+
+        default_option = self.translations.get("device_default", "Varsayılan aygıt")
+        names = [device["name"] for device in self.device_registry.input_devices()]
+        if self.input_device_name and self.input_device_name not in names:
+            names.append(self.input_device_name)
+        options = [default_option] + names
+        current = options.index(self.input_device_name) if self.input_device_name in options else 0
+        option, ok = QInputDialog.getItem(self, self.translations.get("action_input_device", "Giriş Aygıtı..."), self.translations.get("info_select_device", "Lütfen bir giriş aygıtı seçin:"), options, current, False)
+        # Liste bir sonraki açılışta güncel olsun diye istek üzerine yenilenir.
+        self.device_registry.refresh()
+        if not ok:
+            return
+        self.input_device_name = None if option == default_option else option
+        self.save_settings()
+
+    def show_multi_device_options(self):
+        """Birden çok giriş aygıtından aynı anda, her biri ayrı parçaya kayıt yapılmasını ayarlar."""
+        if self.is_recording:
+            QMessageBox.warning(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_device_recording_active", "Kayıt devam ederken giriş aygıtı değiştirilemez."))
+            return
+
+        names = [device["name"] for device in self.device_registry.input_devices()]
+        names += [name for name in self.multi_device_names if name not in names]
+        dialog = MultiDeviceDialog(self.translations, names, self.multi_device_names, self.interleave_devices, self)
+        accepted = dialog.exec_() == QDialog.Accepted
+        self.device_registry.refresh()
+        if not accepted:
+            return
+        selected = dialog.selected_names()
+        if len(selected) == 1:
+            QMessageBox.information(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_multi_device_single", "Çoklu aygıt kaydı için en az iki aygıt seçilmelidir; tek aygıt için Giriş Aygıtı menüsünü kullanın."))
+            return
+        self.multi_device_names = selected
+        self.interleave_devices = dialog.interleave_box.isChecked()
+        self.save_settings()
+
+    def _multi_device_indices(self):
+        """Çoklu aygıt kaydı için seçilen ve takılı olan aygıtların (dizin, ad) listesini döndürür."""
+        devices = []
+        for name in self.multi_device_names:
+            index = self.device_registry.find_input(name)
+            if index is None:
+                log.warning("Giriş aygıtı bulunamadı, çoklu kayıtta atlanıyor", extra={"device": name})
+            else:
+                devices.append((index, name))
+        return devices
+
     def open_file(self):
         file_path, _ = QFileDialog.getOpenFileName(self, self.translations.get("action_open", "Aç..."), "", f"{self.translations.get('file_type_audio', 'Ses Dosyaları')} (*.wav)")
         if file_path:
             self.add_record_to_table(file_path)
 
     def save_file_as(self):
-        selected_rows = self.table_widget.selectionModel().selectedRows()
-        if not selected_rows:
+        selected_names = self._selected_record_names()
+        if not selected_names:
             QMessageBox.information(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_select_for_save", "Lütfen farklı kaydetmek istediğiniz kaydı listeden seçin."))
             return
 
-        file_name = self.table_widget.item(selected_rows[0].row(), 0).text()
+        file_name = selected_names[0]
         # Kayıt uzantısını belirle
         file_extension = os.path.splitext(file_name)[1]
         
@@ -465,30 +1549,173 @@ class SoundRecorderApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("error_save_file", "Dosya kaydedilirken bir hata oluştu: {error}").format(error=e))
 
-    def _save_recording_to_path(self, full_path, format):
-        try:
-            temp_wav_path = os.path.splitext(full_path)[0] + ".wav"
-            
-            # İlk olarak WAV formatında kaydet
-            wf = wave.open(temp_wav_path, 'wb')
-            wf.setnchannels(self.CHANNELS)
-            wf.setsampwidth(self.p.get_sample_size(self.FORMAT))
-            wf.setframerate(self.RATE)
-            wf.writeframes(b''.join(self.frames))
-            wf.close()
-
-            if format.lower() == ".wav":
-                os.rename(temp_wav_path, full_path)
-                print(f"Kayıt durduruldu ve {full_path} dosyasına kaydedildi.")
-            else:
-                # pydub ile diğer formatlara dönüştür
-                audio_segment = AudioSegment.from_wav(temp_wav_path)
-                audio_segment.export(full_path, format=format.replace(".", ""))
-                os.remove(temp_wav_path)
-                print(f"Kayıt durduruldu, {format.upper()} formatına dönüştürüldü ve {full_path} dosyasına kaydedildi.")
-        
-        except Exception as e:
-            QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("error_save_file", "Dosya kaydedilirken bir hata oluştu: {error}").format(error=e))
+    def convert_selected(self):
+        """Seçili kayıtları seçilen biçime, işlemci çekirdeği sayısı kadar paralel ffmpeg süreciyle dönüştürür."""
+        if self.batch_convert_thread and self.batch_convert_thread.isRunning():
+            return
+        # Kaydı ya da kaydedilmesi süren dosyalar henüz tamamlanmadığı için dönüştürülmez.
+        source_paths = [path for path in (os.path.join(self.record_path, name) for name in self._selected_record_names())
+                        if path not in self.pending_record_paths and os.path.exists(path)]
+        if not source_paths:
+            QMessageBox.information(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_select_for_convert", "Lütfen dönüştürmek istediğiniz kayıtları listeden seçin."))
+            return
+
+        ffmpeg_path = find_ffmpeg()
+        if not ffmpeg_path:
+            QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("error_ffmpeg_missing", "Dönüştürme için ffmpeg gereklidir."))
+            return
+
+        options = list(self.RECORD_FORMATS)
+        extension, ok = QInputDialog.getItem(self, self.translations.get("action_convert_selected", "Seçilenleri Dönüştür..."), self.translations.get("info_select_convert_format", "Kayıtlar hangi formata dönüştürülsün?"), options, options.index(".FLAC"), False)
+        if not ok:
+            return
+        directory = QFileDialog.getExistingDirectory(self, self.translations.get("action_convert_selected", "Seçilenleri Dönüştür..."), self.record_path)
+        if not directory:
+            return
+
+        jobs = []
+        reserved = set(self.pending_record_paths)
+        for source_path in source_paths:
+            destination_path = conversion_destination(directory, source_path, extension.lower(), reserved)
+            reserved.add(destination_path)
+            jobs.append((source_path, destination_path))
+
+        self.converted_records = []
+        self.convert_failures = []
+        self.batch_convert_thread = BatchConvertThread(BatchTranscoder(jobs, extension, ffmpeg_path), self.library)
+        self.convert_progress = QProgressDialog(self.translations.get("progress_converting", "Kayıtlar dönüştürülüyor..."),
+                                                self.translations.get("button_cancel", "İptal"), 0, len(jobs), self)
+        self.convert_progress.setWindowTitle(self.translations.get("action_convert_selected", "Seçilenleri Dönüştür..."))
+        self.convert_progress.setWindowModality(Qt.WindowModal)
+        self.convert_progress.setAutoClose(False)
+        self.convert_progress.setMinimumDuration(0)
+        self.convert_progress.setValue(0)
+        self.convert_progress.canceled.connect(self.batch_convert_thread.transcoder.cancel)
+
+        self.batch_convert_thread.progress.connect(self.convert_progress.setValue)
+        self.batch_convert_thread.converted.connect(lambda path, entry: self.converted_records.append((path, entry)))
+        self.batch_convert_thread.failed.connect(lambda name, error: self.convert_failures.append(f"{name}: {error}"))
+        self.batch_convert_thread.finished.connect(self.on_batch_convert_finished)
+        self.batch_convert_thread.start()
+
+    def on_batch_convert_finished(self):
+        """Dönüşen dosyaları tabloya tek seferde ekler ve sonucu bildirir."""
+        # Pencerenin kapanması da canceled sinyali gönderir; biten işin iptal sayılmaması için bağlantı kesilir.
+        self.convert_progress.canceled.disconnect()
+        self.convert_progress.close()
+        records = []
+        for path, entry in self.converted_records:
+            name = os.path.basename(path)
+            if self.library.contains_path(path):
+                self.library.update(name, entry)
+            records.append((name, entry))
+        if records:
+            self.library.save()
+            self.recordings_model.set_records(records)
+
+        message = self.translations.get("info_convert_done", "{count} kayıt dönüştürüldü.").format(count=len(records))
+        if self.batch_convert_thread.transcoder.cancelled:
+            message += "\n" + self.translations.get("info_convert_cancelled", "Dönüştürme iptal edildi.")
+        if self.convert_failures:
+            message += "\n\n" + self.translations.get("warning_convert_failed", "{count} kayıt dönüştürülemedi:").format(count=len(self.convert_failures))
+            message += "\n" + "\n".join(self.convert_failures[:10])
+            QMessageBox.warning(self, self.translations.get("warning_title", "Uyarı"), message)
+        else:
+            QMessageBox.information(self, self.translations.get("info_title", "Bilgi"), message)
+
+    def toggle_stats_panel(self, visible):
+        if self.stats_panel is None:
+            self.stats_panel = StatsPanel(self.translations.get("action_stats_panel", "İstatistik Paneli"), self)
+            # Pencere kapatma düğmesiyle kapatılırsa menüdeki işaret de kalkar.
+            self.stats_panel.installEventFilter(self)
+        self.stats_panel.setVisible(visible)
+        if visible:
+            self.stats_panel.show_metrics(self.collect_metrics())
+
+    def collect_metrics(self):
+        """Süren ve son biten kayıt ile oynatmanın ölçümlerini tek bir sözlükte toplar."""
+        return {"mode": "gui",
+                "recording": self.session.metrics_snapshot() if self.session is not None else None,
+                "last_recording": self.last_recording_metrics,
+                "playback": self.playback_thread.metrics_snapshot() if self._is_playing() else None,
+                "last_playback": self.last_playback_metrics}
+
+    def update_metrics(self):
+        """Her saniye istatistik panelini yeniler; kayıt ya da oynatma sürerken ölçüm dosyasını da yazar."""
+        panel_visible = self.stats_panel is not None and self.stats_panel.isVisible()
+        active = self.session is not None or self._is_playing()
+        if not panel_visible and not active:
+            return
+        metrics = self.collect_metrics()
+        if panel_visible:
+            self.stats_panel.show_metrics(metrics)
+        if active and time.monotonic() - self.last_metrics_write >= self.METRICS_FILE_INTERVAL:
+            self.write_metrics(metrics)
+
+    def write_metrics(self, metrics=None):
+        self.last_metrics_write = time.monotonic()
+        write_metrics_file(self.metrics_file, metrics or self.collect_metrics())
+
+    def _next_record_path(self):
+        """Kayıt klasöründe kullanılmayan bir sonraki recN dosya yolunu döndürür."""
+        return self.library.next_record_path(self.record_format, self.pending_record_paths)
+
+    def _finalize_recording(self):
+        """Yazıcıyı arka planda kapatacak iş parçacığını başlatır."""
+        full_path = self.current_record_path
+        finalize_thread = FinalizeThread(self.session, peak_cache=self.peak_cache, skip_index_dir=self.skip_index_dir)
+        self.session = None
+        self.pending_record_paths.add(full_path)
+        self.finalize_threads.append(finalize_thread)
+
+        finalize_thread.progress.connect(self.on_finalize_progress)
+        finalize_thread.saved.connect(self.on_recording_saved)
+        finalize_thread.discarded.connect(self.on_recording_discarded)
+        finalize_thread.failed.connect(self.on_recording_save_failed)
+        finalize_thread.finished.connect(lambda: self._on_finalize_thread_done(finalize_thread))
+        finalize_thread.start()
+
+    def _on_finalize_thread_done(self, finalize_thread):
+        self._report_lost_audio(finalize_thread.session)
+        self.last_recording_metrics = finalize_thread.session.metrics_snapshot()
+        self.write_metrics()
+        self.pending_record_paths.discard(finalize_thread.full_path)
+        if finalize_thread in self.finalize_threads:
+            self.finalize_threads.remove(finalize_thread)
+        if not self.finalize_threads and not self.is_recording and not self._is_playing():
+            self._update_status_display(current_status="status_ready")
+
+    def on_finalize_progress(self, percent):
+        # Yeni bir kayıt ya da oynatma sürüyorsa onun durumu gösterilmeye devam eder.
+        if not self.is_recording and not self._is_playing():
+            self._update_status_display(current_status="status_saving", progress=percent)
+
+    def on_recording_saved(self, full_path):
+        self.add_record_to_table(full_path)
+
+    def on_recording_discarded(self):
+        QMessageBox.warning(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_no_audio_data", "Hiçbir ses verisi kaydedilmedi. Dosya oluşturulmadı."))
+
+    def on_recording_save_failed(self, message):
+        QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("error_save_file", "Dosya kaydedilirken bir hata oluştu: {error}").format(error=message))
+
+    def _is_playing(self):
+        return bool(self.playback_thread and self.playback_thread.isRunning())
+
+    def _report_lost_audio(self, session):
+        """Kayıt sırasında tampon taşması nedeniyle ses kaybolduysa kullanıcıyı bilgilendirir."""
+        overruns, lost_seconds = session.lost_audio()
+        if not overruns:
+            return
+        log.warning("Tampon taştı, ses kayboldu", extra={"overruns": overruns, "lost_s": round(lost_seconds, 2)})
+        QMessageBox.warning(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_audio_dropped", "Kayıt sırasında tampon {count} kez taştı ve yaklaşık {seconds} saniyelik ses kayboldu.").format(count=overruns, seconds=f"{lost_seconds:.2f}"))
+
+    def _discard_session(self):
+        """Kaydı durdurur ve oluşturduğu dosyayı siler."""
+        session = self.session
+        self.session = None
+        if session is not None:
+            session.discard()
 
     def show_about_dialog(self):
         msgBox = QMessageBox()
@@ -511,18 +1738,23 @@ class SoundRecorderApp(QMainWindow):
 
         msgBox.about(self, self.translations.get("about_title", "Hakkında"), about_text)
 
-    def setup_table(self):
-        self.table_widget.setColumnCount(4)
-        self.table_widget.setHorizontalHeaderLabels([
+    def _set_table_headers(self):
+        self.recordings_model.set_headers([
             self.translations.get("table_header_recordings", "Kayıtlar"),
             self.translations.get("table_header_duration", "Süre"),
             self.translations.get("table_header_size", "Boyut"),
             self.translations.get("table_header_format", "Biçem")
         ])
-        header = self.table_widget.horizontalHeader()
+
+    def setup_table(self):
+        self._set_table_headers()
+        self.table_view.setModel(self.recordings_model)
+
+        header = self.table_view.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
-        self.table_widget.setStyleSheet("""
-            QTableWidget {
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.setStyleSheet("""
+            QTableView {
                 background-color: #2D2D2D;
                 alternate-background-color: #3C3C3C;
                 color: white;
@@ -532,149 +1764,212 @@ class SoundRecorderApp(QMainWindow):
                 color: white;
             }
         """)
-        self.table_widget.setAlternatingRowColors(True)
-        self.table_widget.setShowGrid(False)
-        self.table_widget.setSelectionBehavior(QAbstractItemView.SelectRows)
-    
-    def add_record_to_table(self, file_path):
-        try:
-            row_position = self.table_widget.rowCount()
-            self.table_widget.insertRow(row_position)
-            
-            file_info = QFileInfo(file_path)
-            file_name = file_info.fileName()
-            file_extension = os.path.splitext(file_name)[1].upper()
-            file_size_kb = round(file_info.size() / 1024, 2)
+        self.table_view.setAlternatingRowColors(True)
+        self.table_view.setShowGrid(False)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table_view.setSortingEnabled(True)
+        self.table_view.sortByColumn(-1, Qt.AscendingOrder)
+        self.table_view.selectionModel().currentRowChanged.connect(self.on_current_record_changed)
+
+        self._translate(self.filter_edit.setPlaceholderText, "placeholder_filter", "Kayıtlarda ara...")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.setStyleSheet("background-color: #2D2D2D; color: white; border: 1px solid #585858;")
+        self.filter_edit.textChanged.connect(self.on_filter_changed)
+
+    def on_filter_changed(self, text):
+        self.recordings_model.set_filter(text)
+
+    def on_current_record_changed(self, current, previous):
+        """Seçilen kaydın dalga formunu önbellekten gösterir; önbellekte yoksa arka planda oluşturur."""
+        if self.peak_compute_thread and self.peak_compute_thread.isRunning():
+            self.peak_compute_thread.is_running = False
+        if not current.isValid():
+            self.waveform_view.set_pyramid(None)
+            return
 
-            duration_text = "N/A" # Farklı formatlarda süre hesaplamak daha karmaşıktır.
-            try:
-                if file_extension == ".WAV":
-                    with wave.open(file_path, 'rb') as wf:
-                        frames = wf.getnframes()
-                        rate = wf.getframerate()
-                        duration_seconds = frames / float(rate)
-                        duration_minutes = int(duration_seconds // 60)
-                        duration_seconds_rem = int(duration_seconds % 60)
-                        duration_text = f"{duration_minutes:02}:{duration_seconds_rem:02}"
-                else:
-                    audio_segment = AudioSegment.from_file(file_path)
-                    duration_seconds = len(audio_segment) / 1000.0
-                    duration_minutes = int(duration_seconds // 60)
-                    duration_seconds_rem = int(duration_seconds % 60)
-                    duration_text = f"{duration_minutes:02}:{duration_seconds_rem:02}"
-            except Exception as e:
-                print(f"Süre hesaplanırken hata oluştu: {e}")
+        path = os.path.join(self.record_path, self._record_name_at(current))
+        pyramid = self.peak_cache.load(path) if os.path.exists(path) else None
+        self.waveform_view.set_pyramid(pyramid)
+        if pyramid is None and os.path.exists(path) and path not in self.pending_record_paths:
+            self.peak_compute_thread = PeakComputeThread(path, self.peak_cache)
+            self.peak_compute_thread.ready.connect(self.on_peaks_ready)
+            self.peak_compute_thread.start()
+
+    def on_peaks_ready(self, path, pyramid):
+        if self._current_record_name() == os.path.basename(path):
+            self.waveform_view.set_pyramid(pyramid)
+
+    def _record_name_at(self, index):
+        return self.recordings_model.record_name(index.row())
+
+    def _selected_record_names(self):
+        """Tabloda seçili kayıtların adlarını görünümdeki sırayla döndürür."""
+        selected_rows = sorted(self.table_view.selectionModel().selectedRows(), key=lambda index: index.row())
+        return [self._record_name_at(index) for index in selected_rows]
+
+    def _current_record_name(self):
+        index = self.table_view.currentIndex()
+        if not index.isValid():
+            return None
+        return self._record_name_at(index)
+
+    def load_library(self):
+        """Kayıt dizinini yükler, tabloyu hemen doldurur ve değişen dosyaları arka planda inceler."""
+        self.library.load()
+        stale = set(self.library.scan())
+
+        names = sorted(set(self.library.entries) | stale,
+                       key=lambda name: self.library.entries.get(name, {}).get("mtime", float("inf")))
+        self.recordings_model.set_records([(name, self.library.entries.get(name) if name not in stale else None)
+                                           for name in names])
+
+        if stale:
+            self.library_scan_thread = LibraryScanThread(self.library, [name for name in names if name in stale])
+            self.library_scan_thread.entries_ready.connect(self.on_library_entries_ready)
+            self.library_scan_thread.finished.connect(self.library.save)
+            self.library_scan_thread.start()
+        else:
+            self.library.save()
+
+    def on_library_entries_ready(self, records):
+        for name, entry in records:
+            self.library.update(name, entry)
+        self.recordings_model.set_records(records)
+
+    def on_recordings_recovered(self, records):
+        """Kurtarılan kayıtları tabloya ekler ve kullanıcıyı bilgilendirir."""
+        for path, entry in records:
+            if self.library.contains_path(path):
+                self.library.update(os.path.basename(path), entry)
+        self.library.save()
+        self.recordings_model.set_records([(os.path.basename(path), entry) for path, entry in records])
+        QMessageBox.information(self, self.translations.get("info_title", "Bilgi"), self.translations.get("info_recordings_recovered", "Yarım kalan {count} kayıt kurtarıldı:\n{names}").format(count=len(records), names="\n".join(os.path.basename(path) for path, _ in records)))
 
-            self.table_widget.setItem(row_position, 0, QTableWidgetItem(file_name))
-            self.table_widget.setItem(row_position, 1, QTableWidgetItem(duration_text))
-            self.table_widget.setItem(row_position, 2, QTableWidgetItem(f"{file_size_kb} KB"))
-            self.table_widget.setItem(row_position, 3, QTableWidgetItem(file_extension))
+    def add_record_to_table(self, file_path):
+        try:
+            file_name = os.path.basename(file_path)
+            entry = self.library.build_entry(file_path)
+            if self.library.contains_path(file_path):
+                self.library.update(file_name, entry)
+                self.library.save()
+            self.recordings_model.set_records([(file_name, entry)])
             
         except Exception as e:
             QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("error_table_add", "Tabloya kayıt eklenirken bir hata oluştu: {error}").format(error=e))
         
     def start_recording(self, event):
-        if self.is_recording:
+        if self.is_recording or not self.device_registry.ready:
             return
         
-        if not self.mic_on:
+        if not self.mic_on and not self.system_on:
             QMessageBox.information(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_mic_off", "Mikrofon kapalı. Lütfen kayda başlamadan önce mikrofonu açın."))
             return
 
+        input_device_index = self._input_device_index()
+        multi_devices = self._multi_device_indices() if self.mic_on and len(self.multi_device_names) > 1 else []
+        if len(multi_devices) < 2:
+            multi_devices = []
+        if self.mic_on:
+            try:
+                for index in [index for index, _ in multi_devices] or [input_device_index]:
+                    self.audio_engine.check_input_format(self.RATE, self.CHANNELS, self.FORMAT, index)
+            except ValueError as e:
+                QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("warning_profile_unsupported", "Ses aygıtı bu ayarları desteklemiyor: {error}").format(error=e))
+                return
+
+        self.current_record_path = self._next_record_path()
+        if multi_devices:
+            # Her aygıt kendi akışı, tamponu ve yazıcısıyla ayrı bir parçaya kaydedilir.
+            self.session = MultiDeviceSession(self.audio_engine, self.current_record_path, self.FORMAT, self.CHANNELS, self.RATE, self.CHUNK,
+                                              [index for index, _ in multi_devices], system=self.system_on,
+                                              monitor_device_index=self.device_registry.monitor_device(),
+                                              vad_mode=self.vad_mode, interleave=self.interleave_devices,
+                                              journal_dir=self.sessions_dir, track_names=[name for _, name in multi_devices],
+                                              mic_gain=self.mic_gain, system_gain=self.system_gain)
+        else:
+            self.session = RecordingSession(self.audio_engine, self.current_record_path, self.FORMAT, self.CHANNELS, self.RATE, self.CHUNK,
+                                            mic=self.mic_on, system=self.system_on,
+                                            input_device_index=input_device_index,
+                                            monitor_device_index=self.device_registry.monitor_device(),
+                                            mic_gain=self.mic_gain, system_gain=self.system_gain, vad_mode=self.vad_mode,
+                                            journal_dir=self.sessions_dir)
+        try:
+            self.session.open()
+        except Exception as e:
+            self._discard_session()
+            QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("error_save_file", "Dosya kaydedilirken bir hata oluştu: {error}").format(error=e))
+            return
+
         self.is_recording = True
         self.is_paused = False
-        self.frames = []
         self.start_time = time.time()
         self._update_status_display(current_status="status_recording")
         
-        self.update_toggle_button_style(self.mic_button, "mic", True)
+        if self.mic_on:
+            self.update_toggle_button_style(self.mic_button, True)
 
         try:
-            print("Mevcut Ses Aygıtları:")
-            info = self.p.get_host_api_info_by_index(0)
-            numdevices = info.get('deviceCount')
-            for i in range(numdevices):
-                dev_info = self.p.get_device_info_by_host_api_device_index(0, i)
-                print(f"  [{i}] {dev_info.get('name')} (Giriş: {dev_info.get('maxInputChannels')}, Çıkış: {dev_info.get('maxOutputChannels')})")
-        except Exception as e:
-            print(f"Ses aygıtları listelenirken hata oluştu: {e}")
-            
-        try:
-            self.stream = self.p.open(format=self.FORMAT,
-                                      channels=self.CHANNELS,
-                                      rate=self.RATE,
-                                      input=True,
-                                      frames_per_buffer=self.CHUNK,
-                                      stream_callback=self.callback)
-            print("Kayıt başlatıldı.")
+            self.session.start()
+            self.level_meter.reset()
+            self.meter_timer.start()
+            log.info("Kayıt başlatıldı", extra={"path": self.current_record_path, "mic": self.mic_on, "system": self.system_on,
+                                                "devices": len(multi_devices) or 1})
+        except SystemCaptureError as e:
+            QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("error_system_capture", "Sistem sesi yakalanamadı: {error}\n\nLütfen PulseAudio veya PipeWire'ın çalıştığından emin olun.").format(error=e))
+            self.is_recording = False
+            self.system_on = False
+            self.update_toggle_button_style(self.system_button, False)
+            self._discard_session()
+            self._update_status_display(current_status="status_error")
         except Exception as e:
             QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("error_record_start", "Kayıt başlatılamadı: {error}\n\nLütfen mikrofonunuzu kontrol edin ve bu uygulamanın ses aygıtına erişim izni olduğundan emin olun.").format(error=e))
             self.is_recording = False
             self.mic_on = False
+            self._discard_session()
             self._update_status_display(current_status="status_error")
 
-        pixmap = QPixmap(resource_path("icons/rec_basık.png"))
+        pixmap = self.assets.pixmap("icons/rec_basık.png")
         if not pixmap.isNull():
             self.rec_label.setPixmap(pixmap)
             
-    def callback(self, in_data, frame_count, time_info, status):
-        if self.is_recording and not self.is_paused:
-            self.frames.append(in_data)
-            return (in_data, pyaudio.paContinue)
-        else:
-            return (None, pyaudio.paContinue)
-
     def stop_recording(self):
         if not self.is_recording and (not self.playback_thread or not self.playback_thread.isRunning()):
             return
 
         if self.is_recording:
             self.is_recording = False
-            self.stream.stop_stream()
-            self.stream.close()
+            self.auto_paused = False
+            self.session.stop()
+            self.meter_timer.stop()
+            self.level_meter.reset()
             
-            if not self.frames:
-                QMessageBox.warning(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_no_audio_data", "Hiçbir ses verisi kaydedilmedi. Dosya oluşturulmadı."))
-                print("Kayıt verisi bulunamadı. Dosya oluşturulmadı.")
-            else:
-                counter = 1
-                file_extension = self.record_format
-                file_name_base = "rec"
-                file_name = f"{file_name_base}{counter}{file_extension}"
-                full_path = os.path.join(self.record_path, file_name)
-                
-                while os.path.exists(full_path):
-                    counter += 1
-                    file_name = f"{file_name_base}{counter}{file_extension}"
-                    full_path = os.path.join(self.record_path, file_name)
-
-                self._save_recording_to_path(full_path, file_extension)
-                self.add_record_to_table(full_path)
+            self._finalize_recording()
         
         if self.playback_thread and self.playback_thread.isRunning():
             self.playback_thread.is_playing = False
             self.playback_thread.quit()
             self.playback_thread.wait()
-            self.on_playback_finished(None)
+            self.on_playback_finished()
 
         self._update_status_display(current_status="status_ready")
         
-        pixmap = QPixmap(resource_path("icons/rec_normal.png"))
+        pixmap = self.assets.pixmap("icons/rec_normal.png")
         if not pixmap.isNull():
             self.rec_label.setPixmap(pixmap)
         
-        pixmap = QPixmap(resource_path("icons/pause_normal.png"))
+        self.assets.movie("icons/pause_basık_animated.gif").stop()
+        pixmap = self.assets.pixmap("icons/pause_normal.png")
         if not pixmap.isNull():
             self.pause_label.setPixmap(pixmap)
             self.is_paused = False
         
     def play_recording(self):
-        selected_row = self.table_widget.currentRow()
-        if selected_row == -1:
+        file_name = self._current_record_name()
+        if file_name is None:
             QMessageBox.information(self, self.translations.get("warning_title", "Uyarı"), self.translations.get("warning_select_recording", "Lütfen önce listeden bir kayıt seçin."))
             return
 
-        file_name = self.table_widget.item(selected_row, 0).text()
         full_path = os.path.join(self.record_path, file_name)
         
         if self.playback_thread and self.playback_thread.isRunning():
@@ -685,87 +1980,85 @@ class SoundRecorderApp(QMainWindow):
             if not os.path.exists(full_path):
                 QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("error_file_not_found", "Kaynak dosyası bulunamadı: '{filename}'").format(filename=file_name))
                 return
-            
-            # Farklı formatlarda oynatmayı sağlamak için pydub ile WAV'a dönüştür
-            audio_segment = AudioSegment.from_file(full_path)
-            temp_wav_path = os.path.splitext(full_path)[0] + "_temp.wav"
-            audio_segment.export(temp_wav_path, format="wav")
 
             self._update_status_display(current_status="status_playing")
             self.play_button.setDisabled(True)
-            self.play_button.setStyleSheet(f"""
-                QPushButton#play_button {{
-                    border-image: url({resource_path('icons/play_basık.png')}) 0 0 0 0 stretch stretch;
-                    border: none;
-                }}
-            """)
+            self._set_button_active(self.play_button, True)
             
-            self.playback_thread = PlaybackThread({'path': temp_wav_path})
-            self.playback_thread.finished.connect(lambda: self.on_playback_finished(temp_wav_path))
-            self.playback_thread.error.connect(lambda msg: self.on_playback_error(msg, temp_wav_path))
+            # WAV dosyaları doğrudan, diğer formatlar akış halinde çözülerek oynatılır.
+            self.playback_thread = PlaybackThread({'path': full_path}, self.audio_engine)
+            self.playback_thread.finished.connect(self.on_playback_finished)
+            self.playback_thread.error.connect(self.on_playback_error)
+            self.playback_thread.position_changed.connect(self.on_playback_position)
             self.playback_thread.start()
 
         except Exception as e:
             QMessageBox.critical(self, self.translations.get("error_title", "Hata"), self.translations.get("error_playback_start", "Oynatma başlatma sırasında bir hata oluştu: {error}").format(error=e))
-            self.on_playback_error(f"Oynatma başlatma sırasında bir hata oluştu: {e}", temp_wav_path if 'temp_wav_path' in locals() else None)
+            self.on_playback_error(f"Oynatma başlatma sırasında bir hata oluştu: {e}")
 
-    def on_playback_finished(self, temp_wav_path):
+    def on_playback_finished(self):
         self._update_status_display(current_status="status_ready")
+        self._reset_position_slider()
         self.play_button.setDisabled(False)
-        self.play_button.setStyleSheet(f"""
-            QPushButton#play_button {{
-                border-image: url({resource_path('icons/play_normal.png')}) 0 0 0 0 stretch stretch;
-            }}
-            QPushButton#play_button:hover {{
-                border-image: url({resource_path('icons/play_cursor.png')}) 0 0 0 0 stretch stretch;
-            }}
-            QPushButton#play_button:pressed {{
-                border-image: url({resource_path('icons/play_basık.png')}) 0 0 0 0 stretch stretch;
-            }}
-        """)
-        if temp_wav_path and os.path.exists(temp_wav_path):
-            os.remove(temp_wav_path)
-        print("Kayıt oynatma tamamlandı.")
+        self._set_button_active(self.play_button, False)
+        self.last_playback_metrics = self.playback_thread.metrics_snapshot()
+        self.write_metrics()
+        log.info("Kayıt oynatma tamamlandı", extra={"path": self.last_playback_metrics["path"],
+                                                     "first_sound_ms": self.last_playback_metrics["first_sound_ms"]})
 
-    def on_playback_error(self, message, temp_wav_path):
+    def on_playback_error(self, message):
         QMessageBox.critical(self, self.translations.get("playback_error_dialog_title", "Oynatma Hatası"), message)
         self._update_status_display(current_status="status_playback_error")
+        self._reset_position_slider()
         self.play_button.setDisabled(False)
-        self.play_button.setStyleSheet(f"""
-            QPushButton#play_button {{
-                border-image: url({resource_path('icons/play_normal.png')}) 0 0 0 0 stretch stretch;
-            }}
-            QPushButton#play_button:hover {{
-                border-image: url({resource_path('icons/play_cursor.png')}) 0 0 0 0 stretch stretch;
-            }}
-            QPushButton#play_button:pressed {{
-                border-image: url({resource_path('icons/play_basık.png')}) 0 0 0 0 stretch stretch;
-            }}
-        """)
-        if temp_wav_path and os.path.exists(temp_wav_path):
-            os.remove(temp_wav_path)
+        self._set_button_active(self.play_button, False)
 
     def toggle_pause(self, event):
         if not self.is_recording:
-            print("Kayıt aktif değil. Pause butonu kullanılamaz.")
+            log.debug("Kayıt aktif değil. Pause butonu kullanılamaz.")
             return
 
-        self.is_paused = not self.is_paused
-        
+        if self.auto_paused:
+            # Otomatik duraklatma sırasında basılırsa elle duraklatmaya dönüşür.
+            self.auto_paused = False
+        else:
+            self.is_paused = not self.is_paused
+        if self.is_paused:
+            self.session.pause()
+        else:
+            self.session.resume()
+        self._show_pause_state()
+
+    def _show_pause_state(self):
+        pause_movie = self.assets.movie("icons/pause_basık_animated.gif")
         if self.is_paused:
             self._update_status_display(current_status="status_paused")
-            pause_movie = QMovie(resource_path("icons/pause_basık_animated.gif"))
             if pause_movie.isValid():
                 self.pause_label.setMovie(pause_movie)
                 pause_movie.start()
         else:
             self._update_status_display(current_status="status_recording")
-            pixmap = QPixmap(resource_path("icons/pause_normal.png"))
+            pause_movie.stop()
+            pixmap = self.assets.pixmap("icons/pause_normal.png")
             if not pixmap.isNull():
                 self.pause_label.setPixmap(pixmap)
             
+def report_startup_benchmark(window, imports_done, window_created):
+    """--startup-benchmark: açılış aşamalarının süresini (ms) JSON olarak yazdırır ve uygulamayı kapatır."""
+    now = time.perf_counter()
+    print(json.dumps({"imports_ms": round((imports_done - STARTUP_TIME) * 1000, 1),
+                      "window_created_ms": round((window_created - STARTUP_TIME) * 1000, 1),
+                      "first_paint_ms": round((window.first_paint_time - STARTUP_TIME) * 1000, 1),
+                      "deferred_assets_ms": round((now - STARTUP_TIME) * 1000, 1)}), flush=True)
+    window.close()
+
 if __name__ == '__main__':
+    imports_done = time.perf_counter()
+    configure_logging()
     app = QApplication(sys.argv)
     ex = SoundRecorderApp()
+    if "--startup-benchmark" in sys.argv[1:]:
+        window_created = time.perf_counter()
+        ex.deferred_assets_loaded.connect(lambda: report_startup_benchmark(ex, imports_done, window_created))
     ex.show()
     sys.exit(app.exec_())
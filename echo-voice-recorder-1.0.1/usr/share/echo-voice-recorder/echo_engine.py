@@ -0,0 +1,2321 @@
+#!/usr/bin/env python3
+"""
+Echo Ses Kaydedici'nin arayüzden bağımsız kayıt ve kodlama motoru.
+Hem pencereli uygulama hem de başsız (--headless) mod tarafından kullanılır; PyQt5 içe aktarılmaz.
+"""
+
+import os
+import wave
+import shutil
+import json
+import threading
+import subprocess
+import mmap
+import struct
+import re
+import collections
+import hashlib
+import fcntl
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+
+from echo_metrics import RecordingMetrics
+from echo_portaudio import pyaudio, HAVE_PYAUDIO
+
+log = logging.getLogger("echo.engine")
+
+# Ham PCM verisinin ffmpeg'e hangi biçimde verileceği (örnek genişliğine göre).
+PCM_INPUT_FORMATS = {1: "u8", 2: "s16le", 3: "s24le", 4: "s32le"}
+
+# Kayıt formatlarına göre ffmpeg çıkış ayarları.
+ENCODER_OUTPUT_ARGS = {
+    ".mp3": ["-f", "mp3"],
+    ".flac": ["-f", "flac"],
+    ".ogg": ["-f", "ogg"],
+    ".aac": ["-c:a", "aac", "-f", "adts"],
+}
+
+# Toplu dönüştürmede kullanılabilecek hedef formatlar; WAV da dahildir.
+TRANSCODE_OUTPUT_ARGS = {".wav": ["-f", "wav"], **ENCODER_OUTPUT_ARGS}
+
+# Kayıt profilleri: küçük tamponlar düşük gecikme, büyük tamponlar daha az geri çağrı ve daha düşük CPU yükü sağlar.
+CAPTURE_PROFILES = {
+    "low_latency": {"rate": 48000, "channels": 1, "bit_depth": 16, "chunk": 256},
+    "standard": {"rate": 44100, "channels": 1, "bit_depth": 16, "chunk": 1024},
+    "high_throughput": {"rate": 48000, "channels": 2, "bit_depth": 24, "chunk": 8192},
+}
+
+BIT_DEPTH_FORMATS = {16: pyaudio.paInt16, 24: pyaudio.paInt24, 32: pyaudio.paInt32}
+
+def resolve_capture_profile(profile):
+    """
+    Profil ayarlarını (FORMAT, CHANNELS, RATE, CHUNK) dörtlüsüne çevirir.
+    Bozuk bir profilde standart profil kullanılır.
+    """
+    try:
+        return (BIT_DEPTH_FORMATS[int(profile["bit_depth"])], int(profile["channels"]),
+                int(profile["rate"]), int(profile["chunk"]))
+    except (KeyError, ValueError, TypeError) as e:
+        log.warning("Kayıt profili geçersiz, standart profil kullanılıyor: %s", e)
+        return resolve_capture_profile(CAPTURE_PROFILES["standard"])
+
+def find_ffmpeg():
+    """Sistemde kurulu ffmpeg (veya avconv) programının yolunu döndürür."""
+    return shutil.which("ffmpeg") or shutil.which("avconv")
+
+class WavFileSink:
+    """Ham PCM verisini doğrudan bir WAV dosyasına yazar."""
+    def __init__(self, path, channels, sample_width, rate):
+        self.path = path
+        self._wf = wave.open(path, 'wb')
+        self._wf.setnchannels(channels)
+        self._wf.setsampwidth(sample_width)
+        self._wf.setframerate(rate)
+
+    def write(self, data):
+        # Başlık her parçada değil, yalnızca kapanışta güncellenir.
+        self._wf.writeframesraw(data)
+
+    def close(self):
+        # close() veri uzunluğunu WAV başlığına işler.
+        self._wf.close()
+
+# Günlüklü WAV kayıtlarının başlık boyutu. 'fmt ' bölümünden önce 28 baytlık bir JUNK bölümü ayrılır;
+# kayıt 4 GB'ı aşarsa bu alan RF64'ün ds64 bölümüne dönüştürülür ve veri yerinden oynamaz.
+WAV_HEADER_SIZE = 80
+RIFF_SIZE_LIMIT = 0xFFFFFFFF
+
+def build_wav_header(channels, sample_width, rate, data_size):
+    """PCM WAV başlığını oluşturur; veri RIFF sınırını aşıyorsa RF64 başlığı döndürür."""
+    block_align = channels * sample_width
+    fmt = b'fmt ' + struct.pack('<IHHIIHH', 16, 1, channels, rate, rate * block_align, block_align, sample_width * 8)
+    riff_size = WAV_HEADER_SIZE - 8 + data_size
+    if riff_size <= RIFF_SIZE_LIMIT:
+        return (b'RIFF' + struct.pack('<I', riff_size) + b'WAVE'
+                + b'JUNK' + struct.pack('<I', 28) + bytes(28)
+                + fmt + b'data' + struct.pack('<I', data_size))
+    return (b'RF64' + struct.pack('<I', RIFF_SIZE_LIMIT) + b'WAVE'
+            + b'ds64' + struct.pack('<IQQQI', 28, riff_size, data_size, data_size // block_align, 0)
+            + fmt + b'data' + struct.pack('<I', RIFF_SIZE_LIMIT))
+
+def _boot_id():
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _process_start_time(pid):
+    """
+    Sürecin açılıştan bu yana başlama zamanını (/proc/<pid>/stat 22. alan) döndürür.
+    Aynı PID'yi sonradan alan başka bir süreci ayırt etmek için kullanılır; okunamazsa None.
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # Komut adı boşluk ve parantez içerebilir; alanlar son ')' karakterinden sonra 3. alandan başlar.
+    fields = stat[stat.rfind(")") + 2:].split()
+    try:
+        return int(fields[22 - 3])
+    except (IndexError, ValueError):
+        return None
+
+class SessionJournal:
+    """
+    Günlüklü bir kaydın günlüğü: hedef dosya, ses biçimi, yazılmakta olan ara dosya ve diske işlendiği
+    kesinleşen son veri boyutu. Ayar dizinindeki sessions/ klasöründe küçük bir JSON dosyası olarak tutulur.
+    Kayıt düzgün biterse silinir; açılışta hâlâ duruyorsa kayıt yarım kalmıştır ve recover() ile kurtarılır.
+    """
+    def __init__(self, journal_path, data):
+        self.journal_path = journal_path
+        self.data = data
+
+    @classmethod
+    def create(cls, journal_dir, target_path, channels, sample_width, rate, recover_path=None):
+        os.makedirs(journal_dir, exist_ok=True)
+        name = f"{os.getpid()}-{time.time_ns()}.json"
+        journal = cls(os.path.join(journal_dir, name), {
+            "target": target_path,
+            # Çökmeden sonra kurtarılan dosyanın adı; ara WAV dosyası kullanılan kayıtlarda hedeften farklıdır.
+            "recover_path": recover_path or target_path,
+            "partial": target_path + ".partial",
+            "synced_size": 0,
+            "channels": channels,
+            "sample_width": sample_width,
+            "rate": rate,
+            "pid": os.getpid(),
+            "start_time": _process_start_time(os.getpid()),
+            "boot_id": _boot_id(),
+        })
+        journal.save()
+        return journal
+
+    @classmethod
+    def load(cls, journal_path):
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            return cls(journal_path, json.load(f))
+
+    def save(self):
+        """Günlüğü geçici bir dosyaya yazıp atomik olarak yerine taşır."""
+        temp_file = self.journal_path + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.journal_path)
+
+    def mark_synced(self, data_size):
+        """Diske işlenen veri boyutunu günlüğe işler."""
+        self.data["synced_size"] = data_size
+        self.save()
+
+    def owner_alive(self):
+        """
+        Günlüğü yazan süreç hâlâ çalışıyor mu? (ör. aynı anda açık başsız mod)
+        PID'nin yaşaması yetmez: çökmeden sonra aynı PID başka bir sürece verilmiş olabilir,
+        bu yüzden sürecin başlama zamanı da günlüktekiyle karşılaştırılır.
+        """
+        if self.data.get("boot_id") != _boot_id():
+            return False
+        pid = self.data.get("pid")
+        if pid is None:
+            return False
+        if pid != os.getpid():
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return False
+            except PermissionError:
+                pass
+            except TypeError:
+                return False
+        saved_start_time = self.data.get("start_time")
+        start_time = _process_start_time(pid)
+        if saved_start_time is not None and start_time is not None and start_time != saved_start_time:
+            log.info("Günlüğün sahibi olan süreç sonlanmış, PID başka bir sürece verilmiş",
+                     extra={"journal": self.journal_path, "pid": pid})
+            return False
+        return True
+
+    def recover(self, target_path=None):
+        """
+        Ara dosyanın başlığını düzeltip hedefe taşır ve günlüğü siler; ses verisi okunmaz ya da kopyalanmaz.
+        Süreç aynı açılışta çöktüyse dosyadaki tüm veri çekirdekte durduğu için korunur. Bilgisayar yeniden
+        başladıysa (ör. elektrik kesintisi) diske işlendiği kesin olmayan kısım atılır ve dosya günlükteki son
+        boyuta kısaltılır. Kurtarılan dosyanın yolunu, kurtarılacak veri yoksa None döndürür.
+        """
+        # Yarıda kesilen bir kurtarma, günlüğe işlenen aynı hedefle tamamlanır.
+        target_path = self.data.get("recovered_path") or target_path or self.data["target"]
+        partial_path = self.data["partial"]
+        if not os.path.exists(partial_path):
+            # Ara dosya önceki kurtarmada hedefe taşınmış ya da hiç oluşmamış.
+            recovered = self.data.get("recovered_path") is not None and os.path.exists(target_path)
+            os.remove(self.journal_path)
+            return target_path if recovered else None
+
+        frame_size = self.data["channels"] * self.data["sample_width"]
+        data_size = max(0, os.path.getsize(partial_path) - WAV_HEADER_SIZE)
+        if self.data.get("boot_id") is None or self.data.get("boot_id") != _boot_id():
+            data_size = min(data_size, self.data["synced_size"])
+        data_size -= data_size % frame_size
+        if data_size == 0:
+            os.remove(partial_path)
+            os.remove(self.journal_path)
+            return None
+
+        self.data["recovered_path"] = target_path
+        self.save()
+        with open(partial_path, 'r+b') as f:
+            f.truncate(WAV_HEADER_SIZE + data_size)
+            f.write(build_wav_header(self.data["channels"], self.data["sample_width"], self.data["rate"], data_size))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(partial_path, target_path)
+        os.remove(self.journal_path)
+        return target_path
+
+class JournaledWavSink:
+    """
+    Ham PCM verisini tek bir, sürekli büyüyen WAV dosyasına yazar; program çökse ya da elektrik kesilse de kayıt kaybolmaz.
+    Kayıt süresince veri hedefin yanındaki .partial dosyasına yazılır. Birkaç saniyede bir RIFF/RF64 boyutları
+    güncellenir, dosya diske işlenir ve kesinleşen boyut SessionJournal'a yazılır. Kapanışta yalnızca başlık
+    güncellenip dosya yeniden adlandırılır; durdurma süresi kaydın uzunluğundan bağımsızdır.
+    """
+    SYNC_SECONDS = 2
+
+    def __init__(self, path, channels, sample_width, rate, journal_dir, recover_path=None):
+        self.path = path
+        self.channels = channels
+        self.sample_width = sample_width
+        self.rate = rate
+        self._sync_interval = self.SYNC_SECONDS * rate * channels * sample_width
+        self.journal = SessionJournal.create(journal_dir, path, channels, sample_width, rate, recover_path)
+        self._file = open(self.journal.data["partial"], 'wb')
+        self._file.write(build_wav_header(channels, sample_width, rate, 0))
+        self._data_size = 0
+        self._unsynced = 0
+
+    def _sync(self):
+        """Başlığı o ana kadar yazılan veriye göre günceller, dosyayı diske işler ve boyutu günlüğe yazar."""
+        self._file.seek(0)
+        self._file.write(build_wav_header(self.channels, self.sample_width, self.rate, self._data_size))
+        self._file.seek(0, os.SEEK_END)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self.journal.mark_synced(self._data_size)
+
+    def write(self, data):
+        self._file.write(data)
+        self._data_size += len(data)
+        self._unsynced += len(data)
+        if self._unsynced >= self._sync_interval:
+            self._sync()
+
+    def close(self):
+        self._file.seek(0)
+        self._file.write(build_wav_header(self.channels, self.sample_width, self.rate, self._data_size))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self.journal.data["partial"], self.path)
+        os.remove(self.journal.journal_path)
+
+def recover_sessions(journal_dir):
+    """
+    Önceki çalışmada yarım kalan günlüklü kayıtları kurtarır ve kurtarılan dosya yollarını döndürür.
+    Başka bir çalışan örneğe (ör. başsız mod) ait günlüklere dokunulmaz.
+    """
+    recovered = []
+    try:
+        names = sorted(name for name in os.listdir(journal_dir) if name.endswith(".json"))
+    except OSError:
+        return recovered
+    for name in names:
+        journal_path = os.path.join(journal_dir, name)
+        try:
+            journal = SessionJournal.load(journal_path)
+            if journal.owner_alive():
+                continue
+            recover_path = journal.data.get("recovered_path") or journal.data["recover_path"]
+            if os.path.exists(recover_path) and "recovered_path" not in journal.data:
+                recover_path = conversion_destination(os.path.dirname(recover_path), recover_path, os.path.splitext(recover_path)[1])
+            path = journal.recover(recover_path)
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as e:
+            log.error("Yarım kalan kayıt kurtarılamadı: %s", e, extra={"journal": journal_path})
+            continue
+        if path:
+            log.info("Yarım kalan kayıt kurtarıldı", extra={"path": path})
+            recovered.append(path)
+    return recovered
+
+class EncoderSink:
+    """
+    Ham PCM verisini bir boru üzerinden sürekli çalışan ffmpeg sürecine aktarır.
+    Kodlama kayıt sırasında yapıldığı için durdurma süresi kaydın uzunluğuna bağlı değildir.
+    """
+    def __init__(self, path, format, channels, sample_width, rate, ffmpeg_path):
+        self.path = path
+        command = [ffmpeg_path, "-hide_banner", "-loglevel", "error", "-y",
+                   "-f", PCM_INPUT_FORMATS[sample_width],
+                   "-ar", str(rate),
+                   "-ac", str(channels),
+                   "-i", "pipe:0",
+                   *ENCODER_OUTPUT_ARGS[format.lower()],
+                   path]
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    def write(self, data):
+        self._process.stdin.write(data)
+
+    def close(self):
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass
+        error_output = self._process.stderr.read().decode(errors="replace").strip()
+        if self._process.wait() != 0:
+            raise RuntimeError(f"ffmpeg kodlama hatası: {error_output}")
+
+class RingBuffer:
+    """
+    Ses aygıtı geri çağrısı ile okuyucular (disk yazıcısı, kodlayıcı vb.) arasında
+    önceden ayrılmış, sabit kapasiteli bir halka tampon.
+    Geri çağrı yalnızca bayt kopyalar; bellek ayırmaz. Taşma ve boşalma sayaçları
+    kaybolan sesin fark edilmesini sağlar.
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._read_pos = 0
+        self._write_pos = 0
+        self._fill = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+
+        self.overruns = 0        # Tampon dolu olduğu için atılan parça sayısı
+        self.dropped_bytes = 0   # Atılan toplam bayt
+        self.underruns = 0       # Okuyucunun zaman aşımına kadar veri alamadığı durum sayısı
+        self.max_fill = 0        # Kayıt boyunca tamponda biriken en fazla bayt
+
+    def fill_level(self):
+        """Tamponda okunmayı bekleyen bayt sayısını döndürür."""
+        return self._fill
+
+    def write(self, data):
+        """
+        Veriyi tampona kopyalar. Ses aygıtı iş parçacığından çağrılır ve asla beklemez;
+        yer yoksa parça atılır ve taşma sayacı artırılır.
+        """
+        size = len(data)
+        with self._condition:
+            if size > self.capacity - self._fill:
+                self.overruns += 1
+                self.dropped_bytes += size
+                return False
+
+            source = memoryview(data)
+            first = min(size, self.capacity - self._write_pos)
+            self._view[self._write_pos:self._write_pos + first] = source[:first]
+            if first < size:
+                self._view[0:size - first] = source[first:]
+            self._write_pos = (self._write_pos + size) % self.capacity
+            self._fill += size
+            if self._fill > self.max_fill:
+                self.max_fill = self._fill
+            self._condition.notify()
+        return True
+
+    def read(self, max_bytes, timeout=0.5):
+        """
+        En fazla max_bytes kadar veriyi okur. Veri yoksa zaman aşımına kadar bekler.
+        Tampon kapatılmış ve boşsa boş bayt dizisi döndürür.
+        """
+        with self._condition:
+            if self._fill == 0 and not self._closed:
+                if not self._condition.wait_for(lambda: self._fill or self._closed, timeout):
+                    self.underruns += 1
+                    return None
+            if self._fill == 0:
+                return b""
+
+            size = min(max_bytes, self._fill)
+            first = min(size, self.capacity - self._read_pos)
+            data = bytes(self._view[self._read_pos:self._read_pos + first])
+            if first < size:
+                data += bytes(self._view[0:size - first])
+            self._read_pos = (self._read_pos + size) % self.capacity
+            self._fill -= size
+        return data
+
+    def stats(self):
+        """Doluluk ve taşma sayaçlarının anlık görüntüsü."""
+        return {"fill": self._fill, "max_fill": self.max_fill, "capacity": self.capacity,
+                "overruns": self.overruns, "underruns": self.underruns, "dropped_bytes": self.dropped_bytes}
+
+    def close(self):
+        """Yazmanın bittiğini bildirir; okuyucular kalan veriyi tükettikten sonra durur."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+def pcm_to_float32(data, sample_width):
+    """Ham PCM baytlarını -1.0 ile 1.0 arasında float32 NumPy dizisine çevirir."""
+    if sample_width == 1:
+        return (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    if sample_width == 2:
+        return np.frombuffer(data, dtype='<i2').astype(np.float32) / 32768.0
+    if sample_width == 3:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+        samples = (raw[:, 0].astype(np.int32) | (raw[:, 1].astype(np.int32) << 8) | (raw[:, 2].astype(np.int32) << 16))
+        samples = np.where(samples & 0x800000, samples - 0x1000000, samples)
+        return samples.astype(np.float32) / 8388608.0
+    return np.frombuffer(data, dtype='<i4').astype(np.float32) / 2147483648.0
+
+def float32_to_pcm(samples, sample_width):
+    """-1.0 ile 1.0 arasındaki float32 örnekleri ham PCM baytlarına çevirir (pcm_to_float32'nin tersi)."""
+    samples = np.clip(samples, -1.0, 1.0)
+    if sample_width == 1:
+        return (samples * 127.0 + 128.0).astype(np.uint8).tobytes()
+    if sample_width == 2:
+        return (samples * 32767.0).astype('<i2').tobytes()
+    if sample_width == 3:
+        ints = (samples * 8388607.0).astype('<i4')
+        return ints.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    return (samples.astype(np.float64) * 2147483647.0).astype('<i4').tobytes()
+
+class SourceGain:
+    """
+    Tek kaynaklı kayıtlarda (yalnızca mikrofon ya da yalnızca sistem sesi) kaynağın kazancını uygular.
+    İki kaynak birlikte kaydedilirken kazançları SourceMixer uygular.
+    """
+    def __init__(self, sample_width, gain):
+        self.sample_width = sample_width
+        self.gain = gain
+
+    def __call__(self, data):
+        return float32_to_pcm(pcm_to_float32(data, self.sample_width) * self.gain, self.sample_width)
+
+class LevelAnalyzer:
+    """
+    Kaydedilen parçaların RMS ve tepe seviyelerini NumPy ile hesaplar.
+    Yazıcı iş parçacığında çalışır; arayüz sonuçları kendi hızında okur.
+    """
+    def __init__(self, sample_width):
+        self.sample_width = sample_width
+        self._lock = threading.Lock()
+        self._peak = 0.0
+        self._sum_squares = 0.0
+        self._count = 0
+
+    def __call__(self, data):
+        samples = pcm_to_float32(data, self.sample_width)
+        if not samples.size:
+            return
+        peak = float(np.max(np.abs(samples)))
+        sum_squares = float(np.dot(samples, samples))
+        with self._lock:
+            self._peak = max(self._peak, peak)
+            self._sum_squares += sum_squares
+            self._count += samples.size
+
+    def read_levels(self):
+        """Son okumadan bu yana ölçülen (RMS, tepe) değerlerini döndürür ve sayaçları sıfırlar."""
+        with self._lock:
+            rms = (self._sum_squares / self._count) ** 0.5 if self._count else 0.0
+            peak = self._peak
+            self._peak = 0.0
+            self._sum_squares = 0.0
+            self._count = 0
+        return rms, peak
+
+class PeakPyramid:
+    """
+    Dalga formu için çok çözünürlüklü en küçük/en büyük tepe dizileri.
+    0. seviyede her değer BLOCK_SIZE karelik bir bloğu, her üst seviye ise alttakinin LEVEL_FACTOR bloğunu özetler.
+    Değerler -127..127 aralığında int8 olarak saklanır.
+    """
+    BLOCK_SIZE = 256
+    LEVEL_FACTOR = 4
+
+    def __init__(self, levels, rate):
+        self.levels = levels
+        self.rate = rate
+
+    @classmethod
+    def from_base(cls, base_min, base_max, rate):
+        levels = [(base_min, base_max)]
+        while len(levels[-1][0]) > 1:
+            level_min, level_max = levels[-1]
+            padding = -len(level_min) % cls.LEVEL_FACTOR
+            if padding:
+                level_min = np.concatenate([level_min, np.repeat(level_min[-1:], padding)])
+                level_max = np.concatenate([level_max, np.repeat(level_max[-1:], padding)])
+            levels.append((level_min.reshape(-1, cls.LEVEL_FACTOR).min(axis=1),
+                           level_max.reshape(-1, cls.LEVEL_FACTOR).max(axis=1)))
+        return cls(levels, rate)
+
+    def block_count(self):
+        return len(self.levels[0][0])
+
+    def duration(self):
+        return self.block_count() * self.BLOCK_SIZE / float(self.rate) if self.rate else 0.0
+
+class PeakBuilder:
+    """
+    Gelen PCM parçalarından 0. seviye tepe bloklarını biriktirir.
+    Kayıt sırasında yazıcıya bağlanarak ya da mevcut bir dosya okunurken kullanılır.
+    """
+    def __init__(self, sample_width, channels, rate):
+        self.sample_width = sample_width
+        self.channels = channels
+        self.rate = rate
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._mins = []
+        self._maxs = []
+
+    def __call__(self, data):
+        samples = pcm_to_float32(data, self.sample_width)
+        if self.channels > 1:
+            samples = samples[:len(samples) - len(samples) % self.channels].reshape(-1, self.channels).mean(axis=1)
+        if self._pending.size:
+            samples = np.concatenate([self._pending, samples])
+
+        usable = len(samples) - len(samples) % PeakPyramid.BLOCK_SIZE
+        self._pending = samples[usable:].copy()
+        if usable:
+            blocks = samples[:usable].reshape(-1, PeakPyramid.BLOCK_SIZE)
+            self._mins.append(self._quantize(blocks.min(axis=1)))
+            self._maxs.append(self._quantize(blocks.max(axis=1)))
+
+    @staticmethod
+    def _quantize(values):
+        return np.clip(np.round(values * 127.0), -127, 127).astype(np.int8)
+
+    def build(self):
+        mins = list(self._mins)
+        maxs = list(self._maxs)
+        if self._pending.size:
+            mins.append(self._quantize(self._pending.min(keepdims=True)))
+            maxs.append(self._quantize(self._pending.max(keepdims=True)))
+        if not mins:
+            return None
+        return PeakPyramid.from_base(np.concatenate(mins), np.concatenate(maxs), self.rate)
+
+class PeakCache:
+    """
+    Tepe piramitlerini kayıt dizininin yanında (~/.EchoVoiceRecorder/peaks) saklar.
+    Önbellek, kaynak dosyanın (değiştirilme zamanı, boyut) bilgisiyle doğrulanır. Dosya adı mutlak yolun
+    özetinden türetilir; farklı klasörlerdeki aynı adlı kayıtlar (ör. iki klasörde rec1.WAV) birbirini silmez.
+    """
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _path_for(self, source_path):
+        digest = hashlib.sha1(os.path.abspath(source_path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".peaks.npz")
+
+    def load(self, source_path):
+        cache_path = self._path_for(source_path)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            stat = os.stat(source_path)
+            with np.load(cache_path) as data:
+                mtime, size = data["source"]
+                if mtime != stat.st_mtime or size != stat.st_size:
+                    return None
+                rate, level_count = (int(value) for value in data["info"])
+                levels = [(data[f"min{i}"], data[f"max{i}"]) for i in range(level_count)]
+            return PeakPyramid(levels, rate)
+        except (OSError, ValueError, KeyError) as e:
+            log.warning("Dalga formu önbelleği okunamadı: %s", e)
+            return None
+
+    def save(self, source_path, pyramid):
+        cache_path = self._path_for(source_path)
+        temp_path = cache_path + ".tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            stat = os.stat(source_path)
+            arrays = {"source": np.array([stat.st_mtime, stat.st_size], dtype=np.float64),
+                      "info": np.array([pyramid.rate, len(pyramid.levels)], dtype=np.int64)}
+            for i, (level_min, level_max) in enumerate(pyramid.levels):
+                arrays[f"min{i}"] = level_min
+                arrays[f"max{i}"] = level_max
+            with open(temp_path, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            log.warning("Dalga formu önbelleği kaydedilemedi: %s", e)
+
+class VoiceActivityGate:
+    """
+    Enerji ve sıfır geçiş oranına dayalı ses etkinliği algılayıcı (VAD).
+    Yazıcı iş parçacığında, yazılacak veriyi süzer: sessiz bloklar atılır,
+    konuşma bittikten sonra kısa bir süre (hangover) kayıt sürdürülür ve konuşma
+    başlamadan önceki kısa bölüm (pre-roll) kaybolmasın diye tamponda tutulur.
+    Atlanan bölümler, kaynak zaman çizelgesindeki başlangıç/bitiş ve kayıttaki konumlarıyla listelenir.
+    drop=False ile (otomatik duraklatma) hiçbir blok atılmaz; yalnızca is_silent durumu güncellenir.
+    """
+    BLOCK_SECONDS = 0.02
+    HANGOVER_SECONDS = 0.5
+    PRE_ROLL_SECONDS = 0.3
+    MIN_THRESHOLD_DB = -50.0      # Gürültü tabanı ne kadar düşük olursa olsun eşik bunun altına inmez
+    THRESHOLD_MARGIN_DB = 12.0    # Konuşma sayılması için gürültü tabanının üzerinde olması gereken fark
+    ZCR_THRESHOLD = 0.25          # Sürtünmeli ünsüzler (s, ş, f) gibi zayıf ama sık sıfır geçişli sesler için
+    ZCR_MARGIN_DB = 10.0
+    NOISE_FLOOR_RISE = 0.002      # Gürültü tabanı yavaşça yükselir, anında düşer
+
+    def __init__(self, sample_width, channels, rate, drop=True):
+        self.sample_width = sample_width
+        self.channels = channels
+        self.rate = rate
+        self.drop = drop
+        self.block_frames = max(1, int(rate * self.BLOCK_SECONDS))
+        self.block_bytes = self.block_frames * sample_width * channels
+        self.noise_floor_db = -60.0
+        self.is_silent = True
+        # (başlangıç, bitiş, kayıttaki konum) çerçeve cinsinden
+        self.spans = []
+        self._pending = b""
+        self._pre_roll = collections.deque(maxlen=max(1, round(self.PRE_ROLL_SECONDS / self.BLOCK_SECONDS)))
+        self._hangover_blocks = round(self.HANGOVER_SECONDS / self.BLOCK_SECONDS)
+        self._hangover = 0
+        self._input_frames = 0
+        self._output_frames = 0
+        self._skip_start = None
+
+    def _is_active(self, block):
+        samples = pcm_to_float32(block, self.sample_width)
+        rms = float(np.sqrt(np.mean(samples * samples)))
+        level_db = 20.0 * np.log10(max(rms, 1e-9))
+        channel = samples[::self.channels]
+        zero_crossing_rate = float(np.mean(np.signbit(channel[1:]) != np.signbit(channel[:-1]))) if len(channel) > 1 else 0.0
+
+        threshold = max(self.MIN_THRESHOLD_DB, self.noise_floor_db + self.THRESHOLD_MARGIN_DB)
+        active = level_db > threshold or (zero_crossing_rate > self.ZCR_THRESHOLD and level_db > threshold - self.ZCR_MARGIN_DB)
+
+        if level_db < self.noise_floor_db:
+            self.noise_floor_db = level_db
+        else:
+            self.noise_floor_db += (level_db - self.noise_floor_db) * self.NOISE_FLOOR_RISE
+        return active
+
+    def __call__(self, data):
+        """Gelen veriyi bloklar hâlinde değerlendirir ve yazılması gereken baytları döndürür."""
+        incoming = data
+        data = self._pending + bytes(data)
+        usable = len(data) - len(data) % self.block_bytes
+        self._pending = data[usable:]
+        output = []
+        for offset in range(0, usable, self.block_bytes):
+            block = data[offset:offset + self.block_bytes]
+            position = self._input_frames
+            self._input_frames += self.block_frames
+
+            if self._is_active(block):
+                self._hangover = self._hangover_blocks
+            elif self._hangover:
+                self._hangover -= 1
+            else:
+                self.is_silent = True
+                if self.drop:
+                    if len(self._pre_roll) == self._pre_roll.maxlen and self._skip_start is None:
+                        self._skip_start = self._pre_roll[0][0]
+                    self._pre_roll.append((position, block))
+                continue
+
+            if not self.drop:
+                self.is_silent = False
+                continue
+            if self.is_silent:
+                self._close_span(self._pre_roll[0][0] if self._pre_roll else position)
+                for _, pre_roll_block in self._pre_roll:
+                    output.append(pre_roll_block)
+                self._output_frames += len(self._pre_roll) * self.block_frames
+                self._pre_roll.clear()
+                self.is_silent = False
+            output.append(block)
+            self._output_frames += self.block_frames
+        return b"".join(output) if self.drop else incoming
+
+    def _close_span(self, end):
+        if self._skip_start is not None and end > self._skip_start:
+            self.spans.append((self._skip_start, end, self._output_frames))
+        self._skip_start = None
+
+    def finish(self):
+        """Kayıt sonunda hâlâ sessizlikteyse son atlanan bölümü kapatır."""
+        if self.is_silent and self._pre_roll and self._skip_start is None:
+            self._skip_start = self._pre_roll[0][0]
+        self._pre_roll.clear()
+        self._close_span(self._input_frames)
+
+    def save_spans(self, path):
+        """Atlanan bölümleri saniye cinsinden bir JSON dosyasına yazar."""
+        spans = [{"start": round(start / self.rate, 3),
+                  "end": round(end / self.rate, 3),
+                  "position": round(position / self.rate, 3)} for start, end, position in self.spans]
+        temp_path = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temp_path, 'w') as f:
+                json.dump({"skipped": spans}, f, indent=4)
+            os.replace(temp_path, path)
+        except OSError as e:
+            log.warning("Atlanan bölümler dizini kaydedilemedi: %s", e)
+
+class RecordingWriter(threading.Thread):
+    """
+    Halka tampondaki ses verisini kayıt sürerken arka planda bir hedefe (WAV dosyası veya kodlayıcı) yazar.
+    Böylece bellek kullanımı kaydın uzunluğundan bağımsız olarak sabit kalır.
+    """
+    def __init__(self, ring_buffer, sink, frame_size, read_size=65536, taps=(), upstream=None, gate=None, input_taps=(), gain=None):
+        super().__init__(daemon=True)
+        self.ring_buffer = ring_buffer
+        self.sink = sink
+        # Sessiz bölümleri atan isteğe bağlı süzgeç (VoiceActivityGate); yazılmayan veri dokunuşlara da gitmez.
+        self.gate = gate
+        # Tampona yazan ara aşama (ör. karıştırıcı); bitişte önce o kapatılır, o da bu tamponu kapatır.
+        self.upstream = upstream
+        # Yazılan her parçayı ayrıca işleyen tüketiciler (ör. dalga formu); yazıcı iş parçacığında çalışırlar.
+        self.taps = list(taps)
+        # Süzgeçten önceki, gelen tüm sesi alan tüketiciler (ör. seviye ölçer); sessizlikte de ölü bir mikrofon fark edilir.
+        self.input_taps = list(input_taps)
+        # Veriye her şeyden önce uygulanan isteğe bağlı kaynak kazancı (SourceGain).
+        self.gain = gain
+        self.path = sink.path
+        self.frame_size = frame_size
+        self.read_size = read_size - read_size % frame_size
+        self.frames_written = 0
+        self.write_seconds = 0.0  # Hedefe yazmada (kodlayıcıyı beklerken) geçen toplam süre
+        self.error = None
+
+    def run(self):
+        while True:
+            data = self.ring_buffer.read(self.read_size)
+            if data is None:
+                continue
+            if not data:
+                break
+            if self.error:
+                continue
+            if self.gain is not None:
+                data = self.gain(data)
+            self._feed(self.input_taps, data)
+            if self.gate is not None:
+                data = self.gate(data)
+                if not data:
+                    continue
+            try:
+                started = time.perf_counter()
+                self.sink.write(data)
+                self.write_seconds += time.perf_counter() - started
+                self.frames_written += len(data) // self.frame_size
+            except Exception as e:
+                self.error = e
+            self._feed(self.taps, data)
+
+        if self.gate is not None:
+            self.gate.finish()
+        try:
+            self.sink.close()
+        except Exception as e:
+            self.error = self.error or e
+
+    def _feed(self, taps, data):
+        for tap in taps:
+            try:
+                tap(data)
+            except Exception as e:
+                log.error("Ses verisi işlenirken hata oluştu: %s", e)
+
+    def close_input(self):
+        """
+        Tampona yeni veri gelmeyeceğini beklemeden bildirir; yazıcı kalan veriyi yazmayı sürdürür.
+        Ara aşaması olan yazıcılarda tampon, ara aşama boşaldıktan sonra finish() tarafından kapatılır.
+        """
+        if self.upstream is None:
+            self.ring_buffer.close()
+
+    def finish(self):
+        """Tampondaki tüm veri yazılana kadar bekler ve hedefi kapatır."""
+        if self.upstream is not None:
+            self.upstream.finish()
+        self.ring_buffer.close()
+        if self.is_alive():
+            self.join()
+
+class MappedWavReader:
+    """
+    PCM WAV dosyasını belleğe eşleyerek (mmap) okur.
+    Herhangi bir konuma atlamak O(1)'dir ve okunan parçalar kopyalanmadan döndürülür.
+    wave modülünün okuma arayüzünü taklit eder.
+    """
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("WAV dosyası boş.")
+        self._view = memoryview(self._map)
+        try:
+            self._parse_header()
+        except Exception:
+            self.close()
+            raise
+        self._position = 0
+
+    def _parse_header(self):
+        # RF64: 4 GB'tan büyük kayıtlar; gerçek veri boyutu ds64 bölümünde bulunur.
+        if len(self._map) < 12 or self._map[0:4] not in (b'RIFF', b'RF64') or self._map[8:12] != b'WAVE':
+            raise ValueError("Geçerli bir WAV dosyası değil.")
+
+        fmt = None
+        rf64_data_size = None
+        offset = 12
+        while offset + 8 <= len(self._map):
+            chunk_id = self._map[offset:offset + 4]
+            chunk_size = struct.unpack_from('<I', self._map, offset + 4)[0]
+            body = offset + 8
+            if chunk_id == b'ds64':
+                rf64_data_size = struct.unpack_from('<Q', self._map, body + 8)[0]
+            elif chunk_id == b'fmt ':
+                fmt = struct.unpack_from('<HHIIHH', self._map, body)
+            elif chunk_id == b'data':
+                if rf64_data_size is not None and chunk_size == RIFF_SIZE_LIMIT:
+                    chunk_size = rf64_data_size
+                if fmt is None:
+                    raise ValueError("WAV dosyasında 'fmt' bölümü bulunamadı.")
+                # Başlığı güncellenmemiş (yarım kalmış) dosyalarda veri dosya sonuna kadar kabul edilir.
+                available = len(self._map) - body
+                if chunk_size == 0 or chunk_size > available:
+                    chunk_size = available
+                self._data_offset = body
+                self._data_size = chunk_size - chunk_size % fmt[4]
+                break
+            offset = body + chunk_size + (chunk_size & 1)
+        else:
+            raise ValueError("WAV dosyasında 'data' bölümü bulunamadı.")
+
+        audio_format, self._channels, self._rate, _, self._block_align, bits = fmt
+        if audio_format not in (1, 0xFFFE):
+            raise ValueError("Yalnızca PCM WAV dosyaları destekleniyor.")
+        self._sample_width = bits // 8
+        self._nframes = self._data_size // self._block_align
+
+    def getnchannels(self):
+        return self._channels
+
+    def getsampwidth(self):
+        return self._sample_width
+
+    def getframerate(self):
+        return self._rate
+
+    def getnframes(self):
+        return self._nframes
+
+    def tell(self):
+        return self._position
+
+    def setpos(self, position):
+        self._position = max(0, min(int(position), self._nframes))
+
+    def readframes(self, n):
+        start = self._data_offset + self._position * self._block_align
+        count = min(n, self._nframes - self._position)
+        self._position += count
+        return self._view[start:start + count * self._block_align]
+
+    def close(self):
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            # Dışarıda hâlâ kullanılan bir parça varsa eşleme çöp toplayıcıya bırakılır.
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+class FfmpegDecoder:
+    """
+    Sıkıştırılmış bir ses dosyasını ffmpeg ile parça parça ham PCM'e çözer.
+    wave modülünün okuma arayüzünü taklit eder; böylece dosyanın tamamı çözülmeden oynatma başlar.
+    Konum değiştirmek için ffmpeg istenen noktadan yeniden başlatılır.
+    """
+    def __init__(self, path, ffmpeg_path, channels=2, rate=44100, sample_width=2, nframes=0):
+        self.path = path
+        self.ffmpeg_path = ffmpeg_path
+        self.channels = channels
+        self.rate = rate
+        self.sample_width = sample_width
+        self.nframes = nframes
+        self._position = 0
+        self._process = None
+        self._start()
+
+    def _start(self):
+        command = [self.ffmpeg_path, "-hide_banner", "-loglevel", "error"]
+        if self._position:
+            command += ["-ss", f"{self._position / self.rate:.3f}"]
+        command += ["-i", self.path,
+                    "-f", PCM_INPUT_FORMATS[self.sample_width],
+                    "-ac", str(self.channels),
+                    "-ar", str(self.rate),
+                    "pipe:1"]
+        self._process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def getnchannels(self):
+        return self.channels
+
+    def getsampwidth(self):
+        return self.sample_width
+
+    def getframerate(self):
+        return self.rate
+
+    def getnframes(self):
+        """Toplam kare sayısı; bilinmiyorsa 0."""
+        return self.nframes
+
+    def tell(self):
+        return self._position
+
+    def setpos(self, position):
+        self._stop()
+        self._position = max(0, int(position))
+        self._start()
+
+    def readframes(self, n):
+        frame_size = self.channels * self.sample_width
+        data = self._process.stdout.read(n * frame_size)
+        if not data and self._process.wait() != 0:
+            error_output = self._process.stderr.read().decode(errors="replace").strip()
+            raise RuntimeError(f"ffmpeg çözme hatası: {error_output}")
+        self._position += len(data) // frame_size
+        return data
+
+    def _stop(self):
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.wait()
+        self._process.stdout.close()
+        self._process.stderr.close()
+
+    def close(self):
+        self._stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def open_audio_reader(path):
+    """
+    WAV dosyalarını belleğe eşleyerek, diğer formatları ise akış halinde çözerek okumak için açar.
+    """
+    ffmpeg_path = find_ffmpeg()
+    if os.path.splitext(path)[1].lower() == ".wav":
+        try:
+            return MappedWavReader(path)
+        except ValueError:
+            # PCM olmayan WAV dosyaları ffmpeg ile çözülebilir.
+            if not ffmpeg_path:
+                raise
+
+    if not ffmpeg_path:
+        raise RuntimeError("Bu formatı oynatmak için ffmpeg gereklidir.")
+
+    # Başlıktan okunabilen bilgilerle dosya kendi örnekleme hızında çözülür ve süresi bilinir.
+    metadata = probe_audio_header(path)
+    if metadata:
+        return FfmpegDecoder(path, ffmpeg_path,
+                             channels=min(metadata["channels"], 2) or 2,
+                             rate=metadata["rate"],
+                             nframes=int(metadata["duration"] * metadata["rate"]))
+    return FfmpegDecoder(path, ffmpeg_path)
+
+class BatchTranscoder:
+    """
+    Birden çok kaydı ffmpeg ile aynı anda başka bir biçime dönüştürür.
+    Her dosya ayrı bir ffmpeg sürecinde kodlanır; havuzdaki iş parçacıkları yalnızca bu süreçleri
+    bekler. Aynı anda çalışan süreç sayısı işlemci çekirdeği sayısıyla sınırlıdır.
+    """
+    def __init__(self, jobs, extension, ffmpeg_path, workers=None):
+        self.jobs = list(jobs)  # (kaynak, hedef) çiftleri
+        self.output_args = TRANSCODE_OUTPUT_ARGS[extension.lower()]
+        self.ffmpeg_path = ffmpeg_path
+        self.workers = workers or os.cpu_count() or 1
+        self._cancelled = threading.Event()
+        self._processes = set()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Bekleyen dönüşümleri atlar ve çalışan ffmpeg süreçlerini sonlandırır."""
+        with self._lock:
+            self._cancelled.set()
+            for process in self._processes:
+                process.kill()
+
+    def _convert(self, source_path, destination_path):
+        command = [self.ffmpeg_path, "-hide_banner", "-loglevel", "error", "-nostdin", "-y",
+                   "-i", source_path, "-vn",
+                   *self.output_args,
+                   destination_path]
+        with self._lock:
+            if self._cancelled.is_set():
+                return None
+            process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            self._processes.add(process)
+        try:
+            _, error_output = process.communicate()
+        finally:
+            with self._lock:
+                self._processes.discard(process)
+
+        if process.returncode != 0:
+            # Yarım kalan çıktı kütüphanede bozuk bir kayıt olarak görünmesin diye silinir.
+            if os.path.exists(destination_path):
+                os.remove(destination_path)
+            if self._cancelled.is_set():
+                return None
+            raise RuntimeError(f"ffmpeg dönüştürme hatası: {error_output.decode(errors='replace').strip()}")
+        return destination_path
+
+    def run(self, on_result):
+        """
+        Tüm dönüşümleri çalıştırır ve her dosya bittiğinde on_result(kaynak, hedef, hata) çağırır.
+        İptal edilen dosyalarda hedef ve hata None olur.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self._convert, source, destination): source for source, destination in self.jobs}
+            for future in as_completed(futures):
+                try:
+                    on_result(futures[future], future.result(), None)
+                except Exception as e:
+                    on_result(futures[future], None, str(e))
+
+def conversion_destination(directory, source_path, extension, reserved=()):
+    """
+    Dönüştürülen kayıt için hedef dizinde boş bir dosya yolu seçer: rec3.WAV -> rec3.flac,
+    bu ad doluysa rec3_1.flac, rec3_2.flac ...
+    """
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    destination = os.path.join(directory, stem + extension)
+    counter = 1
+    while os.path.exists(destination) or destination in reserved:
+        destination = os.path.join(directory, f"{stem}_{counter}{extension}")
+        counter += 1
+    return destination
+
+# Kayıt kütüphanesinde listelenen dosya uzantıları.
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".ogg", ".aac")
+
+# MPEG ses çerçevesi başlığı tabloları: bit hızları (kbit/s) ve örnekleme hızları.
+MPEG_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+MPEG_SAMPLE_RATES = {1: (44100, 48000, 32000), 2: (22050, 24000, 16000), 2.5: (11025, 12000, 8000)}
+ADTS_SAMPLE_RATES = (96000, 88200, 64000, 48000, 44100, 32000, 24000, 22050, 16000, 12000, 11025, 8000, 7350)
+
+def _skip_id3v2(f):
+    """Dosya başındaki ID3v2 etiketini atlar ve ses verisinin başladığı konumu döndürür."""
+    f.seek(0)
+    header = f.read(10)
+    if len(header) == 10 and header[:3] == b'ID3':
+        size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+        footer = 10 if header[5] & 0x10 else 0
+        return 10 + size + footer
+    return 0
+
+def _probe_wav(f):
+    """RIFF başlığındaki 'fmt ' ve 'data' bölümlerinden süreyi hesaplar."""
+    header = f.read(12)
+    if len(header) < 12 or header[:4] not in (b'RIFF', b'RF64') or header[8:12] != b'WAVE':
+        raise ValueError("Geçerli bir WAV dosyası değil.")
+    file_size = os.fstat(f.fileno()).st_size
+    fmt = None
+    rf64_data_size = None
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            raise ValueError("WAV dosyasında 'data' bölümü bulunamadı.")
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+        if chunk_id == b'ds64':
+            rf64_data_size = struct.unpack('<QQ', f.read(16))[1]
+            f.seek(chunk_size - 16 + (chunk_size & 1), os.SEEK_CUR)
+        elif chunk_id == b'fmt ':
+            fmt = struct.unpack('<HHIIHH', f.read(16))
+            f.seek(chunk_size - 16 + (chunk_size & 1), os.SEEK_CUR)
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise ValueError("WAV dosyasında 'fmt' bölümü bulunamadı.")
+            if rf64_data_size is not None and chunk_size == RIFF_SIZE_LIMIT:
+                chunk_size = rf64_data_size
+            # Başlığı güncellenmemiş dosyalarda veri dosya sonuna kadar kabul edilir.
+            available = file_size - f.tell()
+            if chunk_size == 0 or chunk_size > available:
+                chunk_size = available
+            _, channels, rate, _, block_align, _ = fmt
+            return {"duration": chunk_size // block_align / float(rate), "rate": rate, "channels": channels}
+        else:
+            f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+def _parse_flac_streaminfo(block):
+    """FLAC STREAMINFO bloğundan örnekleme hızı, kanal ve toplam örnek sayısını çıkarır."""
+    value = int.from_bytes(block[10:18], 'big')
+    rate = value >> 44
+    channels = ((value >> 41) & 0x7) + 1
+    total_samples = value & 0xFFFFFFFFF
+    if not rate:
+        raise ValueError("Geçersiz FLAC STREAMINFO.")
+    return {"duration": total_samples / float(rate) if total_samples else None, "rate": rate, "channels": channels}
+
+def _probe_flac(f):
+    f.seek(_skip_id3v2(f))
+    if f.read(4) != b'fLaC':
+        raise ValueError("Geçerli bir FLAC dosyası değil.")
+    block_header = f.read(4)
+    if len(block_header) < 4 or block_header[0] & 0x7F != 0:
+        raise ValueError("FLAC STREAMINFO bulunamadı.")
+    return _parse_flac_streaminfo(f.read(34))
+
+def _probe_ogg(f):
+    """İlk sayfadaki kodek başlığından hızı, son sayfanın granül konumundan süreyi bulur."""
+    page = f.read(282)
+    if len(page) < 27 or page[:4] != b'OggS':
+        raise ValueError("Geçerli bir Ogg dosyası değil.")
+    segment_count = page[26]
+    f.seek(27 + segment_count)
+    packet = f.read(64)
+
+    pre_skip = 0
+    if packet[:7] == b'\x01vorbis':
+        channels = packet[11]
+        rate = struct.unpack_from('<I', packet, 12)[0]
+    elif packet[:8] == b'OpusHead':
+        channels = packet[9]
+        pre_skip = struct.unpack_from('<H', packet, 10)[0]
+        # Opus granül konumu her zaman 48 kHz üzerinden sayılır.
+        rate = 48000
+    elif packet[:5] == b'\x7fFLAC':
+        # 0x7F "FLAC" (5) + sürüm (2) + başlık sayısı (2) + "fLaC" (4) + blok başlığı (4) → STREAMINFO 17. baytta başlar.
+        info = _parse_flac_streaminfo(packet[17:51])
+        channels, rate = info["channels"], info["rate"]
+    else:
+        raise ValueError("Desteklenmeyen Ogg kodeği.")
+
+    file_size = os.fstat(f.fileno()).st_size
+    tail_size = min(file_size, 65536)
+    f.seek(file_size - tail_size)
+    tail = f.read(tail_size)
+    position = tail.rfind(b'OggS')
+    granule = None
+    while position != -1:
+        if position + 14 <= len(tail) and tail[position + 4] == 0:
+            granule = struct.unpack_from('<q', tail, position + 6)[0]
+            if granule >= 0:
+                break
+        position = tail.rfind(b'OggS', 0, position)
+    if granule is None or granule < 0 or not rate:
+        raise ValueError("Ogg granül konumu bulunamadı.")
+    return {"duration": max(0, granule - pre_skip) / float(rate), "rate": rate, "channels": channels}
+
+def _parse_mpeg_header(header):
+    """4 baytlık MPEG ses çerçevesi başlığını çözer; geçersizse None döndürür."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version_bits = (header[1] >> 3) & 0x3
+    layer_bits = (header[1] >> 1) & 0x3
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x3
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    version = {0: 2.5, 2: 2, 3: 1}[version_bits]
+    layer = 4 - layer_bits
+    bitrate = MPEG_BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+    rate = MPEG_SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 0x1
+    channels = 1 if header[3] >> 6 == 3 else 2
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // rate + padding) * 4
+    elif layer == 2 or version == 1:
+        samples = 1152
+        length = 144 * bitrate // rate + padding
+    else:
+        samples = 576
+        length = 72 * bitrate // rate + padding
+    return {"version": version, "layer": layer, "bitrate": bitrate, "rate": rate,
+            "channels": channels, "samples": samples, "length": length}
+
+def _probe_mp3(f):
+    """Xing/Info veya VBRI başlığından, yoksa çerçeve başlıklarından süreyi hesaplar."""
+    file_size = os.fstat(f.fileno()).st_size
+    start = _skip_id3v2(f)
+    f.seek(start)
+    data = f.read(65536)
+
+    # İlk geçerli çerçeveyi, ardından gelen çerçeveyle doğrulayarak bul.
+    offset = 0
+    first = None
+    while offset + 4 <= len(data):
+        offset = data.find(b'\xff', offset)
+        if offset == -1:
+            break
+        frame = _parse_mpeg_header(data[offset:offset + 4])
+        if frame and frame["length"] > 0:
+            following = data[offset + frame["length"]:offset + frame["length"] + 4]
+            if len(following) < 4 or _parse_mpeg_header(following):
+                first = frame
+                break
+        offset += 1
+    if first is None:
+        raise ValueError("MP3 çerçevesi bulunamadı.")
+    audio_start = start + offset
+    frame_data = data[offset:offset + first["length"]]
+
+    side_info = (32 if first["channels"] == 2 else 17) if first["version"] == 1 else (17 if first["channels"] == 2 else 9)
+    xing = frame_data[4 + side_info:4 + side_info + 12]
+    frames = None
+    if xing[:4] in (b'Xing', b'Info') and struct.unpack('>I', xing[4:8])[0] & 0x1:
+        frames = struct.unpack('>I', xing[8:12])[0]
+    elif frame_data[36:40] == b'VBRI':
+        frames = struct.unpack('>I', frame_data[50:54])[0]
+
+    if frames is None:
+        audio_end = file_size
+        f.seek(max(0, file_size - 128))
+        if f.read(3) == b'TAG':
+            audio_end -= 128
+        frames = _count_mpeg_frames(f, audio_start, audio_end, first)
+
+    return {"duration": frames * first["samples"] / float(first["rate"]), "rate": first["rate"], "channels": first["channels"]}
+
+def _count_mpeg_frames(f, audio_start, audio_end, first):
+    """
+    Xing/VBRI başlığı olmayan dosyalarda çerçeve sayısını bulur.
+    İlk çerçevelerin bit hızı sabitse dosya boyutundan hesaplanır; değilse çerçeve başlıkları taranır.
+    """
+    f.seek(audio_start)
+    bitrates = set()
+    for _ in range(8):
+        frame = _parse_mpeg_header(f.read(4))
+        if not frame:
+            break
+        bitrates.add(frame["bitrate"])
+        f.seek(frame["length"] - 4, os.SEEK_CUR)
+    if len(bitrates) <= 1:
+        average_length = first["samples"] / 8.0 * first["bitrate"] / first["rate"]
+        return int((audio_end - audio_start) / average_length)
+
+    frames = 0
+    position = audio_start
+    while position + 4 <= audio_end:
+        f.seek(position)
+        frame = _parse_mpeg_header(f.read(4))
+        if not frame or frame["length"] <= 0:
+            break
+        frames += 1
+        position += frame["length"]
+    return frames
+
+def _probe_adts(f):
+    """
+    ADTS başlığından hız ve kanal sayısını okur. ADTS dosyalarında toplam süre bilgisi
+    bulunmadığından süre, ilk çerçevelerin ortalama boyutu ile dosya boyutundan tahmin edilir.
+    """
+    file_size = os.fstat(f.fileno()).st_size
+    start = _skip_id3v2(f)
+    f.seek(start)
+    data = f.read(65536)
+    offset = 0
+    while offset + 7 <= len(data) and not (data[offset] == 0xFF and data[offset + 1] & 0xF6 == 0xF0):
+        offset += 1
+    if offset + 7 > len(data):
+        raise ValueError("ADTS çerçevesi bulunamadı.")
+
+    rate_index = (data[offset + 2] >> 2) & 0xF
+    if rate_index >= len(ADTS_SAMPLE_RATES):
+        raise ValueError("Geçersiz ADTS örnekleme hızı.")
+    rate = ADTS_SAMPLE_RATES[rate_index]
+    channels = ((data[offset + 2] & 0x1) << 2) | (data[offset + 3] >> 6)
+
+    frames = 0
+    samples = 0
+    position = offset
+    while position + 7 <= len(data) and frames < 64:
+        header = data[position:position + 7]
+        if header[0] != 0xFF or header[1] & 0xF6 != 0xF0:
+            break
+        length = ((header[3] & 0x3) << 11) | (header[4] << 3) | (header[5] >> 5)
+        if length < 7:
+            break
+        frames += 1
+        samples += ((header[6] & 0x3) + 1) * 1024
+        position += length
+    if not frames:
+        raise ValueError("ADTS çerçevesi bulunamadı.")
+
+    bytes_per_sample = (position - offset) / float(samples)
+    total_samples = (file_size - start - offset) / bytes_per_sample
+    return {"duration": total_samples / rate, "rate": rate, "channels": channels}
+
+HEADER_PROBES = {
+    ".wav": _probe_wav,
+    ".flac": _probe_flac,
+    ".ogg": _probe_ogg,
+    ".mp3": _probe_mp3,
+    ".aac": _probe_adts,
+}
+
+def probe_audio_header(path):
+    """
+    Ses dosyasının süresini, örnekleme hızını ve kanal sayısını yalnızca kapsayıcı/akış
+    başlıklarından okur. Başlıklar çözülemezse None döndürür.
+    """
+    probe = HEADER_PROBES.get(os.path.splitext(path)[1].lower())
+    if not probe:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            metadata = probe(f)
+        if metadata["duration"] is not None:
+            return metadata
+    except (ValueError, struct.error, IndexError, KeyError, ZeroDivisionError) as e:
+        log.debug("Başlık bilgisi okunamadı: %s", e, extra={"path": path})
+    return None
+
+def probe_audio_metadata(path):
+    """
+    Ses dosyasının süresini, örnekleme hızını ve kanal sayısını döndürür.
+    Dosyanın tamamı yalnızca başlıklar çözülemediğinde son çare olarak çözülür.
+    """
+    metadata = probe_audio_header(path)
+    if metadata:
+        return metadata
+
+    from pydub import AudioSegment  # Yalnızca başlık okunamadığında gerekir; açılışı yavaşlatmasın diye burada yüklenir.
+    audio_segment = AudioSegment.from_file(path)
+    return {"duration": len(audio_segment) / 1000.0, "rate": audio_segment.frame_rate, "channels": audio_segment.channels}
+
+def format_duration(seconds):
+    """Süreyi tabloda gösterilecek dd:ss biçimine çevirir."""
+    if seconds is None:
+        return "N/A"
+    duration_minutes = int(seconds // 60)
+    duration_seconds_rem = int(seconds % 60)
+    return f"{duration_minutes:02}:{duration_seconds_rem:02}"
+
+class RecordingLibrary:
+    """
+    Kayıt klasöründeki dosyaların süre, boyut, format ve örnekleme hızı bilgilerini
+    ~/.EchoVoiceRecorder altında kalıcı bir dizinde tutar.
+    Açılışta dosyalar yalnızca (değiştirilme zamanı, boyut) ile doğrulanır; değişenler arka planda yeniden incelenir.
+    Dizin dosyası her kayıt klasörü için ayrı bir bölüm tutar; pencereli uygulama ve başsız mod farklı
+    klasörlere kaydetse de birbirlerinin kayıtlarını silmez.
+    """
+    INDEX_VERSION = 2
+    RECORD_NAME_PATTERN = re.compile(r"^rec(\d+)(?:-\d+)?\.[^.]+$", re.IGNORECASE)  # Çoklu aygıt parçaları: rec5-1.wav
+    PARTIAL_NAME_PATTERN = re.compile(r"^(.+?)(?:\.part\.wav)?\.partial$", re.IGNORECASE)
+
+    def __init__(self, index_file, record_path):
+        self.index_file = index_file
+        self.record_path = record_path
+        self._key = os.path.abspath(record_path)
+        self.entries = {}
+        self._max_record_number = 0
+
+    def _read_libraries(self):
+        """Dosyadaki tüm kayıt klasörlerinin bölümlerini döndürür. Eski (tek klasörlü) biçim de okunur."""
+        if not os.path.exists(self.index_file):
+            return {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.INDEX_VERSION:
+                return dict(data.get("libraries", {}))
+            if data.get("version") == 1 and data.get("record_path"):
+                return {os.path.abspath(data["record_path"]): {"entries": data.get("entries", {})}}
+        except (IOError, json.JSONDecodeError, AttributeError) as e:
+            log.warning("Kayıt dizini yüklenirken hata oluştu: %s", e)
+        return {}
+
+    def _locked(self):
+        """Dizin dosyasını başka süreçlerin (pencereli uygulama/başsız mod) yazmalarına karşı kilitler."""
+        os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+        lock_file = open(self.index_file + ".lock", 'w')
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return lock_file
+
+    def load(self):
+        """Bu kayıt klasörünün bölümünü dosyadan okur. Dosya ya da bölüm yoksa boş dizinle başlar."""
+        self.entries = dict(self._read_libraries().get(self._key, {}).get("entries", {}))
+
+    def save(self):
+        """
+        Bu klasörün bölümünü dosyadaki diğer bölümlerle birleştirir; geçici bir dosyaya yazıp atomik olarak yerine taşır.
+        Okuma ve yazma bir kilit altında yapılır ki başka bir sürecin aynı anda kaydettiği bölüm kaybolmasın.
+        """
+        temp_file = self.index_file + ".tmp"
+        try:
+            with self._locked():
+                libraries = self._read_libraries()
+                libraries[self._key] = {"entries": self.entries}
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump({"version": self.INDEX_VERSION, "libraries": libraries}, f, ensure_ascii=False)
+                os.replace(temp_file, self.index_file)
+        except IOError as e:
+            log.error("Kayıt dizini kaydedilirken hata oluştu: %s", e)
+
+    def scan(self):
+        """
+        Kayıt klasörünü tarar, silinen dosyaları dizinden çıkarır ve
+        yeni ya da değişmiş dosyaların adlarını döndürür.
+        """
+        stale = []
+        seen = set()
+        try:
+            with os.scandir(self.record_path) as it:
+                for entry in it:
+                    if not entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                        partial = self.PARTIAL_NAME_PATTERN.match(entry.name)
+                        if partial:
+                            # Süren ya da kurtarılmayı bekleyen bir kaydın ara dosyası; o kaydın adı yeni kayıtlara verilmez.
+                            self._note_record_name(partial.group(1))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    seen.add(entry.name)
+                    self._note_record_name(entry.name)
+                    stat = entry.stat()
+                    cached = self.entries.get(entry.name)
+                    if not cached or cached.get("mtime") != stat.st_mtime or cached.get("size") != stat.st_size:
+                        stale.append(entry.name)
+        except OSError as e:
+            log.error("Kayıt klasörü taranırken hata oluştu: %s", e)
+
+        for name in list(self.entries):
+            if name not in seen:
+                del self.entries[name]
+        return stale
+
+    def build_entry(self, path):
+        """Dosyanın bilgilerini toplayıp dizin kaydı oluşturur."""
+        stat = os.stat(path)
+        entry = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "format": os.path.splitext(path)[1].upper(),
+            "duration": None,
+            "rate": None,
+            "channels": None,
+        }
+        try:
+            entry.update(probe_audio_metadata(path))
+        except Exception as e:
+            log.warning("Süre hesaplanırken hata oluştu: %s", e, extra={"path": path})
+        return entry
+
+    def contains_path(self, path):
+        return os.path.dirname(os.path.abspath(path)) == os.path.abspath(self.record_path)
+
+    def update(self, name, entry):
+        self.entries[name] = entry
+        self._note_record_name(name)
+
+    def _note_record_name(self, name):
+        match = self.RECORD_NAME_PATTERN.match(name)
+        if match:
+            self._max_record_number = max(self._max_record_number, int(match.group(1)))
+
+    def next_record_path(self, extension, reserved=()):
+        """
+        Bilinen en büyük recN numarasından sonraki boş dosya yolunu döndürür.
+        Klasördeki tüm adları tek tek denemek yerine yalnızca birkaç olası ad kontrol edilir.
+        """
+        counter = self._max_record_number + 1
+        full_path = os.path.join(self.record_path, f"rec{counter}{extension}")
+        while os.path.exists(full_path) or full_path in reserved:
+            counter += 1
+            full_path = os.path.join(self.record_path, f"rec{counter}{extension}")
+        return full_path
+
+def create_audio_backend():
+    """
+    Ses arka ucunu oluşturur. Varsayılan PyAudio'dur; ECHO_AUDIO_BACKEND=fake ile donanım gerektirmeyen
+    sahte arka uç (echo_fake_audio) kullanılır.
+    """
+    if os.environ.get("ECHO_AUDIO_BACKEND") == "fake":
+        from echo_fake_audio import FakeAudioBackend
+        return FakeAudioBackend.from_environment()
+    if not HAVE_PYAUDIO:
+        raise RuntimeError("PyAudio kurulu değil; ses aygıtları kullanılamıyor (python3-pyaudio paketini kurun).")
+    return pyaudio.PyAudio()
+
+class AudioEngine:
+    """
+    Kaydedici ve oynatıcı tarafından paylaşılan tek PyAudio örneği.
+    Açılan çıkış akışları (biçim, kanal, örnekleme hızı) anahtarıyla önbellekte tutulur;
+    böylece art arda oynatmalarda akış yeniden açılmaz ve kaynaklar sınırlı kalır.
+    backend_factory PyAudio ile aynı arayüzü sunan bir nesne döndürür (ör. ölçümlerde sahte arka uç).
+    """
+    MAX_CACHED_OUTPUT_STREAMS = 4
+
+    def __init__(self, backend_factory=create_audio_backend):
+        self.backend_factory = backend_factory
+        self.pa = backend_factory()
+        self._idle_output_streams = {}
+        self._supported_input_formats = set()
+        self._lock = threading.Lock()
+        # reset() aygıt tarama iş parçacığında çalışır; yarıda kalmış bir yeniden başlatmayla akış açılmasın diye
+        # PyAudio örneğini kullanan işlemler bu kilitle sıraya konur.
+        self._backend_lock = threading.RLock()
+
+    def get_sample_size(self, format):
+        return self.pa.get_sample_size(format)
+
+    def get_format_from_width(self, width):
+        return self.pa.get_format_from_width(width)
+
+    def open_input_stream(self, **kwargs):
+        with self._backend_lock:
+            return self.pa.open(input=True, **kwargs)
+
+    def check_input_format(self, rate, channels, format, device_index=None):
+        """
+        Giriş aygıtının (varsayılan ya da verilen) bu ayarları destekleyip desteklemediğini denetler.
+        Desteklenmiyorsa nedenini içeren ValueError fırlatır.
+        """
+        key = (rate, channels, format, device_index)
+        if key in self._supported_input_formats:
+            return
+        with self._backend_lock:
+            self._check_input_format(rate, channels, format, device_index)
+        # Denetim aygıtı kısa süreliğine açabildiğinden olumlu sonuçlar saklanır; kayda başlarken tekrarlanmaz.
+        self._supported_input_formats.add(key)
+
+    def _check_input_format(self, rate, channels, format, device_index):
+        if device_index is None:
+            try:
+                device_index = self.pa.get_default_input_device_info()['index']
+            except IOError:
+                raise ValueError("Varsayılan giriş aygıtı bulunamadı.")
+        device_info = self.pa.get_device_info_by_index(device_index)
+        if channels > device_info.get('maxInputChannels', 0):
+            raise ValueError(f"{device_info.get('name')} en fazla {device_info.get('maxInputChannels', 0)} kanal destekliyor.")
+        # PyAudio desteklenmeyen biçimler için ValueError fırlatır.
+        self.pa.is_format_supported(rate, input_device=device_index, input_channels=channels, input_format=format)
+
+    def acquire_output_stream(self, format, channels, rate):
+        """Verilen ayarlara uygun bir çıkış akışını önbellekten alır ya da yenisini açar."""
+        key = (format, channels, rate)
+        with self._lock:
+            stream = self._idle_output_streams.pop(key, None)
+
+        if stream is None:
+            with self._backend_lock:
+                stream = self.pa.open(format=format, channels=channels, rate=rate, output=True)
+        elif stream.is_stopped():
+            stream.start_stream()
+        return stream
+
+    def write_output(self, stream, data):
+        """
+        Veriyi çıkış akışına yazar. Çıkış daha önce boşalmışsa (xrun) True döndürür;
+        PortAudio bunu yazma tamamlandıktan sonra bildirdiği için veri kaybolmaz.
+        """
+        try:
+            stream.write(data, exception_on_underflow=True)
+        except IOError as e:
+            if e.args[-1] != pyaudio.paOutputUnderflowed:
+                raise
+            return True
+        return False
+
+    def release_output_stream(self, stream, format, channels, rate):
+        """Oynatması biten çıkış akışını kapatmadan önbelleğe geri koyar."""
+        key = (format, channels, rate)
+        stream.stop_stream()
+        with self._lock:
+            previous = self._idle_output_streams.pop(key, None)
+            self._idle_output_streams[key] = stream
+            evicted = [previous] if previous is not None else []
+            while len(self._idle_output_streams) > self.MAX_CACHED_OUTPUT_STREAMS:
+                oldest_key = next(iter(self._idle_output_streams))
+                evicted.append(self._idle_output_streams.pop(oldest_key))
+        for old_stream in evicted:
+            old_stream.close()
+
+    def _close_idle_output_streams(self):
+        with self._lock:
+            streams = list(self._idle_output_streams.values())
+            self._idle_output_streams.clear()
+        for stream in streams:
+            stream.close()
+
+    def reset(self):
+        """
+        PortAudio'yu yeniden başlatır; yeni takılan aygıtlar ancak böyle görünür. Açık akış olmamalıdır.
+        PulseAudio'da yüzlerce milisaniye sürebildiğinden arayüz iş parçacığında çağrılmamalıdır.
+        """
+        with self._backend_lock:
+            self._close_idle_output_streams()
+            self._supported_input_formats.clear()
+            self.pa.terminate()
+            self.pa = self.backend_factory()
+
+    def terminate(self):
+        with self._backend_lock:
+            self._close_idle_output_streams()
+            self.pa.terminate()
+
+def list_devices(pa):
+    """PyAudio'nun gördüğü ses aygıtlarını ve yeteneklerini sözlük listesi olarak döndürür."""
+    devices = []
+    for index in range(pa.get_device_count()):
+        info = pa.get_device_info_by_index(index)
+        devices.append({"index": index,
+                        "name": info.get('name', ""),
+                        "max_input_channels": int(info.get('maxInputChannels', 0)),
+                        "max_output_channels": int(info.get('maxOutputChannels', 0)),
+                        "default_rate": int(info.get('defaultSampleRate', 0))})
+    return devices
+
+def find_input_device(devices, name):
+    """Adı verilen giriş aygıtının dizinini döndürür; bulunamazsa None (varsayılan aygıt)."""
+    for device in devices:
+        if device["max_input_channels"] > 0 and device["name"] == name:
+            return device["index"]
+    return None
+
+def find_monitor_device(devices):
+    """PulseAudio/PipeWire'ın sistem çıkışını yansıtan "monitor" giriş aygıtının dizini ya da None."""
+    for device in devices:
+        if device["max_input_channels"] > 0 and "monitor" in device["name"].lower():
+            return device["index"]
+    return None
+
+class SystemAudioCapture:
+    """
+    Sistem sesini ikinci bir akış olarak yakalayıp bir halka tampona yazar.
+    Bir monitör aygıtı verildiyse PyAudio ile açılır; yoksa PulseAudio/PipeWire'ın parec aracıyla
+    varsayılan çıkışın monitör kaynağı (@DEFAULT_MONITOR@) okunur.
+    """
+    def __init__(self, audio_engine, ring_buffer, format, channels, rate, chunk, device_index=None, metrics=None):
+        self.audio_engine = audio_engine
+        self.device_index = device_index
+        self.metrics = metrics
+        self.ring_buffer = ring_buffer
+        self.format = format
+        self.channels = channels
+        self.rate = rate
+        self.chunk = chunk
+        self.active = True
+        self._stream = None
+        self._process = None
+        self._reader = None
+
+    def start(self):
+        if self.device_index is not None:
+            self._stream = self.audio_engine.open_input_stream(format=self.format,
+                                                               channels=self.channels,
+                                                               rate=self.rate,
+                                                               frames_per_buffer=self.chunk,
+                                                               input_device_index=self.device_index,
+                                                               stream_callback=self._callback)
+            return
+
+        parec_path = shutil.which("parec")
+        if parec_path is None:
+            raise RuntimeError("Sistem sesi için monitör kaynağı bulunamadı (PulseAudio/PipeWire gerekli).")
+        sample_width = self.audio_engine.get_sample_size(self.format)
+        self._process = subprocess.Popen([parec_path, "--device=@DEFAULT_MONITOR@", "--raw",
+                                          f"--format={PCM_INPUT_FORMATS[sample_width]}",
+                                          f"--rate={self.rate}", f"--channels={self.channels}",
+                                          "--latency-msec=20"],
+                                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self._reader = threading.Thread(target=self._read_process, args=(sample_width * self.channels,), daemon=True)
+        self._reader.start()
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        started = time.perf_counter()
+        if self.active:
+            self.ring_buffer.write(in_data)
+        if self.metrics is not None:
+            self.metrics.observe_callback("system", time.perf_counter() - started, status)
+        return (None, pyaudio.paContinue)
+
+    def _read_process(self, frame_size):
+        read_size = self.chunk * frame_size
+        pending = b""
+        while True:
+            data = self._process.stdout.read1(read_size)
+            if not data:
+                break
+            pending += data
+            # Halka tampona yalnızca tam çerçeveler yazılır.
+            usable = len(pending) - len(pending) % frame_size
+            if usable and self.active:
+                self.ring_buffer.write(pending[:usable])
+            pending = pending[usable:]
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+        if self._reader is not None:
+            self._reader.join()
+            self._reader = None
+
+class DriftCompensator:
+    """
+    Ana saate göre çalışan bir aşamanın, başka bir ses kartından gelen tampondan ses almasını sağlar.
+    İki kartın saatleri arasındaki kayma, tamponun doluluğuna göre sesi np.interp ile hafifçe
+    yeniden örnekleyerek dengelenir. Kaynak geç başlarsa hedef doluluğa ulaşana kadar sessizlik verilir.
+    """
+    TARGET_FILL_CHUNKS = 4      # Tamponda tutulmaya çalışılan parça sayısı
+    MAX_DRIFT_CORRECTION = 0.005  # En fazla %0,5 hız düzeltmesi (duyulmaz)
+    DRIFT_GAIN = 0.02
+    FILL_SMOOTHING = 0.05         # Doluluk ölçümündeki parça boyutlu titreşimi yumuşatır
+
+    def __init__(self, ring_buffer, sample_width, channels, chunk):
+        self.ring_buffer = ring_buffer
+        self.sample_width = sample_width
+        self.channels = channels
+        self.frame_size = sample_width * channels
+        self.target_fill = chunk * self.TARGET_FILL_CHUNKS
+        self.underruns = 0
+        self._primed = False
+        self._phase = 0.0
+        self._average_fill = float(self.target_fill)
+
+    def take(self, frames):
+        """Tampondan ana saatin 'frames' çerçevesine karşılık gelen sesi alır ve boyunu eşitler."""
+        available = self.ring_buffer.fill_level() // self.frame_size
+        if not self._primed:
+            if available < self.target_fill:
+                return np.zeros((frames, self.channels), dtype=np.float32)
+            self._primed = True
+
+        self._average_fill += (available - self._average_fill) * self.FILL_SMOOTHING
+        error = (self._average_fill - self.target_fill) / self.target_fill
+        ratio = 1.0 + max(-self.MAX_DRIFT_CORRECTION, min(self.MAX_DRIFT_CORRECTION, error * self.DRIFT_GAIN))
+        # Kesirli kısım bir sonraki parçaya taşınır; böylece düzeltme zamanla birikmez.
+        wanted = frames * ratio + self._phase
+        count = int(wanted)
+        self._phase = wanted - count
+
+        data = self.ring_buffer.read(count * self.frame_size, timeout=0) if count else b""
+        source = pcm_to_float32(data or b"", self.sample_width).reshape(-1, self.channels)
+        if len(source) < count:
+            self.underruns += 1
+            source = np.concatenate([source, np.zeros((count - len(source), self.channels), dtype=np.float32)])
+        if count == frames:
+            return source
+        if count == 0:
+            return np.zeros((frames, self.channels), dtype=np.float32)
+
+        positions = np.linspace(0, count - 1, frames)
+        indices = np.arange(count)
+        return np.stack([np.interp(positions, indices, source[:, ch]) for ch in range(self.channels)], axis=1).astype(np.float32)
+
+class SourceMixer(threading.Thread):
+    """
+    Mikrofon ve sistem sesi tamponlarını NumPy ile karıştırıp yazıcının okuduğu tampona aktarır.
+    Mikrofon akışı ana saat kabul edilir; sistem sesi DriftCompensator ile ona uydurulur.
+    """
+    ring_buffer_names = ("mic", "system")
+
+    def __init__(self, mic_buffer, system_buffer, output_buffer, sample_width, channels, chunk,
+                 mic_gain=1.0, system_gain=1.0):
+        super().__init__(daemon=True)
+        self.mic_buffer = mic_buffer
+        self.system_buffer = system_buffer
+        self.output_buffer = output_buffer
+        self.ring_buffers = [mic_buffer, system_buffer]
+        self.sample_width = sample_width
+        self.channels = channels
+        self.frame_size = sample_width * channels
+        self.chunk = chunk
+        self.mic_gain = mic_gain
+        self.system_gain = system_gain
+        self.system_source = DriftCompensator(system_buffer, sample_width, channels, chunk)
+
+    @property
+    def system_underruns(self):
+        return self.system_source.underruns
+
+    def run(self):
+        while True:
+            data = self.mic_buffer.read(self.chunk * self.frame_size)
+            if data is None:
+                continue
+            if not data:
+                break
+            mic = pcm_to_float32(data, self.sample_width).reshape(-1, self.channels)
+            mixed = mic * self.mic_gain + self.system_source.take(len(mic)) * self.system_gain
+            self.output_buffer.write(float32_to_pcm(mixed.ravel(), self.sample_width))
+        self.output_buffer.close()
+
+    def finish(self):
+        """Giriş tamponlarını kapatır, kalan sesi karıştırır ve çıkış tamponunu kapatır."""
+        self.mic_buffer.close()
+        self.system_buffer.close()
+        if self.is_alive():
+            self.join()
+        else:
+            self.output_buffer.close()
+
+class TrackInterleaver(threading.Thread):
+    """
+    Çoklu aygıt kaydında her aygıtın parçasını yan yana kanallar olarak tek bir çok kanallı akışta birleştirir.
+    Girişler aygıt yazıcılarının dokunuşlarıyla dolar; ilk aygıt ana saattir, diğerleri DriftCompensator ile ona uydurulur.
+    """
+    def __init__(self, track_buffers, output_buffer, sample_width, channels, chunk, names=None):
+        super().__init__(daemon=True)
+        self.ring_buffers = list(track_buffers)
+        self.ring_buffer_names = list(names or (f"track{number}" for number in range(1, len(self.ring_buffers) + 1)))
+        self.output_buffer = output_buffer
+        self.sample_width = sample_width
+        self.channels = channels
+        self.frame_size = sample_width * channels
+        self.chunk = chunk
+        self.followers = [DriftCompensator(ring_buffer, sample_width, channels, chunk) for ring_buffer in self.ring_buffers[1:]]
+
+    def run(self):
+        master = self.ring_buffers[0]
+        while True:
+            data = master.read(self.chunk * self.frame_size)
+            if data is None:
+                continue
+            if not data:
+                break
+            first = pcm_to_float32(data, self.sample_width).reshape(-1, self.channels)
+            tracks = [first] + [follower.take(len(first)) for follower in self.followers]
+            self.output_buffer.write(float32_to_pcm(np.concatenate(tracks, axis=1).ravel(), self.sample_width))
+        self.output_buffer.close()
+
+    def finish(self):
+        """Giriş tamponlarını kapatır, kalan sesi birleştirir ve çıkış tamponunu kapatır."""
+        for ring_buffer in self.ring_buffers:
+            ring_buffer.close()
+        if self.is_alive():
+            self.join()
+        else:
+            self.output_buffer.close()
+
+class SystemCaptureError(RuntimeError):
+    """Sistem sesi yakalaması başlatılamadığında fırlatılır."""
+
+class RecordingSession:
+    """
+    Tek bir kaydın yakalama hattı: mikrofon ve/veya sistem sesi → halka tampon(lar) → (karıştırıcı)
+    → yazıcı → hedef. Pencereden bağımsızdır; pencereli uygulama da başsız mod da bunu kullanır.
+    """
+    RING_BUFFER_SECONDS = 10
+
+    def __init__(self, audio_engine, full_path, format, channels, rate, chunk, mic=True, system=False,
+                 input_device_index=None, monitor_device_index=None, mic_gain=1.0, system_gain=1.0, vad_mode="off",
+                 journal_dir=None, taps=(), upstream_factory=None):
+        self.audio_engine = audio_engine
+        self.full_path = full_path
+        self.format = format
+        self.channels = channels
+        self.rate = rate
+        self.chunk = chunk
+        self.mic = mic
+        self.system = system
+        self.input_device_index = input_device_index
+        self.monitor_device_index = monitor_device_index
+        self.mic_gain = mic_gain
+        self.system_gain = system_gain
+        self.vad_mode = vad_mode
+        # Verilirse WAV verisi çökmeye dayanıklı parçalara yazılır ve günlüğü bu dizinde tutulur.
+        self.journal_dir = journal_dir
+        # Yazılan her parçayı ayrıca alan ek tüketiciler (ör. çoklu aygıt kaydında birleştiricinin tamponu).
+        self.taps = list(taps)
+        # Verilirse kaynak açılmaz; yazıcının tamponunu bu fabrikanın oluşturduğu ara aşama doldurur.
+        self.upstream_factory = upstream_factory
+        self.sample_width = audio_engine.get_sample_size(format)
+        self.frame_size = channels * self.sample_width
+
+        self.paused = False
+        self.auto_paused = False  # Otomatik duraklatmada veri akmaya devam eder; algılayıcı konuşmayı bu veriden fark eder.
+        self.writer = None
+        self.metrics = RecordingMetrics()
+        self.level_analyzer = None
+        self.peak_builder = None
+        self._capture_buffer = None  # Mikrofon geri çağrısının yazdığı tampon
+        self._system_buffer = None
+        self._stream = None
+        self._system_capture = None
+
+    @property
+    def gate(self):
+        return self.writer.gate if self.writer is not None else None
+
+    @property
+    def ring_buffers(self):
+        if self.writer is None:
+            return []
+        return [self.writer.ring_buffer] + list(getattr(self.writer.upstream, "ring_buffers", []))
+
+    @property
+    def output_paths(self):
+        """Kaydın oluşturduğu dosyalar."""
+        return [self.full_path]
+
+    def _create_sink(self):
+        """Kayıt formatına göre ses verisinin kayıt sırasında akıtılacağı hedefi oluşturur."""
+        extension = os.path.splitext(self.full_path)[1].lower()
+        if extension == ".wav":
+            return self._create_wav_sink(self.full_path)
+
+        ffmpeg_path = find_ffmpeg()
+        if ffmpeg_path and extension in ENCODER_OUTPUT_ARGS:
+            return EncoderSink(self.full_path, extension, self.channels, self.sample_width, self.rate, ffmpeg_path)
+
+        # ffmpeg bulunamazsa geçici bir WAV dosyasına yazılır ve durdurmada dönüştürülür.
+        return self._create_wav_sink(self.full_path + ".part.wav", recover_path=os.path.splitext(self.full_path)[0] + ".wav")
+
+    def _create_wav_sink(self, path, recover_path=None):
+        if self.journal_dir:
+            return JournaledWavSink(path, self.channels, self.sample_width, self.rate, self.journal_dir, recover_path)
+        return WavFileSink(path, self.channels, self.sample_width, self.rate)
+
+    def open(self):
+        """Hedefi, tamponları ve yazıcıyı hazırlar."""
+        buffer_size = self.rate * self.frame_size * self.RING_BUFFER_SECONDS
+        sink = self._create_sink()
+        ring_buffer = RingBuffer(buffer_size)
+        mixer = None
+        if self.upstream_factory is not None:
+            mixer = self.upstream_factory(ring_buffer)
+        elif self.mic and self.system:
+            # İki kaynak ayrı tamponlara yazar; karıştırıcı bunları yazıcının tamponunda birleştirir.
+            self._capture_buffer = RingBuffer(buffer_size)
+            self._system_buffer = RingBuffer(buffer_size)
+            mixer = SourceMixer(self._capture_buffer, self._system_buffer, ring_buffer, self.sample_width, self.channels, self.chunk,
+                                mic_gain=self.mic_gain, system_gain=self.system_gain)
+        else:
+            self._capture_buffer = ring_buffer
+            self._system_buffer = ring_buffer
+        source_gain = None
+        if self.upstream_factory is None and self.mic != self.system:
+            gain = self.mic_gain if self.mic else self.system_gain
+            source_gain = SourceGain(self.sample_width, gain) if gain != 1.0 else None
+        self.level_analyzer = LevelAnalyzer(self.sample_width)
+        self.peak_builder = PeakBuilder(self.sample_width, self.channels, self.rate)
+        # "skip" sessiz blokları atar; "auto_pause" yalnızca duraklatma durumunu sürer, veri olduğu gibi yazılır.
+        gate = (VoiceActivityGate(self.sample_width, self.channels, self.rate, drop=self.vad_mode == "skip")
+                if self.vad_mode in ("skip", "auto_pause") else None)
+        # Seviye ölçer süzgeçten önceki sesi, dalga formu ise dosyaya yazılan sesi görür.
+        self.writer = RecordingWriter(ring_buffer, sink, self.frame_size, taps=[self.peak_builder] + self.taps,
+                                      upstream=mixer, gate=gate, input_taps=[self.level_analyzer], gain=source_gain)
+        self.writer.start()
+        if mixer is not None:
+            mixer.start()
+
+    def start(self):
+        """
+        Ses kaynaklarını açar. Mikrofon akışı açılamazsa PyAudio'nun hatası,
+        sistem sesi yakalanamazsa SystemCaptureError fırlatılır; her iki durumda açılan kaynaklar kapatılır.
+        """
+        if self.mic:
+            self._stream = self.audio_engine.open_input_stream(format=self.format,
+                                                               channels=self.channels,
+                                                               rate=self.rate,
+                                                               frames_per_buffer=self.chunk,
+                                                               input_device_index=self.input_device_index,
+                                                               stream_callback=self._callback)
+        if self.system:
+            try:
+                self._system_capture = SystemAudioCapture(self.audio_engine, self._system_buffer, self.format, self.channels,
+                                                          self.rate, self.chunk, device_index=self.monitor_device_index,
+                                                          metrics=self.metrics)
+                self._system_capture.start()
+            except Exception as e:
+                self._system_capture = None
+                self.stop()
+                raise SystemCaptureError(str(e)) from e
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        started = time.perf_counter()
+        if not self.paused or self.auto_paused:
+            self._capture_buffer.write(in_data)
+        self.metrics.observe_callback("mic", time.perf_counter() - started, status)
+        return (None, pyaudio.paContinue)
+
+    def pause(self, auto=False):
+        self.paused = True
+        self.auto_paused = auto
+        if self._system_capture is not None:
+            self._system_capture.active = auto
+
+    def resume(self):
+        self.paused = False
+        self.auto_paused = False
+        if self._system_capture is not None:
+            self._system_capture.active = True
+
+    def stop(self):
+        """Mikrofon akışını ve sistem sesi yakalamayı durdurur; tamponda kalan veri finalize() ile yazılır."""
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        if self._system_capture is not None:
+            self._system_capture.stop()
+            self._system_capture = None
+
+    def finalize(self, peak_cache=None, skip_index_dir=None, progress=None):
+        """
+        Yazıcıyı kapatır, gerekirse dönüştürür ve dalga formu ile atlanan bölümleri kaydeder.
+        Yavaş olabilir; arayüz iş parçacığında çağrılmamalıdır. Ses verisi yoksa dosyayı silip False döndürür.
+        """
+        progress = progress or (lambda percent: None)
+        writer = self.writer
+        started = time.perf_counter()
+        progress(0)
+        writer.finish()
+        if writer.error:
+            raise writer.error
+
+        if writer.frames_written == 0:
+            if os.path.exists(writer.path):
+                os.remove(writer.path)
+            log.warning("Kayıt verisi bulunamadı. Dosya oluşturulmadı.", extra={"path": self.full_path})
+            return False
+
+        if writer.path != self.full_path:
+            progress(50)
+            # pydub ile diğer formatlara dönüştür (yalnızca ffmpeg'e doğrudan akıtılamadığında gerekir)
+            from pydub import AudioSegment
+            extension = os.path.splitext(self.full_path)[1]
+            audio_segment = AudioSegment.from_wav(writer.path)
+            audio_segment.export(self.full_path, format=extension.replace(".", "").lower())
+            os.remove(writer.path)
+
+        if peak_cache is not None:
+            pyramid = self.peak_builder.build()
+            if pyramid:
+                peak_cache.save(self.full_path, pyramid)
+
+        if writer.gate is not None and writer.gate.drop and skip_index_dir:
+            writer.gate.save_spans(os.path.join(skip_index_dir, os.path.basename(self.full_path) + ".skipped.json"))
+
+        self.metrics.save_seconds = time.perf_counter() - started
+        log.info("Kayıt durduruldu ve kaydedildi", extra={"path": self.full_path, "frames": writer.frames_written,
+                                                          "converted": writer.path != self.full_path,
+                                                          "save_latency_ms": round(self.metrics.save_seconds * 1000, 1)})
+        progress(100)
+        return True
+
+    def discard(self):
+        """Kaynakları ve yazıcıyı kapatır, oluşturulan dosyayı siler."""
+        self.stop()
+        writer = self.writer
+        if writer is None:
+            return
+        writer.finish()
+        if os.path.exists(writer.path):
+            os.remove(writer.path)
+
+    def metrics_snapshot(self):
+        """
+        Oturumun ölçümleri: geri çağrı süreleri, durum bayrakları, tampon dolulukları,
+        kodlayıcının gerçek zamana göre hızı ve kaydetme gecikmesi.
+        """
+        snapshot = self.metrics.snapshot()
+        snapshot.update({"path": self.full_path,
+                         "state": "paused" if self.paused and not self.auto_paused else "recording",
+                         "buffers": {}})
+        writer = self.writer
+        if writer is None:
+            return snapshot
+        names = ["writer"] + list(getattr(writer.upstream, "ring_buffer_names", ()))
+        snapshot["buffers"] = {name: ring_buffer.stats() for name, ring_buffer in zip(names, self.ring_buffers)}
+        audio_seconds = writer.frames_written / float(self.rate)
+        snapshot["encoder"] = {"audio_s": round(audio_seconds, 2),
+                               "write_s": round(writer.write_seconds, 3),
+                               "realtime_factor": round(audio_seconds / writer.write_seconds, 1) if writer.write_seconds else None}
+        snapshot["overruns"], snapshot["lost_s"] = self.lost_audio()
+        return snapshot
+
+    def lost_audio(self):
+        """Tampon taşmaları nedeniyle atılan (parça sayısı, saniye) bilgisini döndürür."""
+        ring_buffers = self.ring_buffers
+        overruns = sum(ring_buffer.overruns for ring_buffer in ring_buffers)
+        dropped_bytes = sum(ring_buffer.dropped_bytes for ring_buffer in ring_buffers)
+        return overruns, dropped_bytes / self.frame_size / self.rate
+
+def track_path(full_path, number):
+    """Çoklu aygıt kaydında bir aygıtın parça dosyasının yolu: rec5.wav → rec5-2.wav."""
+    stem, extension = os.path.splitext(full_path)
+    return f"{stem}-{number}{extension}"
+
+class LevelGroup:
+    """Birden çok seviye ölçerin en yüksek değerlerini tek bir ölçer gibi sunar."""
+    def __init__(self, analyzers):
+        self.analyzers = list(analyzers)
+
+    def read_levels(self):
+        levels = [analyzer.read_levels() for analyzer in self.analyzers]
+        return max((rms for rms, _ in levels), default=0.0), max((peak for _, peak in levels), default=0.0)
+
+class MultiDeviceSession:
+    """
+    Birden çok giriş aygıtını aynı anda, her birini kendi parçasına (rec5-1.wav, rec5-2.wav, ...) kaydeden oturum yöneticisi.
+    Her aygıtın ayrı akışı, halka tamponu, yazıcı iş parçacığı ve sıkıştırılmış formatlarda ayrı ffmpeg süreci vardır;
+    böylece iş çekirdeklere dağılır ve arayüz iş parçacığı veri yolunda yer almaz. Sistem sesi istenirse ayrı bir parça olur.
+    interleave=True ile parçalar ayrıca tek bir çok kanallı dosyada (rec5.wav) yan yana kanallar olarak birleştirilir;
+    kanalların hizalı kalması için bu durumda sessizlik atlama kapatılır. RecordingSession ile aynı arayüzü sunar.
+    """
+    # Biçimlerin taşıyabildiği en fazla kanal sayısı; aşılırsa birleştirilmiş dosya WAV olarak yazılır.
+    MAX_CHANNELS = {".mp3": 2, ".aac": 8, ".flac": 8}
+    def __init__(self, audio_engine, full_path, format, channels, rate, chunk, input_device_indices, system=False,
+                 monitor_device_index=None, vad_mode="off", interleave=False, journal_dir=None, track_names=None,
+                 mic_gain=1.0, system_gain=1.0):
+        self.audio_engine = audio_engine
+        self.full_path = full_path
+        self.format = format
+        self.channels = channels
+        self.rate = rate
+        self.chunk = chunk
+        self.interleave = interleave
+        self.vad_mode = "off" if interleave else vad_mode
+        self.journal_dir = journal_dir
+        self.sample_width = audio_engine.get_sample_size(format)
+        self.frame_size = channels * self.sample_width
+
+        sources = [{"mic": True, "system": False, "input_device_index": index, "mic_gain": mic_gain} for index in input_device_indices]
+        names = list(track_names or [])[:len(sources)]
+        names += [f"track{number}" for number in range(len(names) + 1, len(sources) + 1)]
+        if system:
+            sources.append({"mic": False, "system": True, "monitor_device_index": monitor_device_index, "system_gain": system_gain})
+            names.append("system")
+        self.track_names = names
+        self._sources = sources
+        self.tracks = []
+        self.mix = None
+        self._saved_paths = []
+
+    @property
+    def paused(self):
+        return bool(self.tracks) and self.tracks[0].paused
+
+    @property
+    def auto_paused(self):
+        return bool(self.tracks) and self.tracks[0].auto_paused
+
+    @property
+    def level_analyzer(self):
+        return LevelGroup(track.level_analyzer for track in self.tracks if track.level_analyzer is not None)
+
+    @property
+    def gate(self):
+        # Otomatik duraklatma ilk aygıtın sesine göre karar verir; tüm parçalar birlikte duraklatılır.
+        return self.tracks[0].gate if self.tracks else None
+
+    @property
+    def ring_buffers(self):
+        return [ring_buffer for session in self._sessions for ring_buffer in session.ring_buffers]
+
+    @property
+    def output_paths(self):
+        return list(self._saved_paths)
+
+    @property
+    def _sessions(self):
+        return self.tracks + ([self.mix] if self.mix is not None else [])
+
+    def open(self):
+        """Her aygıt için ayrı bir kayıt hattı, istenirse parçaları birleştiren hattı da hazırlar."""
+        track_buffers = []
+        if self.interleave:
+            buffer_size = self.rate * self.frame_size * RecordingSession.RING_BUFFER_SECONDS
+            track_buffers = [RingBuffer(buffer_size) for _ in self._sources]
+            mix_channels = self.channels * len(self._sources)
+            mix_path = self.full_path
+            stem, extension = os.path.splitext(self.full_path)
+            if mix_channels > self.MAX_CHANNELS.get(extension.lower(), mix_channels):
+                mix_path = stem + ".wav"
+                log.info("Birleştirilmiş dosya WAV olarak yazılacak", extra={"format": extension, "channels": mix_channels})
+            self.mix = RecordingSession(self.audio_engine, mix_path, self.format, mix_channels,
+                                        self.rate, self.chunk, mic=False, system=False, journal_dir=self.journal_dir,
+                                        upstream_factory=lambda ring_buffer: TrackInterleaver(
+                                            track_buffers, ring_buffer, self.sample_width, self.channels, self.chunk,
+                                            names=self.track_names))
+        for number, source in enumerate(self._sources, start=1):
+            taps = [track_buffers[number - 1].write] if track_buffers else []
+            self.tracks.append(RecordingSession(self.audio_engine, track_path(self.full_path, number), self.format,
+                                                self.channels, self.rate, self.chunk, vad_mode=self.vad_mode,
+                                                journal_dir=self.journal_dir, taps=taps, **source))
+        for session in self._sessions:
+            session.open()
+
+    def start(self):
+        """Tüm aygıtların akışlarını açar; biri açılamazsa açılanlar kapatılır ve hata fırlatılır."""
+        try:
+            for track in self.tracks:
+                track.start()
+        except Exception:
+            self.stop()
+            raise
+
+    def pause(self, auto=False):
+        for track in self.tracks:
+            track.pause(auto)
+
+    def resume(self):
+        for track in self.tracks:
+            track.resume()
+
+    def stop(self):
+        for track in self.tracks:
+            track.stop()
+
+    def finalize(self, peak_cache=None, skip_index_dir=None, progress=None):
+        """
+        Parçaları paralel olarak kapatır: kodlayıcıların boşaltılması ve dönüştürme her parça için ayrı bir iş parçacığında
+        yapılır. Birleştirilmiş dosya parçaların son verisine bağlı olduğundan tüm parçalar bittikten sonra kapatılır.
+        En az bir dosya kaydedildiyse True döndürür; kaydedilen dosyalar output_paths ile alınır.
+        """
+        progress = progress or (lambda percent: None)
+        progress(0)
+        # Önce tüm tamponlar kapatılır ki yazıcılar kalan veriyi aynı anda boşaltmaya başlasın.
+        for track in self.tracks:
+            track.writer.close_input()
+        sessions = self._sessions
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(self.tracks)) as executor:
+            futures = {executor.submit(track.finalize, peak_cache, skip_index_dir): track for track in self.tracks}
+            for done, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                progress(done * 100 // len(sessions))
+        if self.mix is not None:
+            # Parçaların yazıcıları son veriyi dokunuşlarla birleştiriciye aktardı; artık o da kapatılabilir.
+            results[self.mix] = self.mix.finalize(peak_cache, skip_index_dir)
+            progress(100)
+        self._saved_paths = [session.full_path for session in sessions if results[session]]
+        return bool(self._saved_paths)
+
+    def discard(self):
+        for session in self._sessions:
+            session.discard()
+
+    def metrics_snapshot(self):
+        """Her parçanın ve birleştirilmiş dosyanın ölçümleri ile toplam kayıp ses."""
+        snapshot = {"path": self.full_path,
+                    "state": "paused" if self.paused and not self.auto_paused else "recording",
+                    "tracks": {name: track.metrics_snapshot() for name, track in zip(self.track_names, self.tracks)}}
+        if self.mix is not None:
+            snapshot["interleaved"] = self.mix.metrics_snapshot()
+        snapshot["overruns"], snapshot["lost_s"] = self.lost_audio()
+        return snapshot
+
+    def lost_audio(self):
+        """Tüm parçalarda tampon taşmaları nedeniyle atılan (parça sayısı, saniye) bilgisini döndürür."""
+        overruns = 0
+        lost_seconds = 0.0
+        for session in self._sessions:
+            session_overruns, session_lost = session.lost_audio()
+            overruns += session_overruns
+            lost_seconds = max(lost_seconds, session_lost)
+        return overruns, lost_seconds
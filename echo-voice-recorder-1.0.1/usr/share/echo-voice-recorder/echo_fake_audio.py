@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Ses donanımı gerektirmeyen sahte PyAudio arka ucu.
+Giriş akışları üretilen sinyallerle geri çağrıyı gerçek zamanda ya da hızlandırılmış olarak çalıştırır;
+çıkış akışları yazılan veriyi aynı hızda tüketir. Ekransız makinelerde testler ve ölçümler (benchmarks/) için
+kullanılır; uygulama ECHO_AUDIO_BACKEND=fake ortam değişkeniyle bu arka uca geçer:
+
+    ECHO_AUDIO_BACKEND=fake ECHO_FAKE_AUDIO_SPEED=10 ECHO_FAKE_AUDIO_SIGNAL=speech echo-voice-recorder --headless
+"""
+
+import os
+import threading
+import time
+import numpy as np
+
+from echo_engine import float32_to_pcm
+from echo_portaudio import pyaudio
+
+SIGNALS = ("sine", "speech", "noise", "silence")
+
+class SignalGenerator:
+    """
+    Kesintisiz bir test sinyali üretir. 'speech' konuşmayı taklit eden aralıklı bir tondur
+    (1,5 s ses, 1 s sessizlik); sessizlik algılamanın ölçümü için kullanılır.
+    """
+    def __init__(self, kind, rate, channels, sample_width, frequency=440.0, amplitude=0.3):
+        if kind not in SIGNALS:
+            raise ValueError(f"Bilinmeyen sinyal türü: {kind}")
+        self.kind = kind
+        self.rate = rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.position = 0
+        self._random = np.random.default_rng(0)
+
+    def skip(self, frames):
+        self.position += frames
+
+    def read(self, frames):
+        if self.kind == "silence":
+            samples = np.zeros(frames, dtype=np.float32)
+        elif self.kind == "noise":
+            samples = self._random.uniform(-self.amplitude, self.amplitude, frames).astype(np.float32)
+        else:
+            t = (np.arange(frames) + self.position) / float(self.rate)
+            samples = (self.amplitude * np.sin(2 * np.pi * self.frequency * t)).astype(np.float32)
+            if self.kind == "speech":
+                samples[(t % 2.5) >= 1.5] = 0.0
+        self.position += frames
+        if self.channels > 1:
+            samples = np.repeat(samples, self.channels)
+        return float32_to_pcm(samples, self.sample_width)
+
+class FakeInputStream:
+    """
+    Geri çağrıyı kendi iş parçacığında, parça süresinin hız katsayısına bölümüyle belirlenen aralıklarla çağırır.
+    Zamanlama mutlak bir takvime göre yapılır; gecikmeler birikmez. Bir parçadan fazla geride kalınırsa
+    gerçek bir aygıt gibi parçalar atlanır ve geri çağrıya paInputOverflow bildirilir.
+    """
+    def __init__(self, backend, format, channels, rate, frames_per_buffer=1024, stream_callback=None,
+                 input_device_index=None, start=True, **kwargs):
+        self.backend = backend
+        self.channels = channels
+        self.rate = rate
+        self.frames_per_buffer = frames_per_buffer
+        self.stream_callback = stream_callback
+        device = backend.get_device_info_by_index(input_device_index if input_device_index is not None else 0)
+        self.generator = SignalGenerator(backend.signal if device["signal"] is None else device["signal"], rate, channels,
+                                         pyaudio.get_sample_size(format), frequency=device["frequency"])
+        self.callback_times = []  # Her geri çağrının başladığı an (perf_counter)
+        self.dropped_chunks = 0
+        self._active = threading.Event()
+        self._closed = False
+        self._next_time = None
+        self._thread = None
+        if stream_callback is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        if start:
+            self.start_stream()
+
+    def _period(self):
+        return self.frames_per_buffer / float(self.rate) / self.backend.speed
+
+    def _wait_for_slot(self):
+        """Bir sonraki parçanın zamanına kadar bekler; atlanan parça sayısını döndürür."""
+        period = self._period()
+        now = time.perf_counter()
+        if self._next_time is None:
+            self._next_time = now
+        self._next_time += period
+        delay = self._next_time - now
+        if delay > 0:
+            time.sleep(delay)
+            return 0
+        skipped = int(-delay // period)
+        if skipped:
+            self._next_time += skipped * period
+            self.dropped_chunks += skipped
+            self.generator.skip(skipped * self.frames_per_buffer)
+        return skipped
+
+    def _run(self):
+        while not self._closed:
+            if not self._active.wait(0.1):
+                continue
+            skipped = self._wait_for_slot()
+            if not self._active.is_set() or self._closed:
+                continue
+            data = self.generator.read(self.frames_per_buffer)
+            self.callback_times.append(time.perf_counter())
+            _, flag = self.stream_callback(data, self.frames_per_buffer, {}, pyaudio.paInputOverflow if skipped else 0)
+            if flag != pyaudio.paContinue:
+                self._active.clear()
+
+    def read(self, num_frames, exception_on_overflow=True):
+        self._wait_for_slot()
+        return self.generator.read(num_frames)
+
+    def start_stream(self):
+        self._next_time = None
+        self._active.set()
+
+    def stop_stream(self):
+        self._active.clear()
+
+    def is_active(self):
+        return self._active.is_set()
+
+    def is_stopped(self):
+        return not self._active.is_set()
+
+    def close(self):
+        self._active.clear()
+        self._closed = True
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+class FakeOutputStream:
+    """Yazılan veriyi çalma hızında tüketen sahte hoparlör; ilk sesin çıktığı an ölçümler için saklanır."""
+    def __init__(self, backend, format, channels, rate, start=True, **kwargs):
+        self.backend = backend
+        self.frame_size = channels * pyaudio.get_sample_size(format)
+        self.rate = rate
+        self.first_write_time = None
+        self.frames_written = 0
+        self._next_time = None
+        self._active = start
+
+    def write(self, frames, num_frames=None, exception_on_underflow=False):
+        now = time.perf_counter()
+        if self.first_write_time is None:
+            self.first_write_time = now
+        if self._next_time is None or self._next_time < now:
+            self._next_time = now
+        count = len(frames) // self.frame_size
+        self.frames_written += count
+        self._next_time += count / float(self.rate) / self.backend.speed
+        # Gerçek bir aygıtın tamponu gibi, yazma en fazla bir parça öne geçebilir.
+        delay = self._next_time - now - count / float(self.rate) / self.backend.speed
+        if delay > 0:
+            time.sleep(delay)
+
+    def start_stream(self):
+        self._next_time = None
+        self._active = True
+
+    def stop_stream(self):
+        self._active = False
+
+    def is_active(self):
+        return self._active
+
+    def is_stopped(self):
+        return not self._active
+
+    def close(self):
+        self._active = False
+
+class FakeAudioBackend:
+    """
+    PyAudio.PyAudio ile aynı arayüzü sunan sahte arka uç.
+    speed > 1 zamanı hızlandırır: 100 ile bir saatlik kayıt 36 saniyede oluşur.
+    Açılan akışlar ölçüm için streams listesinde tutulur.
+    """
+    DEVICES = [
+        {"name": "Fake Microphone", "maxInputChannels": 8, "maxOutputChannels": 0, "defaultSampleRate": 48000.0,
+         "signal": None, "frequency": 440.0},
+        {"name": "Monitor of Fake Output", "maxInputChannels": 2, "maxOutputChannels": 0, "defaultSampleRate": 48000.0,
+         "signal": "sine", "frequency": 220.0},
+        {"name": "Fake Output", "maxInputChannels": 0, "maxOutputChannels": 8, "defaultSampleRate": 48000.0,
+         "signal": None, "frequency": 0.0},
+        {"name": "Fake USB Microphone", "maxInputChannels": 2, "maxOutputChannels": 0, "defaultSampleRate": 48000.0,
+         "signal": None, "frequency": 330.0},
+    ]
+    SUPPORTED_RATES = (8000, 11025, 16000, 22050, 32000, 44100, 48000, 88200, 96000, 176400, 192000)
+
+    def __init__(self, speed=1.0, signal="sine"):
+        if speed <= 0:
+            raise ValueError("Hız katsayısı pozitif olmalıdır.")
+        if signal not in SIGNALS:
+            raise ValueError(f"Bilinmeyen sinyal türü: {signal}")
+        self.speed = float(speed)
+        self.signal = signal
+        self.streams = []
+
+    @classmethod
+    def from_environment(cls):
+        return cls(speed=float(os.environ.get("ECHO_FAKE_AUDIO_SPEED", "1")),
+                   signal=os.environ.get("ECHO_FAKE_AUDIO_SIGNAL", "sine"))
+
+    def open(self, rate, channels, format, input=False, output=False, **kwargs):
+        if input:
+            stream = FakeInputStream(self, format, channels, rate, **kwargs)
+        elif output:
+            stream = FakeOutputStream(self, format, channels, rate, **kwargs)
+        else:
+            raise ValueError("Akış giriş ya da çıkış olmalıdır.")
+        self.streams.append(stream)
+        return stream
+
+    def get_sample_size(self, format):
+        return pyaudio.get_sample_size(format)
+
+    def get_format_from_width(self, width, unsigned=True):
+        return pyaudio.get_format_from_width(width, unsigned)
+
+    def get_device_count(self):
+        return len(self.DEVICES)
+
+    def get_device_info_by_index(self, device_index):
+        if not 0 <= device_index < len(self.DEVICES):
+            raise IOError("Geçersiz aygıt dizini.")
+        return dict(self.DEVICES[device_index], index=device_index, hostApi=0)
+
+    def get_default_input_device_info(self):
+        return self.get_device_info_by_index(0)
+
+    def get_default_output_device_info(self):
+        return self.get_device_info_by_index(2)
+
+    def is_format_supported(self, rate, input_device=None, input_channels=None, input_format=None,
+                            output_device=None, output_channels=None, output_format=None):
+        if rate not in self.SUPPORTED_RATES:
+            raise ValueError("Invalid sample rate")
+        for device, channels, key in ((input_device, input_channels, "maxInputChannels"),
+                                      (output_device, output_channels, "maxOutputChannels")):
+            if device is not None and channels > self.get_device_info_by_index(device)[key]:
+                raise ValueError("Invalid number of channels")
+        return True
+
+    def terminate(self):
+        for stream in self.streams:
+            stream.close()
+        self.streams = []
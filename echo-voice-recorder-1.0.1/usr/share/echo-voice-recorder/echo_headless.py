@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Echo Ses Kaydedici'nin başsız (ekransız) kayıt modu.
+Sunucularda ve kiosklarda pencere açmadan kayıt yapar; PyQt5, yazı tipi ve simgeler yüklenmez.
+Çalışan örnek, yerel bir Unix soketi üzerinden satır tabanlı komutlarla yönetilir:
+
+    echo-voice-recorder --headless [--start] [--source mic|system|both]
+    echo-voice-recorder --control start|pause|resume|stop|status|quit
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+from echo_engine import (CAPTURE_PROFILES, resolve_capture_profile, AudioEngine, RecordingSession, MultiDeviceSession, RecordingLibrary,
+                         PeakCache, list_devices, find_input_device, find_monitor_device, recover_sessions)
+from echo_metrics import configure_logging, write_metrics_file
+
+log = logging.getLogger("echo.headless")
+
+CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".EchoVoiceRecorder")
+COMMANDS = ("start", "pause", "resume", "stop", "status", "quit")
+METRICS_INTERVAL = 5.0
+
+def default_socket_path():
+    """Kontrol soketinin yolu: varsa XDG_RUNTIME_DIR, yoksa ayar dizini."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "echo-voice-recorder.sock")
+    return os.path.join(CONFIG_DIR, "control.sock")
+
+def load_settings(config_dir=CONFIG_DIR):
+    """Pencereli uygulamanın userdata.json dosyasındaki kayıt ayarlarını okur."""
+    settings = {"record_format": ".WAV", "capture_profile": "standard", "custom_profile": dict(CAPTURE_PROFILES["standard"]),
+                "mic_gain": 1.0, "system_gain": 1.0, "vad_mode": "off", "input_device": None,
+                "input_devices": [], "interleave_devices": False}
+    try:
+        with open(os.path.join(config_dir, "userdata.json"), 'r') as f:
+            stored = json.load(f)
+        settings.update({key: value for key, value in stored.items() if key in settings and key != "custom_profile"})
+        settings["custom_profile"].update(stored.get("custom_profile", {}))
+    except (IOError, ValueError) as e:
+        log.warning("Ayarlar dosyası okunamadı, varsayılanlar kullanılıyor: %s", e)
+    return settings
+
+class HeadlessRecorder:
+    """Kontrol komutlarını kayıt oturumlarına çevirir; kayıtlar pencereli uygulamanın kütüphanesine eklenir."""
+
+    def __init__(self, settings, source="mic", record_path=None, config_dir=CONFIG_DIR):
+        self.settings = settings
+        self.mic = source in ("mic", "both")
+        self.system = source in ("system", "both")
+        self.config_dir = config_dir
+        self.record_path = record_path or os.path.expanduser("~")
+        self.library = RecordingLibrary(os.path.join(config_dir, "library.json"), self.record_path)
+        self.library.load()
+        # Tarama en büyük recN numarasını bulur ve silinen dosyaları dizinden çıkarır; yeni kayıt adları
+        # böylece klasördeki tüm adlar denenmeden seçilir. Değişen dosyaların bilgileri pencereli uygulamaya bırakılır.
+        self.library.scan()
+        self.peak_cache = PeakCache(os.path.join(config_dir, "peaks"))
+        self.skip_index_dir = os.path.join(config_dir, "skipped")
+        self.sessions_dir = os.path.join(config_dir, "sessions")
+        self.metrics_file = os.path.join(config_dir, "headless-metrics.json")
+        self.last_recording_metrics = None
+        self.audio_engine = AudioEngine()
+        self.session = None
+        self.started_at = None
+        self.pending_paths = set()
+        self.finalize_threads = []
+        self._lock = threading.Lock()
+
+        profile = settings["custom_profile"] if settings["capture_profile"] == "custom" else CAPTURE_PROFILES.get(settings["capture_profile"], CAPTURE_PROFILES["standard"])
+        self.format, self.channels, self.rate, self.chunk = resolve_capture_profile(profile)
+
+    def recover(self):
+        """Önceki çalışmada yarım kalan kayıtları birleştirip kütüphaneye ekler."""
+        recovered = recover_sessions(self.sessions_dir)
+        for path in recovered:
+            if self.library.contains_path(path):
+                self.library.update(os.path.basename(path), self.library.build_entry(path))
+        if recovered:
+            self.library.save()
+        return recovered
+
+    def start(self):
+        if self.session is not None:
+            return {"ok": False, "error": "Kayıt zaten sürüyor."}
+        devices = list_devices(self.audio_engine.pa)
+        input_device_index = find_input_device(devices, self.settings["input_device"]) if self.settings["input_device"] else None
+        multi_devices = self._multi_devices(devices) if self.mic else []
+        if self.mic:
+            try:
+                for index in [index for index, _ in multi_devices] or [input_device_index]:
+                    self.audio_engine.check_input_format(self.rate, self.channels, self.format, index)
+            except ValueError as e:
+                return {"ok": False, "error": f"Ses aygıtı bu ayarları desteklemiyor: {e}"}
+
+        full_path = self.library.next_record_path(self.settings["record_format"], self.pending_paths)
+        if multi_devices:
+            session = MultiDeviceSession(self.audio_engine, full_path, self.format, self.channels, self.rate, self.chunk,
+                                         [index for index, _ in multi_devices], system=self.system,
+                                         monitor_device_index=find_monitor_device(devices),
+                                         vad_mode=self.settings["vad_mode"], interleave=self.settings["interleave_devices"],
+                                         journal_dir=self.sessions_dir, track_names=[name for _, name in multi_devices],
+                                         mic_gain=self.settings["mic_gain"], system_gain=self.settings["system_gain"])
+        else:
+            session = RecordingSession(self.audio_engine, full_path, self.format, self.channels, self.rate, self.chunk,
+                                       mic=self.mic, system=self.system,
+                                       input_device_index=input_device_index,
+                                       monitor_device_index=find_monitor_device(devices),
+                                       mic_gain=self.settings["mic_gain"], system_gain=self.settings["system_gain"],
+                                       vad_mode=self.settings["vad_mode"],
+                                       journal_dir=self.sessions_dir)
+        try:
+            session.open()
+            session.start()
+        except Exception as e:
+            session.discard()
+            return {"ok": False, "error": f"Kayıt başlatılamadı: {e}"}
+        self.session = session
+        self.started_at = time.time()
+        log.info("Kayıt başlatıldı", extra={"path": full_path, "mic": self.mic, "system": self.system,
+                                            "devices": len(multi_devices) or 1})
+        return {"ok": True, "path": full_path}
+
+    def _multi_devices(self, devices):
+        """Ayarlarda en az iki aygıt seçiliyse takılı olanların (dizin, ad) listesini döndürür; aksi hâlde boş liste."""
+        if len(self.settings["input_devices"]) < 2:
+            return []
+        found = []
+        for name in self.settings["input_devices"]:
+            index = find_input_device(devices, name)
+            if index is None:
+                log.warning("Giriş aygıtı bulunamadı, çoklu kayıtta atlanıyor", extra={"device": name})
+            else:
+                found.append((index, name))
+        return found if len(found) > 1 else []
+
+    def pause(self):
+        if self.session is None:
+            return {"ok": False, "error": "Kayıt aktif değil."}
+        self.session.pause()
+        return {"ok": True}
+
+    def resume(self):
+        if self.session is None:
+            return {"ok": False, "error": "Kayıt aktif değil."}
+        self.session.resume()
+        return {"ok": True}
+
+    def update_auto_pause(self):
+        """Otomatik duraklatma kipinde sessizlik algılayıcısının durumunu oturumun duraklatma durumuna yansıtır."""
+        session = self.session
+        if session is None or self.settings["vad_mode"] != "auto_pause" or session.gate is None:
+            return
+        if session.gate.is_silent and not session.paused:
+            session.pause(auto=True)
+        elif not session.gate.is_silent and session.auto_paused:
+            session.resume()
+
+    def stop(self):
+        if self.session is None:
+            return {"ok": False, "error": "Kayıt aktif değil."}
+        session = self.session
+        self.session = None
+        session.stop()
+        self.pending_paths.add(session.full_path)
+        # Kodlayıcının kapanması ve dalga formu kaydı soketin yanıt vermesini geciktirmesin diye ayrı iş parçacığında yapılır.
+        thread = threading.Thread(target=self._finalize, args=(session,))
+        self.finalize_threads.append(thread)
+        thread.start()
+        return {"ok": True, "path": session.full_path}
+
+    def _finalize(self, session):
+        try:
+            if session.finalize(self.peak_cache, self.skip_index_dir):
+                with self._lock:
+                    for path in session.output_paths:
+                        self.library.update(os.path.basename(path), self.library.build_entry(path))
+                    self.library.save()
+            overruns, lost_seconds = session.lost_audio()
+            if overruns:
+                log.warning("Tampon taştı, ses kayboldu", extra={"overruns": overruns, "lost_s": round(lost_seconds, 2)})
+        except Exception as e:
+            log.error("Dosya kaydedilirken bir hata oluştu: %s", e, extra={"path": session.full_path})
+        finally:
+            self.last_recording_metrics = session.metrics_snapshot()
+            self.pending_paths.discard(session.full_path)
+            self.write_metrics()
+
+    def status(self):
+        if self.session is None:
+            return {"ok": True, "state": "idle", "saving": len(self.pending_paths)}
+        rms, peak = self.session.level_analyzer.read_levels()
+        return {"ok": True,
+                "state": ("auto_paused" if self.session.auto_paused else "paused") if self.session.paused else "recording",
+                "path": self.session.full_path,
+                "elapsed": round(time.time() - self.started_at, 1),
+                "level": {"rms": round(rms, 4), "peak": round(peak, 4)},
+                "saving": len(self.pending_paths),
+                "metrics": self.session.metrics_snapshot()}
+
+    def write_metrics(self):
+        """Süren ve son biten kaydın ölçümlerini ayar dizinindeki JSON dosyasına yazar."""
+        session = self.session
+        write_metrics_file(self.metrics_file, {"mode": "headless",
+                                               "recording": session.metrics_snapshot() if session is not None else None,
+                                               "last_recording": self.last_recording_metrics})
+
+    def shutdown(self):
+        """Süren kaydı durdurur ve tüm kayıtlar diske yazılana kadar bekler."""
+        if self.session is not None:
+            self.stop()
+        for thread in self.finalize_threads:
+            thread.join()
+        self.audio_engine.terminate()
+
+    def handle(self, command):
+        if command not in COMMANDS or command == "quit":
+            return {"ok": False, "error": f"Bilinmeyen komut: {command}"}
+        return getattr(self, command)()
+
+def serve(recorder, socket_path):
+    """Kontrol soketini dinler; 'quit' komutu ya da SIGINT/SIGTERM gelene kadar çalışır."""
+    if os.path.exists(socket_path):
+        # Önceki bir çalışmadan kalmış soket dosyası; başka bir örnek dinliyorsa onu bozmayız.
+        try:
+            send_command(socket_path, "status")
+        except OSError:
+            os.remove(socket_path)
+        else:
+            raise RuntimeError(f"Başka bir örnek zaten çalışıyor: {socket_path}")
+
+    os.makedirs(os.path.dirname(socket_path), mode=0o700, exist_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Soket dosyası bind() sırasında oluşturulur; başka kullanıcılar chmod'dan önceki anda da bağlanamasın diye
+    # dosya baştan yalnızca sahibine açık izinlerle oluşturulur.
+    old_umask = os.umask(0o077)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    os.chmod(socket_path, 0o600)
+    server.listen(4)
+    server.settimeout(0.5)
+
+    stop_event = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *args: stop_event.set())
+
+    log.info("Başsız mod hazır", extra={"socket": socket_path})
+    last_metrics = time.monotonic()
+    try:
+        while not stop_event.is_set():
+            recorder.update_auto_pause()
+            if recorder.session is not None and time.monotonic() - last_metrics >= METRICS_INTERVAL:
+                last_metrics = time.monotonic()
+                recorder.write_metrics()
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                continue
+            except InterruptedError:
+                continue
+            with connection:
+                connection.settimeout(2.0)
+                try:
+                    command = connection.makefile('r', encoding='utf-8').readline().strip().lower()
+                except (OSError, ValueError):
+                    continue
+                if command == "quit":
+                    response = {"ok": True}
+                    stop_event.set()
+                else:
+                    response = recorder.handle(command)
+                try:
+                    connection.sendall((json.dumps(response, ensure_ascii=False) + "\n").encode('utf-8'))
+                except OSError:
+                    pass
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        recorder.shutdown()
+
+def send_command(socket_path, command):
+    """Çalışan örneğe bir komut gönderir ve JSON yanıtını döndürür."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(5.0)
+        client.connect(socket_path)
+        client.sendall((command + "\n").encode('utf-8'))
+        return json.loads(client.makefile('r', encoding='utf-8').readline())
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="echo-voice-recorder", description="Echo Ses Kaydedici - başsız kayıt modu")
+    parser.add_argument("--headless", action="store_true", help="Pencere açmadan çalış ve kontrol soketini dinle")
+    parser.add_argument("--control", choices=COMMANDS, help="Çalışan başsız örneğe komut gönder")
+    parser.add_argument("--start", action="store_true", help="Açılır açılmaz kayda başla")
+    parser.add_argument("--source", choices=("mic", "system", "both"), default="mic", help="Kaydedilecek ses kaynağı")
+    parser.add_argument("--output-dir", help="Kayıtların yazılacağı dizin (varsayılan: ev dizini)")
+    parser.add_argument("--socket", default=default_socket_path(), help="Kontrol soketinin yolu")
+    args = parser.parse_args(argv)
+
+    if args.control:
+        try:
+            response = send_command(args.socket, args.control)
+        except OSError as e:
+            print(f"Başsız örneğe bağlanılamadı ({args.socket}): {e}", file=sys.stderr)
+            return 1
+        print(json.dumps(response, ensure_ascii=False))
+        return 0 if response.get("ok") else 1
+
+    configure_logging()
+    recorder = HeadlessRecorder(load_settings(), source=args.source, record_path=args.output_dir)
+    recorder.recover()
+    if args.start:
+        response = recorder.start()
+        if not response["ok"]:
+            log.error(response["error"])
+    try:
+        serve(recorder, args.socket)
+    except (OSError, RuntimeError) as e:
+        log.error("Kontrol soketi açılamadı: %s", e)
+        recorder.shutdown()
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
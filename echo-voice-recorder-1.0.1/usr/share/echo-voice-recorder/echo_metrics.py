@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Echo Ses Kaydedici'nin ölçüm ve günlük altyapısı.
+Ses geri çağrılarında yalnızca birkaç sayaç artırılır; toplanan değerler istatistik panelinde,
+~/.EchoVoiceRecorder altındaki metrics.json dosyasında ve başsız modun 'status' yanıtında gösterilir.
+Günlük kayıtları ECHO_LOG_LEVEL ve ECHO_LOG_FORMAT=json ortam değişkenleriyle ayarlanır.
+"""
+
+import bisect
+import json
+import logging
+import os
+import sys
+import time
+from echo_portaudio import pyaudio
+
+# PortAudio'nun geri çağrıya ve yazma işlemine bildirdiği durum bayrakları.
+STATUS_FLAG_NAMES = {
+    pyaudio.paInputUnderflow: "input_underflow",
+    pyaudio.paInputOverflow: "input_overflow",
+    pyaudio.paOutputUnderflow: "output_underflow",
+    pyaudio.paOutputOverflow: "output_overflow",
+    pyaudio.paPrimingOutput: "priming_output",
+}
+
+class LatencyHistogram:
+    """
+    Süreleri logaritmik kovalarda sayar. Sıcak yolda yalnızca bir ikili arama ve birkaç toplama yapılır;
+    kilit kullanılmaz (tek yazıcı, okuyucular yaklaşık bir anlık görüntüyle yetinir).
+    """
+    BOUNDS_US = (50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000)
+
+    def __init__(self):
+        self._bounds = tuple(bound / 1e6 for bound in self.BOUNDS_US)
+        self.buckets = [0] * (len(self.BOUNDS_US) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.buckets[bisect.bisect_left(self._bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        """Yüzdelik değerin üst sınırını (ms) kovalardan tahmin eder."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return self.BOUNDS_US[index] / 1000.0 if index < len(self.BOUNDS_US) else self.max * 1000
+        return self.max * 1000
+
+    def snapshot(self):
+        labels = [f"<{bound}us" for bound in self.BOUNDS_US] + [f">={self.BOUNDS_US[-1]}us"]
+        return {"count": self.count,
+                "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+                "p50_ms": self.percentile(0.5),
+                "p99_ms": self.percentile(0.99),
+                "max_ms": round(self.max * 1000, 3),
+                "buckets": {label: count for label, count in zip(labels, self.buckets) if count}}
+
+class StatusFlagCounter:
+    """PortAudio durum bayraklarının (taşma, boşalma) kaç kez bildirildiğini sayar."""
+    def __init__(self):
+        self.counts = dict.fromkeys(STATUS_FLAG_NAMES.values(), 0)
+
+    def observe(self, status):
+        if status:
+            for flag, name in STATUS_FLAG_NAMES.items():
+                if status & flag:
+                    self.counts[name] += 1
+
+    def add(self, name):
+        self.counts[name] += 1
+
+    def snapshot(self):
+        return {name: count for name, count in self.counts.items() if count}
+
+class RecordingMetrics:
+    """Bir kayıt oturumunun geri çağrı süreleri, durum bayrakları ve kaydetme gecikmesi."""
+    def __init__(self):
+        self.started_at = time.time()
+        self.callbacks = {"mic": LatencyHistogram(), "system": LatencyHistogram()}
+        self.status_flags = StatusFlagCounter()
+        self.save_seconds = None
+
+    def observe_callback(self, source, seconds, status):
+        self.callbacks[source].observe(seconds)
+        if status:
+            self.status_flags.observe(status)
+
+    def snapshot(self):
+        return {"started_at": self.started_at,
+                "callbacks": {source: histogram.snapshot() for source, histogram in self.callbacks.items() if histogram.count},
+                "status_flags": self.status_flags.snapshot(),
+                "save_latency_ms": round(self.save_seconds * 1000, 1) if self.save_seconds is not None else None}
+
+def write_metrics_file(path, metrics):
+    """Ölçümleri geçici bir dosyaya yazıp atomik olarak yerine taşır; okuyan araçlar yarım dosya görmez."""
+    temp_file = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(dict(metrics, written_at=time.time()), f, ensure_ascii=False, indent=1)
+        os.replace(temp_file, path)
+    except (IOError, TypeError, ValueError) as e:
+        logging.getLogger("echo.metrics").warning("Ölçüm dosyası yazılamadı: %s", e, extra={"path": path})
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Günlük satırına extra= ile verilen alanları ekler: metin biçiminde 'anahtar=değer',
+    JSON biçiminde her satır tek bir nesne olarak yazılır.
+    """
+    RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+    def __init__(self, json_output=False):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        self.json_output = json_output
+
+    def format(self, record):
+        fields = {key: value for key, value in vars(record).items() if key not in self.RESERVED}
+        if self.json_output:
+            entry = {"time": round(record.created, 3), "level": record.levelname, "logger": record.name,
+                     "message": record.getMessage(), **fields}
+            if record.exc_info:
+                entry["exception"] = self.formatException(record.exc_info)
+            return json.dumps(entry, ensure_ascii=False, default=str)
+        line = super().format(record)
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+def configure_logging():
+    """Uygulamanın günlük kayıtlarını standart hata akışına yönlendirir."""
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(StructuredFormatter(json_output=os.environ.get("ECHO_LOG_FORMAT") == "json"))
+    root = logging.getLogger("echo")
+    root.handlers[:] = [handler]
+    level_name = (os.environ.get("ECHO_LOG_LEVEL") or "INFO").strip().upper()
+    # getLevelName bilinen adlar için sayısal düzeyi, bilinmeyenler için "Level X" metnini döndürür.
+    level = logging.getLevelName(level_name)
+    root.setLevel(level if isinstance(level, int) else logging.INFO)
+    root.propagate = False
+    if not isinstance(level, int):
+        root.warning("ECHO_LOG_LEVEL geçersiz, INFO kullanılıyor", extra={"value": level_name})
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+PyAudio'yu içe aktarır. PyAudio kurulu değilse (ör. testlerin ve ölçümlerin çalıştığı makinelerde) sahte ses
+arka ucunun (echo_fake_audio) ihtiyaç duyduğu PortAudio sabitleri ve yardımcıları aynı adlar ve değerlerle sağlanır;
+gerçek ses aygıtı açılmaya çalışılırsa create_audio_backend() anlaşılır bir hata verir.
+
+    from echo_portaudio import pyaudio, HAVE_PYAUDIO
+"""
+
+try:
+    import pyaudio
+    HAVE_PYAUDIO = True
+except ImportError:
+    HAVE_PYAUDIO = False
+
+    class pyaudio:
+        """PyAudio'nun sahte arka uçla kullanılan sabitleri (portaudio.h ile aynı değerler)."""
+        paFloat32 = 1
+        paInt32 = 2
+        paInt24 = 4
+        paInt16 = 8
+        paInt8 = 16
+        paUInt8 = 32
+
+        paContinue = 0
+        paComplete = 1
+        paAbort = 2
+
+        paInputUnderflow = 1
+        paInputOverflow = 2
+        paOutputUnderflow = 4
+        paOutputOverflow = 8
+        paPrimingOutput = 16
+
+        paOutputUnderflowed = -9980
+
+        _SAMPLE_SIZES = {paFloat32: 4, paInt32: 4, paInt24: 3, paInt16: 2, paInt8: 1, paUInt8: 1}
+
+        @classmethod
+        def get_sample_size(cls, format):
+            try:
+                return cls._SAMPLE_SIZES[format]
+            except KeyError:
+                raise ValueError(f"Geçersiz örnek biçimi: {format}") from None
+
+        @classmethod
+        def get_format_from_width(cls, width, unsigned=True):
+            formats = {1: cls.paUInt8 if unsigned else cls.paInt8, 2: cls.paInt16, 3: cls.paInt24, 4: cls.paFloat32}
+            try:
+                return formats[width]
+            except KeyError:
+                raise ValueError(f"Geçersiz örnek genişliği: {width}") from None
@@ -0,0 +1,68 @@
+"""
+Kapsayıcı başlığı okuyucularının (probe_audio_header) gidiş-dönüş denetimi.
+Her biçim için ffmpeg ile bilinen süre, hız ve kanal sayısında bir dosya üretilir ve başlıktan
+okunan değerlerin bunlarla eşleştiği doğrulanır. ffmpeg ya da ilgili kodlayıcı yoksa denetim atlanır.
+
+    python3 -m unittest discover tests
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                                "echo-voice-recorder-1.0.1", "usr", "share", "echo-voice-recorder"))
+from echo_engine import probe_audio_header  # noqa: E402
+
+DURATION = 10.0
+RATE = 44100
+CHANNELS = 2
+
+# (ad, dosya uzantısı, ffmpeg çıkış ayarları, beklenen hız, süre toleransı)
+CASES = [
+    ("wav", ".wav", ["-c:a", "pcm_s16le"], RATE, 0.01),
+    ("flac", ".flac", ["-c:a", "flac"], RATE, 0.01),
+    ("ogg_vorbis", ".ogg", ["-c:a", "libvorbis"], RATE, 0.05),
+    ("ogg_opus", ".ogg", ["-c:a", "libopus", "-ar", "48000"], 48000, 0.05),
+    ("ogg_flac", ".ogg", ["-c:a", "flac", "-f", "ogg"], RATE, 0.05),
+    ("mp3_xing", ".mp3", ["-c:a", "libmp3lame", "-q:a", "4"], RATE, 0.1),
+    ("mp3_cbr", ".mp3", ["-c:a", "libmp3lame", "-b:a", "128k", "-write_xing", "0"], RATE, 0.1),
+    ("adts", ".aac", ["-c:a", "aac", "-b:a", "128k", "-f", "adts"], RATE, 0.3),
+]
+
+class HeaderProbeRoundTrip(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ffmpeg = shutil.which("ffmpeg")
+        if not cls.ffmpeg:
+            raise unittest.SkipTest("ffmpeg bulunamadı")
+        cls.work_dir = tempfile.mkdtemp(prefix="echo-probe-")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.work_dir, ignore_errors=True)
+
+    def encode(self, name, extension, output_args):
+        path = os.path.join(self.work_dir, name + extension)
+        command = [self.ffmpeg, "-v", "error", "-y", "-f", "lavfi",
+                   "-i", f"sine=frequency=440:sample_rate={RATE}:duration={DURATION}",
+                   "-ac", str(CHANNELS)] + output_args + [path]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            self.skipTest(f"ffmpeg {name} üretemedi: {result.stderr.strip()}")
+        return path
+
+    def test_round_trip(self):
+        for name, extension, output_args, rate, tolerance in CASES:
+            with self.subTest(name):
+                info = probe_audio_header(self.encode(name, extension, output_args))
+                self.assertIsNotNone(info, f"{name} başlığı çözülemedi")
+                self.assertEqual(info["rate"], rate)
+                self.assertEqual(info["channels"], CHANNELS)
+                self.assertAlmostEqual(info["duration"], DURATION, delta=tolerance)
+
+if __name__ == '__main__':
+    unittest.main()
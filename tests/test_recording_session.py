@@ -0,0 +1,97 @@
+"""
+Kayıt oturumunun uçtan uca davranışı; ses donanımı yerine sahte arka uç (echo_fake_audio) hızlandırılmış zamanda kullanılır.
+
+    python3 -m unittest discover tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+import wave
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                                "echo-voice-recorder-1.0.1", "usr", "share", "echo-voice-recorder"))
+from echo_engine import (CAPTURE_PROFILES, AudioEngine, MultiDeviceSession, PeakCache, RecordingSession,  # noqa: E402
+                         resolve_capture_profile)
+from echo_fake_audio import FakeAudioBackend  # noqa: E402
+
+SPEED = 50.0
+
+class RecordingSessionTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="echo-session-test-")
+        self.format, self.channels, self.rate, self.chunk = resolve_capture_profile(CAPTURE_PROFILES["standard"])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def record(self, seconds, signal="sine", name="rec1.wav", **options):
+        """Sahte mikrofondan yaklaşık 'seconds' saniyelik kayıt yapar; oturumu ve ölçülen seviyeleri döndürür."""
+        backend = FakeAudioBackend(speed=SPEED, signal=signal)
+        audio_engine = AudioEngine(backend_factory=lambda: backend)
+        self.addCleanup(audio_engine.terminate)
+        session_class = MultiDeviceSession if "input_device_indices" in options else RecordingSession
+        arguments = [options.pop("input_device_indices")] if session_class is MultiDeviceSession else []
+        session = session_class(audio_engine, os.path.join(self.directory, name), self.format, self.channels,
+                                self.rate, self.chunk, *arguments, journal_dir=os.path.join(self.directory, "sessions"),
+                                **options)
+        session.open()
+        session.start()
+        levels = []
+        deadline = time.monotonic() + seconds / SPEED
+        while time.monotonic() < deadline:
+            time.sleep(0.02)
+            levels.append(session.level_analyzer.read_levels()[0])
+        session.stop()
+        self.assertTrue(session.finalize(PeakCache(os.path.join(self.directory, "peaks")), os.path.join(self.directory, "skipped")))
+        return session, levels
+
+    def duration(self, path):
+        with wave.open(path, 'rb') as wf:
+            return wf.getnframes() / float(wf.getframerate())
+
+    def test_wav_take_is_written_and_its_journal_removed(self):
+        session, levels = self.record(20)
+        self.assertAlmostEqual(self.duration(session.full_path), 20, delta=3)
+        self.assertEqual(os.listdir(os.path.join(self.directory, "sessions")), [])
+        self.assertEqual(session.lost_audio(), (0, 0.0))
+        self.assertGreater(max(levels), 0.1)
+        self.assertTrue(os.listdir(os.path.join(self.directory, "peaks")))
+
+    def test_skip_mode_drops_silence_and_indexes_it(self):
+        session, _ = self.record(20, signal="speech", vad_mode="skip")
+        # 'speech' sinyalinin 2,5 sn'lik döngüsünde 1 sn sessizlik var; pre-roll ve hangover'dan sonra ~0,2 sn atlanır.
+        self.assertLess(self.duration(session.full_path), 19.5)
+        self.assertTrue(os.path.exists(os.path.join(self.directory, "skipped", "rec1.wav.skipped.json")))
+        self.assertAlmostEqual(session.peak_builder.build().duration(), self.duration(session.full_path), delta=0.05)
+
+    def test_auto_pause_mode_keeps_the_audio(self):
+        session, _ = self.record(20, signal="speech", vad_mode="auto_pause")
+        self.assertAlmostEqual(self.duration(session.full_path), 20, delta=3)
+        self.assertFalse(os.path.exists(os.path.join(self.directory, "skipped")))
+
+    def test_single_source_capture_applies_its_gain(self):
+        loud, _ = self.record(4, mic=False, system=True, monitor_device_index=1)
+        quiet, _ = self.record(4, name="rec2.wav", mic=False, system=True, monitor_device_index=1, system_gain=0.25)
+        loud_peak = max(abs(value) for value in loud.peak_builder.build().levels[-1][1])
+        quiet_peak = max(abs(value) for value in quiet.peak_builder.build().levels[-1][1])
+        self.assertAlmostEqual(quiet_peak / loud_peak, 0.25, delta=0.05)
+
+        mic, _ = self.record(4, name="rec3.wav", mic_gain=0.5)
+        mic_peak = max(abs(value) for value in mic.peak_builder.build().levels[-1][1])
+        self.assertAlmostEqual(mic_peak / 127.0, 0.3 * 0.5, delta=0.02)
+
+    def test_devices_are_recorded_to_separate_tracks(self):
+        session, _ = self.record(10, input_device_indices=[0, 3], interleave=True)
+        names = sorted(os.path.basename(path) for path in session.output_paths)
+        self.assertEqual(names, ["rec1-1.wav", "rec1-2.wav", "rec1.wav"])
+        with wave.open(os.path.join(self.directory, "rec1.wav"), 'rb') as wf:
+            self.assertEqual(wf.getnchannels(), 2 * self.channels)
+        for path in session.output_paths:
+            self.assertAlmostEqual(self.duration(path), 10, delta=2)
+
+if __name__ == "__main__":
+    unittest.main()
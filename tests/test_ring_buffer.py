@@ -0,0 +1,83 @@
+"""
+Kayıt hattının halka tamponu (RingBuffer): sarılma, taşma, boşalma ve kapanış davranışı.
+
+    python3 -m unittest discover tests
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                                "echo-voice-recorder-1.0.1", "usr", "share", "echo-voice-recorder"))
+from echo_engine import RingBuffer  # noqa: E402
+
+class RingBufferTest(unittest.TestCase):
+    def test_wraps_around_the_end_of_the_buffer(self):
+        ring_buffer = RingBuffer(10)
+        self.assertTrue(ring_buffer.write(b"abcdef"))
+        self.assertEqual(ring_buffer.read(4), b"abcd")
+        # Yazma konumu 6; sonraki 6 baytın 4'ü sona, 2'si başa yazılır.
+        self.assertTrue(ring_buffer.write(b"ghijkl"))
+        self.assertEqual(ring_buffer.fill_level(), 8)
+        self.assertEqual(ring_buffer.read(100), b"efghijkl")
+        self.assertEqual(ring_buffer.fill_level(), 0)
+
+    def test_overrun_drops_the_whole_chunk_and_keeps_buffered_data(self):
+        ring_buffer = RingBuffer(8)
+        self.assertTrue(ring_buffer.write(b"123456"))
+        self.assertFalse(ring_buffer.write(b"7890"))
+        self.assertEqual(ring_buffer.overruns, 1)
+        self.assertEqual(ring_buffer.dropped_bytes, 4)
+        self.assertEqual(ring_buffer.max_fill, 6)
+        # Tam sığan parça kabul edilir.
+        self.assertTrue(ring_buffer.write(b"78"))
+        self.assertEqual(ring_buffer.read(8), b"12345678")
+        self.assertEqual(ring_buffer.stats()["overruns"], 1)
+
+    def test_read_times_out_on_an_empty_buffer(self):
+        ring_buffer = RingBuffer(8)
+        self.assertIsNone(ring_buffer.read(4, timeout=0.01))
+        self.assertEqual(ring_buffer.underruns, 1)
+
+    def test_close_lets_the_reader_drain_before_ending(self):
+        ring_buffer = RingBuffer(8)
+        ring_buffer.write(b"abc")
+        ring_buffer.close()
+        self.assertEqual(ring_buffer.read(2), b"ab")
+        self.assertEqual(ring_buffer.read(2), b"c")
+        self.assertEqual(ring_buffer.read(2), b"")
+
+    def test_concurrent_writer_loses_only_whole_counted_chunks(self):
+        """Okuyucu geride kalsa da okunan veri sırasını korur; kaybolan her parça taşma olarak sayılır."""
+        chunk_size = 64
+        chunks = [bytes([number % 256]) * chunk_size for number in range(5000)]
+        ring_buffer = RingBuffer(chunk_size * 16)
+        accepted = []
+
+        def produce():
+            for number, chunk in enumerate(chunks):
+                if ring_buffer.write(chunk):
+                    accepted.append(number)
+            ring_buffer.close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        received = bytearray()
+        while True:
+            data = ring_buffer.read(chunk_size * 3 + 7)
+            if data is None:
+                continue
+            if not data:
+                break
+            received += data
+        producer.join()
+
+        self.assertEqual(bytes(received), b"".join(chunks[number] for number in accepted))
+        self.assertEqual(ring_buffer.overruns, len(chunks) - len(accepted))
+        self.assertEqual(ring_buffer.dropped_bytes, ring_buffer.overruns * chunk_size)
+        self.assertLessEqual(ring_buffer.max_fill, ring_buffer.capacity)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+"""
+Çökmeye dayanıklı WAV kaydı: JournaledWavSink, SessionJournal.recover() ve recover_sessions().
+Çökme, ara dosya kapatılmadan ve başlığı son hâline getirilmeden bırakılarak taklit edilir.
+
+    python3 -m unittest discover tests
+"""
+
+import json
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+import wave
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                                "echo-voice-recorder-1.0.1", "usr", "share", "echo-voice-recorder"))
+from echo_engine import (JournaledWavSink, SessionJournal, WAV_HEADER_SIZE, RIFF_SIZE_LIMIT, build_wav_header,  # noqa: E402
+                         probe_audio_header, recover_sessions)
+
+RATE = 8000
+CHANNELS = 1
+SAMPLE_WIDTH = 2
+FRAME_SIZE = CHANNELS * SAMPLE_WIDTH
+
+def pcm(seconds, value=0):
+    """Her örneği kaydın o anki konumunu gösteren sayı olan PCM verisi; sıra bozulursa fark edilir."""
+    frames = int(seconds * RATE)
+    return b"".join(struct.pack('<h', (value + index) % 32768) for index in range(frames))
+
+def dead_pid():
+    """Az önce sonlanmış bir sürecin PID'si."""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+class JournaledWavSinkTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="echo-journal-test-")
+        self.journal_dir = os.path.join(self.directory, "sessions")
+        self.target = os.path.join(self.directory, "rec1.wav")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def record(self, seconds):
+        sink = JournaledWavSink(self.target, CHANNELS, SAMPLE_WIDTH, RATE, self.journal_dir)
+        data = pcm(seconds)
+        for offset in range(0, len(data), 1600):
+            sink.write(data[offset:offset + 1600])
+        return sink, data
+
+    def crash(self, sink, boot_id=None):
+        """Süreç çökmüş gibi ara dosyayı başlığı güncellenmeden bırakır ve günlüğü ölü bir sürece devreder."""
+        sink._file.flush()
+        sink._file.close()
+        journal = SessionJournal.load(sink.journal.journal_path)
+        journal.data["pid"] = dead_pid()
+        if boot_id is not None:
+            journal.data["boot_id"] = boot_id
+        journal.save()
+        return journal
+
+    def read_frames(self, path):
+        with wave.open(path, 'rb') as wf:
+            return wf.readframes(wf.getnframes())
+
+    def test_close_renames_the_partial_file_and_removes_the_journal(self):
+        sink, data = self.record(3)
+        self.assertTrue(os.path.exists(self.target + ".partial"))
+        self.assertFalse(os.path.exists(self.target))
+        sink.close()
+        self.assertEqual(self.read_frames(self.target), data)
+        self.assertEqual(os.listdir(self.journal_dir), [])
+        self.assertFalse(os.path.exists(self.target + ".partial"))
+
+    def test_checkpoint_updates_header_and_journal(self):
+        sink, _ = self.record(5)
+        synced = SessionJournal.load(sink.journal.journal_path).data["synced_size"]
+        self.assertEqual(synced, JournaledWavSink.SYNC_SECONDS * 2 * RATE * FRAME_SIZE)
+        with open(self.target + ".partial", 'rb') as f:
+            header = f.read(WAV_HEADER_SIZE)
+        self.assertEqual(struct.unpack('<I', header[-4:])[0], synced)
+        sink.close()
+
+    def test_recovers_everything_written_after_a_process_crash(self):
+        sink, data = self.record(5)
+        self.crash(sink)
+        self.assertEqual(recover_sessions(self.journal_dir), [self.target])
+        self.assertEqual(self.read_frames(self.target), data)
+        self.assertEqual(os.listdir(self.journal_dir), [])
+        self.assertFalse(os.path.exists(self.target + ".partial"))
+
+    def test_recovers_a_truncated_file_with_a_stale_header_after_a_reboot(self):
+        sink, data = self.record(5)
+        self.crash(sink, boot_id="another-boot")
+        # Elektrik kesintisinde son kısım diske ulaşmamış, son kare de yarım kalmış.
+        kept = 3 * RATE * FRAME_SIZE
+        with open(self.target + ".partial", 'r+b') as f:
+            f.truncate(WAV_HEADER_SIZE + kept + 1)
+        self.assertEqual(recover_sessions(self.journal_dir), [self.target])
+        self.assertEqual(self.read_frames(self.target), data[:kept])
+        self.assertEqual(probe_audio_header(self.target)["duration"], 3.0)
+
+    def test_discards_unsynced_data_after_a_reboot(self):
+        sink, data = self.record(5)
+        journal = self.crash(sink, boot_id="another-boot")
+        synced = journal.data["synced_size"]
+        self.assertLess(synced, len(data))
+        self.assertEqual(recover_sessions(self.journal_dir), [self.target])
+        self.assertEqual(self.read_frames(self.target), data[:synced])
+
+    def test_recovery_does_not_overwrite_an_existing_file(self):
+        sink, data = self.record(1)
+        self.crash(sink)
+        with open(self.target, 'wb') as f:
+            f.write(b"existing")
+        recovered = recover_sessions(self.journal_dir)
+        self.assertEqual(len(recovered), 1)
+        self.assertNotEqual(recovered[0], self.target)
+        self.assertEqual(self.read_frames(recovered[0]), data)
+        with open(self.target, 'rb') as f:
+            self.assertEqual(f.read(), b"existing")
+
+    def test_interrupted_recovery_is_completed(self):
+        sink, data = self.record(1)
+        journal = self.crash(sink)
+        # Önceki kurtarma dosyayı taşıdıktan sonra, günlüğü silemeden kesilmiş.
+        journal.data["recovered_path"] = self.target
+        journal.save()
+        os.replace(self.target + ".partial", self.target)
+        self.assertEqual(recover_sessions(self.journal_dir), [self.target])
+        self.assertEqual(os.listdir(self.journal_dir), [])
+
+    def test_journal_of_a_live_owner_is_left_alone(self):
+        sink, _ = self.record(1)
+        self.assertEqual(recover_sessions(self.journal_dir), [])
+        self.assertTrue(os.path.exists(sink.journal.journal_path))
+        sink.close()
+
+    def test_journal_with_a_reused_pid_is_recovered(self):
+        sink, data = self.record(1)
+        sink._file.flush()
+        sink._file.close()
+        journal = SessionJournal.load(sink.journal.journal_path)
+        # PID bu sürece ait ama başlama zamanı farklı: sahibi ölmüş, PID yeniden kullanılmış.
+        journal.data["start_time"] = (journal.data["start_time"] or 0) + 1
+        journal.save()
+        self.assertFalse(journal.owner_alive())
+        self.assertEqual(recover_sessions(self.journal_dir), [self.target])
+        self.assertEqual(self.read_frames(self.target), data)
+
+class Rf64HeaderTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="echo-rf64-test-")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_header_switches_to_rf64_above_the_riff_limit(self):
+        small = build_wav_header(2, 2, 48000, 1000)
+        self.assertEqual(len(small), WAV_HEADER_SIZE)
+        self.assertEqual(small[:4], b'RIFF')
+        data_size = 5 << 30
+        large = build_wav_header(2, 2, 48000, data_size)
+        self.assertEqual(len(large), WAV_HEADER_SIZE)
+        self.assertEqual(large[:4], b'RF64')
+        self.assertEqual(large[12:16], b'ds64')
+        riff_size, ds64_data_size, sample_count = struct.unpack('<QQQ', large[20:44])
+        self.assertEqual(riff_size, WAV_HEADER_SIZE - 8 + data_size)
+        self.assertEqual(ds64_data_size, data_size)
+        self.assertEqual(sample_count, data_size // 4)
+        self.assertEqual(struct.unpack('<I', large[-4:])[0], RIFF_SIZE_LIMIT)
+
+    def test_recovery_of_a_take_above_4_gib_writes_an_rf64_header(self):
+        """Seyrek bir dosya ile 5 GiB'lık yarım kalmış bir kayıt taklit edilir; disk alanı gerekmez."""
+        journal_dir = os.path.join(self.directory, "sessions")
+        target = os.path.join(self.directory, "rec1.wav")
+        journal = SessionJournal.create(journal_dir, target, 2, 2, 48000)
+        data_size = 5 << 30
+        with open(journal.data["partial"], 'wb') as f:
+            f.write(build_wav_header(2, 2, 48000, 0))
+            f.truncate(WAV_HEADER_SIZE + data_size + 3)
+        journal.data["pid"] = dead_pid()
+        journal.save()
+
+        self.assertEqual(recover_sessions(journal_dir), [target])
+        self.assertEqual(os.path.getsize(target), WAV_HEADER_SIZE + data_size)
+        with open(target, 'rb') as f:
+            self.assertEqual(f.read(4), b'RF64')
+        info = probe_audio_header(target)
+        self.assertEqual(info["channels"], 2)
+        self.assertAlmostEqual(info["duration"], data_size / (48000 * 4), places=3)
+
+class SessionJournalFormatTest(unittest.TestCase):
+    def test_journal_records_owner_and_partial_path(self):
+        directory = tempfile.mkdtemp(prefix="echo-journal-format-")
+        try:
+            journal = SessionJournal.create(directory, "/records/rec1.wav", 1, 2, 8000, recover_path="/records/rec1.wav")
+            with open(journal.journal_path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.assertEqual(data["partial"], "/records/rec1.wav.partial")
+            self.assertEqual(data["pid"], os.getpid())
+            self.assertEqual(data["synced_size"], 0)
+            self.assertTrue(journal.owner_alive())
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    unittest.main()
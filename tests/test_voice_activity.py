@@ -0,0 +1,87 @@
+"""
+Sessizlik algılayıcısı (VoiceActivityGate): pre-roll, hangover, atlanan bölümler ve otomatik duraklatma kipi.
+
+    python3 -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                                "echo-voice-recorder-1.0.1", "usr", "share", "echo-voice-recorder"))
+from echo_engine import VoiceActivityGate, float32_to_pcm  # noqa: E402
+
+RATE = 8000
+SAMPLE_WIDTH = 2
+
+def silence(seconds):
+    return float32_to_pcm(np.zeros(int(seconds * RATE), dtype=np.float32), SAMPLE_WIDTH)
+
+def tone(seconds, amplitude=0.3):
+    t = np.arange(int(seconds * RATE)) / float(RATE)
+    return float32_to_pcm((amplitude * np.sin(2 * np.pi * 440.0 * t)).astype(np.float32), SAMPLE_WIDTH)
+
+def frames(seconds):
+    return int(round(seconds * RATE))
+
+class VoiceActivityGateTest(unittest.TestCase):
+    def setUp(self):
+        self.source = silence(1.0) + tone(0.5) + silence(1.0)
+
+    def test_keeps_pre_roll_and_hangover_around_speech(self):
+        gate = VoiceActivityGate(SAMPLE_WIDTH, 1, RATE)
+        output = gate(self.source)
+        gate.finish()
+
+        pre_roll = frames(VoiceActivityGate.PRE_ROLL_SECONDS)
+        hangover = frames(VoiceActivityGate.HANGOVER_SECONDS)
+        self.assertEqual(len(output) // SAMPLE_WIDTH, pre_roll + frames(0.5) + hangover)
+        # Konuşmadan önceki sessizlik pre-roll kadar, ardından ton olduğu gibi gelir.
+        self.assertEqual(output[:pre_roll * SAMPLE_WIDTH], silence(VoiceActivityGate.PRE_ROLL_SECONDS))
+        self.assertEqual(output[pre_roll * SAMPLE_WIDTH:(pre_roll + frames(0.5)) * SAMPLE_WIDTH], tone(0.5))
+        self.assertTrue(gate.is_silent)
+
+    def test_records_skipped_spans_on_the_source_timeline(self):
+        gate = VoiceActivityGate(SAMPLE_WIDTH, 1, RATE)
+        gate(self.source)
+        gate.finish()
+
+        speech_start = frames(1.0) - frames(VoiceActivityGate.PRE_ROLL_SECONDS)
+        speech_end = frames(1.5) + frames(VoiceActivityGate.HANGOVER_SECONDS)
+        written = frames(2.5) - speech_start - (frames(2.5) - speech_end)
+        self.assertEqual(gate.spans, [(0, speech_start, 0), (speech_end, frames(2.5), written)])
+
+    def test_output_does_not_depend_on_chunk_boundaries(self):
+        whole = VoiceActivityGate(SAMPLE_WIDTH, 1, RATE)
+        expected = whole(self.source)
+        chunked = VoiceActivityGate(SAMPLE_WIDTH, 1, RATE)
+        output = b"".join(chunked(self.source[offset:offset + 1234]) for offset in range(0, len(self.source), 1234))
+        self.assertEqual(output, expected)
+
+    def test_hangover_bridges_short_pauses(self):
+        gate = VoiceActivityGate(SAMPLE_WIDTH, 1, RATE)
+        source = silence(0.5) + tone(0.3) + silence(0.2) + tone(0.3) + silence(1.0)
+        gate(source)
+        gate.finish()
+        # Konuşmanın içindeki 0,2 sn'lik ara atlanmaz; yalnızca baştaki ve sondaki sessizlik atlanır.
+        self.assertEqual(len(gate.spans), 2)
+
+    def test_auto_pause_mode_keeps_every_byte_and_tracks_silence(self):
+        gate = VoiceActivityGate(SAMPLE_WIDTH, 1, RATE, drop=False)
+        self.assertEqual(gate(silence(1.0)), silence(1.0))
+        self.assertTrue(gate.is_silent)
+        self.assertEqual(gate(tone(0.5)), tone(0.5))
+        self.assertFalse(gate.is_silent)
+        # Hangover süresince konuşma sürüyor sayılır, sonra sessizliğe geçilir.
+        gate(silence(VoiceActivityGate.HANGOVER_SECONDS - 0.1))
+        self.assertFalse(gate.is_silent)
+        gate(silence(0.2))
+        self.assertTrue(gate.is_silent)
+        gate.finish()
+        self.assertEqual(gate.spans, [])
+
+if __name__ == "__main__":
+    unittest.main()